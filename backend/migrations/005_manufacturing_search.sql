@@ -0,0 +1,20 @@
+-- Manufacturing search indexes
+-- Production order and product search filter with ILIKE '%term%'. A leading
+-- wildcard cannot use a B-tree index, so add trigram GIN indexes that
+-- PostgreSQL uses for ILIKE automatically (no query changes needed).
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Production orders: order_number / product_name search
+CREATE INDEX IF NOT EXISTS idx_production_orders_order_number_trgm
+    ON production_orders USING GIN (order_number gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_production_orders_product_name_trgm
+    ON production_orders USING GIN (product_name gin_trgm_ops);
+
+-- Products: product_code / name / description search
+CREATE INDEX IF NOT EXISTS idx_products_product_code_trgm
+    ON products USING GIN (product_code gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_products_name_trgm
+    ON products USING GIN (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_products_description_trgm
+    ON products USING GIN (description gin_trgm_ops);
@@ -0,0 +1,14 @@
+-- Manufacturing document numbers
+-- Production order and quality check numbers are assigned by the database
+-- (PO-/QC-YYYYMMDD-00000042) instead of random hex generated in the service.
+
+CREATE SEQUENCE IF NOT EXISTS production_order_number_seq;
+CREATE SEQUENCE IF NOT EXISTS quality_check_number_seq;
+
+ALTER TABLE production_orders
+    ALTER COLUMN order_number SET DEFAULT
+        'PO-' || to_char(now(), 'YYYYMMDD') || '-' || lpad(nextval('production_order_number_seq')::text, 8, '0');
+
+ALTER TABLE quality_checks
+    ALTER COLUMN check_number SET DEFAULT
+        'QC-' || to_char(now(), 'YYYYMMDD') || '-' || lpad(nextval('quality_check_number_seq')::text, 8, '0');
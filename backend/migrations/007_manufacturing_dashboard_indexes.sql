@@ -0,0 +1,19 @@
+-- Manufacturing dashboard / analytics indexes
+-- Match the predicates used by the dashboard and analytics aggregates and the
+-- filtered, created_at-ordered list queries.
+
+-- Status / priority counts (optionally within a created_at window) and
+-- status- or priority-filtered lists ordered by created_at
+CREATE INDEX IF NOT EXISTS idx_po_status_created ON production_orders(status, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_po_priority_created ON production_orders(priority, created_at DESC);
+
+-- Analytics time windows (created_at >= :start); BRIN stays tiny on append-mostly tables
+CREATE INDEX IF NOT EXISTS idx_po_created_brin ON production_orders USING BRIN(created_at);
+
+-- Average completion time only looks at orders with both actual dates
+CREATE INDEX IF NOT EXISTS idx_po_actual_dates ON production_orders(actual_end_date, actual_start_date)
+    WHERE actual_start_date IS NOT NULL AND actual_end_date IS NOT NULL;
+
+-- Quality check status counts, weekly pass rates and status-filtered lists
+CREATE INDEX IF NOT EXISTS idx_qc_status_created ON quality_checks(status, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_qc_created_brin ON quality_checks USING BRIN(created_at);
@@ -0,0 +1,20 @@
+-- Manufacturing cascade deletes
+-- ProductionOrder's child relationships use passive_deletes, so the ORM leaves
+-- deleting operations, quality checks and material requirements to the
+-- database. Recreate their production_order_id foreign keys with ON DELETE
+-- CASCADE on databases created before the models declared it.
+
+ALTER TABLE production_operations
+    DROP CONSTRAINT IF EXISTS production_operations_production_order_id_fkey,
+    ADD CONSTRAINT production_operations_production_order_id_fkey
+        FOREIGN KEY (production_order_id) REFERENCES production_orders(id) ON DELETE CASCADE;
+
+ALTER TABLE quality_checks
+    DROP CONSTRAINT IF EXISTS quality_checks_production_order_id_fkey,
+    ADD CONSTRAINT quality_checks_production_order_id_fkey
+        FOREIGN KEY (production_order_id) REFERENCES production_orders(id) ON DELETE CASCADE;
+
+ALTER TABLE material_requirements
+    DROP CONSTRAINT IF EXISTS material_requirements_production_order_id_fkey,
+    ADD CONSTRAINT material_requirements_production_order_id_fkey
+        FOREIGN KEY (production_order_id) REFERENCES production_orders(id) ON DELETE CASCADE;
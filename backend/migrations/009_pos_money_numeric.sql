@@ -0,0 +1,30 @@
+-- POS money columns as numeric(15, 2)
+-- Amounts were double precision, which cannot hold cents exactly. Convert
+-- them in place on databases created before the models declared Numeric;
+-- existing values are rounded to the cent.
+
+ALTER TABLE pos_cash_drawers
+    ALTER COLUMN opening_amount TYPE numeric(15, 2),
+    ALTER COLUMN closing_amount TYPE numeric(15, 2),
+    ALTER COLUMN expected_amount TYPE numeric(15, 2),
+    ALTER COLUMN difference TYPE numeric(15, 2);
+
+ALTER TABLE pos_sales
+    ALTER COLUMN subtotal TYPE numeric(15, 2),
+    ALTER COLUMN tax_amount TYPE numeric(15, 2),
+    ALTER COLUMN discount_amount TYPE numeric(15, 2),
+    ALTER COLUMN total_amount TYPE numeric(15, 2);
+
+ALTER TABLE pos_sale_items
+    ALTER COLUMN unit_price TYPE numeric(15, 2),
+    ALTER COLUMN total_price TYPE numeric(15, 2),
+    ALTER COLUMN tax_amount TYPE numeric(15, 2),
+    ALTER COLUMN discount_amount TYPE numeric(15, 2);
+
+ALTER TABLE pos_payments
+    ALTER COLUMN amount TYPE numeric(15, 2);
+
+ALTER TABLE pos_discounts
+    ALTER COLUMN discount_value TYPE numeric(15, 2),
+    ALTER COLUMN minimum_amount TYPE numeric(15, 2),
+    ALTER COLUMN maximum_discount TYPE numeric(15, 2);
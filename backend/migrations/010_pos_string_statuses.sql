@@ -0,0 +1,16 @@
+-- POS statuses, payment methods and tax types as plain strings
+-- The models store these as varchar(20) holding the enum values
+-- ('completed', 'credit_card'). Databases created earlier have native enum
+-- columns holding the enum names ('COMPLETED', 'CREDIT_CARD'); every name is
+-- its value upper-cased, so lower() maps one onto the other.
+-- The enum types themselves are left in place: other modules may share them.
+
+ALTER TABLE pos_sales
+    ALTER COLUMN status TYPE varchar(20) USING lower(status::text);
+
+ALTER TABLE pos_payments
+    ALTER COLUMN payment_method TYPE varchar(20) USING lower(payment_method::text),
+    ALTER COLUMN status TYPE varchar(20) USING lower(status::text);
+
+ALTER TABLE pos_tax_rates
+    ALTER COLUMN tax_type TYPE varchar(20) USING lower(tax_type::text);
@@ -0,0 +1,17 @@
+-- pos_sales.total_amount as a stored generated column
+-- The database now maintains total_amount = subtotal + tax_amount -
+-- discount_amount, and inserts no longer send it. On databases created
+-- earlier it is still a plain NOT NULL column, so recreate it as generated.
+-- Its components become NOT NULL (NULLs read as 0) so the total is never NULL.
+
+UPDATE pos_sales SET tax_amount = 0 WHERE tax_amount IS NULL;
+UPDATE pos_sales SET discount_amount = 0 WHERE discount_amount IS NULL;
+
+ALTER TABLE pos_sales
+    ALTER COLUMN tax_amount SET NOT NULL,
+    ALTER COLUMN discount_amount SET NOT NULL,
+    DROP COLUMN total_amount;
+
+ALTER TABLE pos_sales
+    ADD COLUMN total_amount numeric(15, 2) NOT NULL
+        GENERATED ALWAYS AS (subtotal + tax_amount - discount_amount) STORED;
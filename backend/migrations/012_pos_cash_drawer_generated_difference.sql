@@ -0,0 +1,11 @@
+-- pos_cash_drawers.difference as a stored generated column
+-- The database now maintains difference = closing_amount - expected_amount
+-- (NULL until both are recorded). Recreate the plain column on databases
+-- created before the model declared it generated.
+
+ALTER TABLE pos_cash_drawers
+    DROP COLUMN difference;
+
+ALTER TABLE pos_cash_drawers
+    ADD COLUMN difference numeric(15, 2)
+        GENERATED ALWAYS AS (closing_amount - expected_amount) STORED;
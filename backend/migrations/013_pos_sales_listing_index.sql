@@ -0,0 +1,5 @@
+-- POS sale listing index
+-- The sale list pages newest first by (sale_date, id) keyset. Without a
+-- matching index the unfiltered listing sorts the whole table on every page.
+
+CREATE INDEX IF NOT EXISTS ix_pos_sales_date_id ON pos_sales (sale_date, id);
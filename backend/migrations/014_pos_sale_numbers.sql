@@ -0,0 +1,9 @@
+-- POS sale numbers
+-- Sale numbers are assigned by the database (POSYYYYMMDD000042) instead of
+-- being generated in the service; create_sale no longer sends one.
+
+CREATE SEQUENCE IF NOT EXISTS pos_sale_number_seq;
+
+ALTER TABLE pos_sales
+    ALTER COLUMN sale_number SET DEFAULT
+        'POS' || to_char(now(), 'YYYYMMDD') || lpad(nextval('pos_sale_number_seq')::text, 6, '0');
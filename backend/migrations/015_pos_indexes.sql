@@ -0,0 +1,14 @@
+-- POS indexes
+-- Foreign keys and sale columns the POS queries join and filter on.
+-- CONCURRENTLY keeps the tables writable while the indexes build, so run
+-- this file outside a transaction.
+
+-- Cash drawers of a terminal
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pos_cash_drawers_terminal_id ON pos_cash_drawers (terminal_id);
+
+-- Line items and payments of a sale
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pos_sale_items_sale_id ON pos_sale_items (sale_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pos_payments_sale_id ON pos_payments (sale_id);
+
+-- Per-terminal reporting over a sale_date range
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pos_sales_terminal_date ON pos_sales (terminal_id, sale_date);
@@ -0,0 +1,8 @@
+-- POS completed-sales index
+-- Dashboard/analytics totals and status-filtered listings read completed
+-- sales by date, newest first. id keeps keyset pages in index order and
+-- INCLUDE (total_amount) lets the period totals be answered index-only.
+-- CONCURRENTLY cannot run inside a transaction.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pos_sales_status_date
+    ON pos_sales (status, sale_date, id) INCLUDE (total_amount);
@@ -11,6 +11,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 
 # Import CRM module
@@ -74,9 +76,28 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def start_queued_logging() -> QueueListener:
+    """Route root log records through a queue so handler I/O runs on a listener
+    thread instead of blocking the event loop."""
+    root = logging.getLogger()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+
+def stop_queued_logging(listener: QueueListener) -> None:
+    """Flush queued records and hand the original handlers back to the root logger."""
+    listener.stop()
+    logging.getLogger().handlers = list(listener.handlers)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events"""
+    log_listener = start_queued_logging()
     logger.info("Starting FusionAI Enterprise Suite...")
     try:
         # Initialize database if needed
@@ -85,6 +106,7 @@ async def lifespan(app: FastAPI):
         logger.error(f"Initialization failed: {e}")
     yield
     logger.info("Shutting down...")
+    stop_queued_logging(log_listener)
 
 app = FastAPI(
     title="FusionAI Enterprise Suite",
@@ -107,6 +129,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count"],  # pagination totals on list endpoints
 )
 
 # Include routers
@@ -874,6 +897,11 @@ async def get_pos_dashboard():
         }
     }
 
+# Hourly sales mock is fixed; build it once instead of on every request.
+_POS_SALES_BY_HOUR = tuple(
+    {"hour": f"{i:02d}:00", "sales": 50 + i * 5} for i in range(24)
+)
+
 @app.get("/api/v1/pos/analytics")
 async def get_pos_analytics(period_days: int = 30):
     return {
@@ -883,9 +911,7 @@ async def get_pos_analytics(period_days: int = 30):
             "total_revenue": 75000.0,
             "total_transactions": 1350,
             "average_transaction_value": 55.56,
-            "sales_by_hour": [
-                {"hour": f"{i:02d}:00", "sales": 50 + i * 5} for i in range(24)
-            ],
+            "sales_by_hour": _POS_SALES_BY_HOUR,
             "sales_by_day": [
                 {"day": "Monday", "revenue": 10000.0},
                 {"day": "Tuesday", "revenue": 12000.0},
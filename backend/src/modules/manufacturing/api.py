@@ -4,11 +4,13 @@ FastAPI routes for production management, quality control, and inventory operati
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime
 
 from ...core.database import get_async_session
+from ...core.redis import CacheManager, get_redis
 from .service import ManufacturingService
 from .schemas import (
     ProductionOrderCreate, ProductionOrderUpdate, ProductionOrderResponse,
@@ -18,7 +20,22 @@ from .schemas import (
     ManufacturingDashboardMetrics, ManufacturingAnalytics
 )
 
-router = APIRouter(prefix="/manufacturing", tags=["Manufacturing"])
+# Endpoints return ORJSONResponse directly: the service already produces JSON-ready
+# dicts, so FastAPI's response_model validation and jsonable_encoder pass are skipped
+# (response_model is kept for the OpenAPI schema only).
+router = APIRouter(prefix="/manufacturing", tags=["Manufacturing"], default_response_class=ORJSONResponse)
+
+
+# List endpoints return the bare page; the total number of matches goes in a header
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+def _get_cache() -> Optional[CacheManager]:
+    """Cache for dashboard/analytics payloads; None when Redis is not initialized"""
+    try:
+        return CacheManager(get_redis())
+    except RuntimeError:
+        return None
 
 
 @router.get("/dashboard", response_model=dict)
@@ -27,8 +44,8 @@ async def get_manufacturing_dashboard(
 ):
     """Get manufacturing dashboard metrics and statistics"""
     try:
-        service = ManufacturingService(db)
-        return await service.get_dashboard_metrics()
+        service = ManufacturingService(db, _get_cache())
+        return ORJSONResponse(await service.get_dashboard_metrics())
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -43,8 +60,8 @@ async def get_manufacturing_analytics(
 ):
     """Get manufacturing analytics for the specified period"""
     try:
-        service = ManufacturingService(db)
-        return await service.get_manufacturing_analytics(period_days)
+        service = ManufacturingService(db, _get_cache())
+        return ORJSONResponse(await service.get_manufacturing_analytics(period_days))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -66,8 +83,8 @@ async def get_production_orders(
 ):
     """Get paginated production orders with filters"""
     try:
-        service = ManufacturingService(db)
-        orders = await service.get_production_orders(
+        service = ManufacturingService(db, _get_cache())
+        orders, total = await service.get_production_orders(
             page=page,
             limit=limit,
             status=status,
@@ -76,7 +93,7 @@ async def get_production_orders(
             work_center_id=work_center_id,
             search=search
         )
-        return orders
+        return ORJSONResponse(orders, headers={TOTAL_COUNT_HEADER: str(total)})
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -91,13 +108,13 @@ async def create_production_order(
 ):
     """Create a new production order"""
     try:
-        service = ManufacturingService(db)
+        service = ManufacturingService(db, _get_cache())
         order = await service.create_production_order(order_data, 1)  # Default user_id
-        return {
+        return ORJSONResponse({
             "status": "success",
             "message": "Production order created successfully",
             "data": order
-        }
+        })
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -112,7 +129,7 @@ async def get_production_order(
 ):
     """Get production order by ID"""
     try:
-        service = ManufacturingService(db)
+        service = ManufacturingService(db, _get_cache())
         order = await service.get_production_order_by_id(order_id)
         
         if not order:
@@ -121,10 +138,10 @@ async def get_production_order(
                 detail="Production order not found"
             )
         
-        return {
+        return ORJSONResponse({
             "status": "success",
             "data": order
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -142,7 +159,7 @@ async def update_production_order(
 ):
     """Update production order"""
     try:
-        service = ManufacturingService(db)
+        service = ManufacturingService(db, _get_cache())
         order = await service.update_production_order(order_id, order_data, 1)  # Default user_id
         
         if not order:
@@ -151,11 +168,11 @@ async def update_production_order(
                 detail="Production order not found"
             )
         
-        return {
+        return ORJSONResponse({
             "status": "success",
             "message": "Production order updated successfully",
             "data": order
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -172,7 +189,7 @@ async def delete_production_order(
 ):
     """Delete production order"""
     try:
-        service = ManufacturingService(db)
+        service = ManufacturingService(db, _get_cache())
         success = await service.delete_production_order(order_id)
         
         if not success:
@@ -181,10 +198,10 @@ async def delete_production_order(
                 detail="Production order not found"
             )
         
-        return {
+        return ORJSONResponse({
             "status": "success",
             "message": "Production order deleted successfully"
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -207,8 +224,8 @@ async def get_products(
 ):
     """Get paginated products with filters"""
     try:
-        service = ManufacturingService(db)
-        products = await service.get_products(
+        service = ManufacturingService(db, _get_cache())
+        products, total = await service.get_products(
             page=page,
             limit=limit,
             product_type=product_type,
@@ -216,7 +233,7 @@ async def get_products(
             is_active=is_active,
             search=search
         )
-        return products
+        return ORJSONResponse(products, headers={TOTAL_COUNT_HEADER: str(total)})
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -231,14 +248,14 @@ async def create_product(
 ):
     """Create a new product"""
     try:
-        service = ManufacturingService(db)
+        service = ManufacturingService(db, _get_cache())
         product = await service.create_product(product_data, 1)  # Default user_id
         
-        return {
+        return ORJSONResponse({
             "status": "success",
             "message": "Product created successfully",
             "data": product
-        }
+        })
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -258,15 +275,15 @@ async def get_quality_checks(
 ):
     """Get paginated quality checks with filters"""
     try:
-        service = ManufacturingService(db)
-        checks = await service.get_quality_checks(
+        service = ManufacturingService(db, _get_cache())
+        checks, total = await service.get_quality_checks(
             page=page,
             limit=limit,
             status=status,
             check_type=check_type,
             production_order_id=production_order_id
         )
-        return checks
+        return ORJSONResponse(checks, headers={TOTAL_COUNT_HEADER: str(total)})
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -281,14 +298,14 @@ async def create_quality_check(
 ):
     """Create a new quality check"""
     try:
-        service = ManufacturingService(db)
+        service = ManufacturingService(db, _get_cache())
         check = await service.create_quality_check(check_data, 1)  # Default user_id
         
-        return {
+        return ORJSONResponse({
             "status": "success",
             "message": "Quality check created successfully",
             "data": check
-        }
+        })
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -3,7 +3,7 @@ Manufacturing Module Models
 Production management with quality control and supply chain coordination
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, Boolean, Float, ForeignKey, Numeric
+from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, Boolean, Float, ForeignKey, Numeric, Sequence, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -13,6 +13,18 @@ from enum import Enum
 
 Base = declarative_base()
 
+# Server-side document numbers (PO-/QC-YYYYMMDD-00000042): one nextval per insert,
+# unique by construction. Bound to the metadata so create_all creates them first.
+production_order_number_seq = Sequence("production_order_number_seq", metadata=Base.metadata)
+quality_check_number_seq = Sequence("quality_check_number_seq", metadata=Base.metadata)
+
+
+def _document_number_default(prefix: str, sequence: Sequence):
+    return text(
+        f"'{prefix}-' || to_char(now(), 'YYYYMMDD') || '-' || "
+        f"lpad(nextval('{sequence.name}')::text, 8, '0')"
+    )
+
 
 class ProductionStatus(str, Enum):
     """Production status enumeration"""
@@ -55,7 +67,10 @@ class ProductionOrder(Base):
     __tablename__ = "production_orders"
     
     id = Column(Integer, primary_key=True, index=True)
-    order_number = Column(String(50), unique=True, nullable=False)
+    order_number = Column(
+        String(50), unique=True, nullable=False,
+        server_default=_document_number_default("PO", production_order_number_seq)
+    )
     
     # Order details
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
@@ -105,9 +120,10 @@ class ProductionOrder(Base):
     work_center = relationship("WorkCenter")
     routing = relationship("Routing")
     creator = relationship("User", foreign_keys=[created_by])
-    operations = relationship("ProductionOperation", back_populates="production_order", cascade="all, delete-orphan")
-    quality_checks = relationship("QualityCheck", back_populates="production_order", cascade="all, delete-orphan")
-    material_requirements = relationship("MaterialRequirement", back_populates="production_order", cascade="all, delete-orphan")
+    # Children are removed by the database (ON DELETE CASCADE), not loaded and deleted row by row
+    operations = relationship("ProductionOperation", back_populates="production_order", cascade="save-update, merge", passive_deletes="all")
+    quality_checks = relationship("QualityCheck", back_populates="production_order", cascade="save-update, merge", passive_deletes="all")
+    material_requirements = relationship("MaterialRequirement", back_populates="production_order", cascade="save-update, merge", passive_deletes="all")
 
 
 class Product(Base):
@@ -256,7 +272,7 @@ class ProductionOperation(Base):
     __tablename__ = "production_operations"
     
     id = Column(Integer, primary_key=True, index=True)
-    production_order_id = Column(Integer, ForeignKey("production_orders.id"), nullable=False)
+    production_order_id = Column(Integer, ForeignKey("production_orders.id", ondelete="CASCADE"), nullable=False)
     operation_number = Column(String(20), nullable=False)
     
     # Operation details
@@ -383,7 +399,7 @@ class MaterialRequirement(Base):
     __tablename__ = "material_requirements"
     
     id = Column(Integer, primary_key=True, index=True)
-    production_order_id = Column(Integer, ForeignKey("production_orders.id"), nullable=False)
+    production_order_id = Column(Integer, ForeignKey("production_orders.id", ondelete="CASCADE"), nullable=False)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
     
     # Requirement details
@@ -414,10 +430,13 @@ class QualityCheck(Base):
     __tablename__ = "quality_checks"
     
     id = Column(Integer, primary_key=True, index=True)
-    check_number = Column(String(50), unique=True, nullable=False)
+    check_number = Column(
+        String(50), unique=True, nullable=False,
+        server_default=_document_number_default("QC", quality_check_number_seq)
+    )
     
     # Check details
-    production_order_id = Column(Integer, ForeignKey("production_orders.id"), nullable=False)
+    production_order_id = Column(Integer, ForeignKey("production_orders.id", ondelete="CASCADE"), nullable=False)
     operation_id = Column(Integer, ForeignKey("production_operations.id"), nullable=True)
     
     # Check information
@@ -3,69 +3,162 @@ Manufacturing Module Pydantic Schemas
 Data validation and serialization for manufacturing operations
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict, Any, Union
-from datetime import datetime
-from enum import Enum
+import json
 
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, StringConstraints, create_model, model_serializer
+from typing import Annotated, Optional, List, Dict, Any, Literal, TypeVar
+from datetime import date, datetime
 
-class ProductionStatus(str, Enum):
-    """Production status enumeration"""
-    PLANNED = "planned"
-    IN_PROGRESS = "in_progress"
-    ON_HOLD = "on_hold"
-    COMPLETED = "completed"
-    CANCELLED = "cancelled"
 
+# Enumerations (plain string literals, validated by pydantic-core as a value set)
+ProductionStatus = Literal["planned", "in_progress", "on_hold", "completed", "cancelled"]
+QualityStatus = Literal["pending", "in_inspection", "passed", "failed", "needs_rework"]
+OrderPriority = Literal["low", "medium", "high", "urgent", "critical"]
+InventoryType = Literal["raw_material", "work_in_progress", "finished_good", "component", "supply"]
+CheckType = Literal["incoming", "in_process", "final", "random"]
 
-class QualityStatus(str, Enum):
-    """Quality status enumeration"""
-    PENDING = "pending"
-    IN_INSPECTION = "in_inspection"
-    PASSED = "passed"
-    FAILED = "failed"
-    NEEDS_REWORK = "needs_rework"
 
+# Shared by every *Response schema (ORM rows are validated via attribute access).
+# Response DTOs are built once per row and only serialized, so they are frozen.
+_RESPONSE_CONFIG = ConfigDict(from_attributes=True, populate_by_name=True, frozen=True, extra="ignore")
 
-class OrderPriority(str, Enum):
-    """Order priority enumeration"""
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    URGENT = "urgent"
-    CRITICAL = "critical"
 
+# Validation helpers
+def _parse_json_dict(v: Any) -> Any:
+    """Decode JSON-encoded dict fields sent as strings; malformed JSON is rejected.
+
+    An explicit null reads as an empty object, same as omitting the field.
+    """
+    if isinstance(v, str):
+        try:
+            v = json.loads(v)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"invalid JSON: {e.msg}") from None
+    return {} if v is None else v
+
+
+def _parse_stored_json_dict(v: Any) -> Any:
+    """Decode JSON dict values read back from the database.
+
+    Undecodable values become an empty object, so one bad row cannot fail a
+    whole response.
+    """
+    if isinstance(v, str):
+        try:
+            return json.loads(v)
+        except json.JSONDecodeError:
+            return {}
+    return v
+
+
+# Codes are stored and matched exactly as sent, so only their length is bounded
+# (checked natively by pydantic-core, and never rewritten)
+CodeStr = Annotated[str, StringConstraints(min_length=1, max_length=50)]
+
+# Shared constrained types, so each constraint set is declared once
+Name = Annotated[str, Field(min_length=1, max_length=255)]
+ShortCode = Annotated[str, Field(min_length=1, max_length=20)]
+ShortStr = Annotated[str, Field(max_length=20)]
+PosInt = Annotated[int, Field(ge=1)]
+NonNegInt = Annotated[int, Field(ge=0)]
+NonNegFloat = Annotated[float, Field(ge=0)]
+PageLimit = Annotated[int, Field(ge=1, le=100)]
+
+_JsonT = TypeVar("_JsonT")
+
+# Request JSON-column object, accepted either decoded or as a JSON string.
+# Missing or null reads as {} (an empty _JsonObject dumps as {}), so there is no
+# None branch to validate and clients get one shape.
+JsonField = Annotated[_JsonT, BeforeValidator(_parse_json_dict)]
+# Response counterpart: a NULL column stays None and stored values that fail
+# to decode read as {}
+StoredJsonField = Annotated[_JsonT, BeforeValidator(_parse_stored_json_dict)]
+
+
+def as_update(base: type[BaseModel], doc: str, exclude: tuple = (), **extra_fields) -> type[BaseModel]:
+    """Build a partial-update schema from a base schema.
+
+    Every field of ``base`` (minus ``exclude``) becomes optional with a ``None``
+    default while keeping its constraints; ``extra_fields`` are passed through to
+    ``create_model`` for update-only fields.
+    """
+    fields = {}
+    for name, field in base.model_fields.items():
+        if name in exclude:
+            continue
+        annotation = Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation
+        fields[name] = (Optional[annotation], None)
+    fields.update(extra_fields)
+    return create_model(
+        base.__name__.replace("Base", "Update"),
+        __doc__=doc,
+        __module__=__name__,
+        **fields
+    )
+
+
+# Nested JSON payload schemas (extra keys are preserved for backward compatibility)
+_OPEN_CONFIG = ConfigDict(extra="allow")
 
-class InventoryType(str, Enum):
-    """Inventory type enumeration"""
-    RAW_MATERIAL = "raw_material"
-    WORK_IN_PROGRESS = "work_in_progress"
-    FINISHED_GOOD = "finished_good"
-    COMPONENT = "component"
-    SUPPLY = "supply"
 
+class _JsonObject(BaseModel):
+    """JSON-column object: dumps only the keys it was given, so a stored value
+    round-trips unchanged instead of gaining a null for every declared field"""
 
-class CheckType(str, Enum):
-    """Quality check type enumeration"""
-    INCOMING = "incoming"
-    IN_PROCESS = "in_process"
-    FINAL = "final"
-    RANDOM = "random"
+    model_config = _OPEN_CONFIG
+
+    @model_serializer(mode="wrap")
+    def _dump_given_keys(self, handler):
+        data = handler(self)
+        for name in self.model_fields.keys() - self.model_fields_set:
+            data.pop(name, None)
+        return data
+
+
+class Dimensions(_JsonObject):
+    """Product dimensions"""
+    length: Optional[float] = None
+    width: Optional[float] = None
+    height: Optional[float] = None
+    unit: Optional[str] = None
+
+
+class QualityStandards(_JsonObject):
+    """Quality standards for a production order"""
+    tolerance: Optional[float] = None
+    inspection_level: Optional[str] = None
+
+
+class Specifications(_JsonObject):
+    """Free-form technical specifications"""
+
+
+class TestResults(_JsonObject):
+    """Quality check test results"""
+    passed: Optional[bool] = None
+    measurements: Optional[Dict[str, float]] = None
+
+
+class TrendPoint(BaseModel):
+    """Single point of an analytics trend series"""
+    date: date
+
+    model_config = _OPEN_CONFIG
 
 
 # Base schemas
 class ProductionOrderBase(BaseModel):
     """Base production order schema"""
-    product_name: str = Field(..., min_length=1, max_length=255)
-    quantity: int = Field(..., ge=1)
-    priority: OrderPriority = Field(default=OrderPriority.MEDIUM)
+    product_name: Name
+    quantity: PosInt
+    priority: OrderPriority = "medium"
     planned_start_date: Optional[datetime] = None
     planned_end_date: Optional[datetime] = None
     work_center_id: Optional[int] = None
     routing_id: Optional[int] = None
-    quality_standards: Optional[Dict[str, Any]] = None
+    quality_standards: JsonField[QualityStandards] = Field(default_factory=QualityStandards)
     notes: Optional[str] = None
-    specifications: Optional[Dict[str, Any]] = None
+    specifications: JsonField[Specifications] = Field(default_factory=Specifications)
     customer_order_id: Optional[int] = None
 
 
@@ -74,20 +167,14 @@ class ProductionOrderCreate(ProductionOrderBase):
     product_id: int
 
 
-class ProductionOrderUpdate(BaseModel):
-    """Schema for updating a production order"""
-    quantity: Optional[int] = Field(None, ge=1)
-    priority: Optional[OrderPriority] = None
-    status: Optional[ProductionStatus] = None
-    planned_start_date: Optional[datetime] = None
-    planned_end_date: Optional[datetime] = None
-    actual_start_date: Optional[datetime] = None
-    actual_end_date: Optional[datetime] = None
-    work_center_id: Optional[int] = None
-    routing_id: Optional[int] = None
-    quality_standards: Optional[Dict[str, Any]] = None
-    notes: Optional[str] = None
-    specifications: Optional[Dict[str, Any]] = None
+ProductionOrderUpdate = as_update(
+    ProductionOrderBase,
+    "Schema for updating a production order",
+    exclude=("product_name", "customer_order_id"),
+    status=(Optional[ProductionStatus], None),
+    actual_start_date=(Optional[datetime], None),
+    actual_end_date=(Optional[datetime], None),
+)
 
 
 class ProductionOrderResponse(ProductionOrderBase):
@@ -106,23 +193,24 @@ class ProductionOrderResponse(ProductionOrderBase):
     material_cost: Optional[float]
     labor_cost: Optional[float]
     overhead_cost: Optional[float]
+    quality_standards: StoredJsonField[Optional[QualityStandards]] = None
+    specifications: StoredJsonField[Optional[Specifications]] = None
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = _RESPONSE_CONFIG
 
 
 class ProductBase(BaseModel):
     """Base product schema"""
-    name: str = Field(..., min_length=1, max_length=255)
+    name: Name
     description: Optional[str] = None
     product_type: Optional[str] = None
     category: Optional[str] = None
-    unit_of_measure: str = Field(default="pcs", max_length=20)
-    dimensions: Optional[Dict[str, Any]] = None
+    unit_of_measure: ShortStr = "pcs"
+    dimensions: JsonField[Dimensions] = Field(default_factory=Dimensions)
     weight: Optional[float] = None
-    specifications: Optional[Dict[str, Any]] = None
+    specifications: JsonField[Specifications] = Field(default_factory=Specifications)
     standard_cycle_time: Optional[float] = None
     is_make_to_order: bool = Field(default=False)
     is_make_to_stock: bool = Field(default=True)
@@ -133,32 +221,22 @@ class ProductBase(BaseModel):
 
 class ProductCreate(ProductBase):
     """Schema for creating a product"""
-    product_code: str = Field(..., min_length=1, max_length=50)
+    product_code: CodeStr
 
 
-class ProductUpdate(BaseModel):
-    """Schema for updating a product"""
-    name: Optional[str] = Field(None, max_length=255)
-    description: Optional[str] = None
-    product_type: Optional[str] = None
-    category: Optional[str] = None
-    unit_of_measure: Optional[str] = None
-    dimensions: Optional[Dict[str, Any]] = None
-    weight: Optional[float] = None
-    specifications: Optional[Dict[str, Any]] = None
-    standard_cycle_time: Optional[float] = None
-    is_make_to_order: Optional[bool] = None
-    is_make_to_stock: Optional[bool] = None
-    minimum_stock_level: Optional[int] = None
-    maximum_stock_level: Optional[int] = None
-    reorder_point: Optional[int] = None
-    is_active: Optional[bool] = None
+ProductUpdate = as_update(
+    ProductBase,
+    "Schema for updating a product",
+    is_active=(Optional[bool], None),
+)
 
 
 class ProductResponse(ProductBase):
     """Schema for product responses"""
     id: int
     product_code: str
+    dimensions: StoredJsonField[Optional[Dimensions]] = None
+    specifications: StoredJsonField[Optional[Specifications]] = None
     standard_cost: Optional[float]
     material_cost: Optional[float]
     labor_cost: Optional[float]
@@ -167,13 +245,12 @@ class ProductResponse(ProductBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = _RESPONSE_CONFIG
 
 
 class WorkCenterBase(BaseModel):
     """Base work center schema"""
-    name: str = Field(..., min_length=1, max_length=255)
+    name: Name
     description: Optional[str] = None
     work_center_type: Optional[str] = None
     capacity: Optional[int] = None
@@ -186,22 +263,15 @@ class WorkCenterBase(BaseModel):
 
 class WorkCenterCreate(WorkCenterBase):
     """Schema for creating a work center"""
-    code: str = Field(..., min_length=1, max_length=20)
+    code: ShortCode
 
 
-class WorkCenterUpdate(BaseModel):
-    """Schema for updating a work center"""
-    name: Optional[str] = Field(None, max_length=255)
-    description: Optional[str] = None
-    work_center_type: Optional[str] = None
-    capacity: Optional[int] = None
-    efficiency: Optional[float] = None
-    location: Optional[str] = None
-    setup_time: Optional[float] = None
-    hourly_rate: Optional[float] = None
-    overhead_rate: Optional[float] = None
-    is_active: Optional[bool] = None
-    is_available: Optional[bool] = None
+WorkCenterUpdate = as_update(
+    WorkCenterBase,
+    "Schema for updating a work center",
+    is_active=(Optional[bool], None),
+    is_available=(Optional[bool], None),
+)
 
 
 class WorkCenterResponse(WorkCenterBase):
@@ -213,20 +283,19 @@ class WorkCenterResponse(WorkCenterBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = _RESPONSE_CONFIG
 
 
 class RoutingBase(BaseModel):
     """Base routing schema"""
-    name: str = Field(..., min_length=1, max_length=255)
+    name: Name
     description: Optional[str] = None
-    version: str = Field(default="1.0", max_length=20)
+    version: ShortStr = "1.0"
 
 
 class RoutingCreate(RoutingBase):
     """Schema for creating a routing"""
-    routing_number: str = Field(..., min_length=1, max_length=50)
+    routing_number: CodeStr
     product_id: Optional[int] = None
 
 
@@ -239,14 +308,13 @@ class RoutingResponse(RoutingBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = _RESPONSE_CONFIG
 
 
 class RoutingOperationBase(BaseModel):
     """Base routing operation schema"""
-    operation_number: str = Field(..., min_length=1, max_length=20)
-    operation_name: str = Field(..., min_length=1, max_length=255)
+    operation_number: ShortCode
+    operation_name: Name
     description: Optional[str] = None
     work_center_id: int
     setup_time: Optional[float] = None
@@ -268,20 +336,19 @@ class RoutingOperationResponse(RoutingOperationBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = _RESPONSE_CONFIG
 
 
 class BOMBase(BaseModel):
     """Base BOM schema"""
-    name: str = Field(..., min_length=1, max_length=255)
+    name: Name
     description: Optional[str] = None
-    version: str = Field(default="1.0", max_length=20)
+    version: ShortStr = "1.0"
 
 
 class BOMCreate(BOMBase):
     """Schema for creating a BOM"""
-    bom_number: str = Field(..., min_length=1, max_length=50)
+    bom_number: CodeStr
     product_id: int
 
 
@@ -294,14 +361,13 @@ class BOMResponse(BOMBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = _RESPONSE_CONFIG
 
 
 class BOMItemBase(BaseModel):
     """Base BOM item schema"""
-    quantity: float = Field(..., ge=0)
-    unit_of_measure: str = Field(default="pcs", max_length=20)
+    quantity: NonNegFloat
+    unit_of_measure: ShortStr = "pcs"
     notes: Optional[str] = None
     is_optional: bool = Field(default=False)
 
@@ -320,19 +386,18 @@ class BOMItemResponse(BOMItemBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = _RESPONSE_CONFIG
 
 
 class InventoryItemBase(BaseModel):
     """Base inventory item schema"""
-    item_type: InventoryType = Field(default=InventoryType.RAW_MATERIAL)
+    item_type: InventoryType = "raw_material"
     location: Optional[str] = None
     batch_number: Optional[str] = None
     serial_number: Optional[str] = None
-    quantity_on_hand: float = Field(default=0, ge=0)
-    quantity_reserved: float = Field(default=0, ge=0)
-    quantity_available: float = Field(default=0, ge=0)
+    quantity_on_hand: NonNegFloat = 0
+    quantity_reserved: NonNegFloat = 0
+    quantity_available: NonNegFloat = 0
     unit_cost: Optional[float] = None
     total_cost: Optional[float] = None
 
@@ -342,17 +407,12 @@ class InventoryItemCreate(InventoryItemBase):
     product_id: int
 
 
-class InventoryItemUpdate(BaseModel):
-    """Schema for updating an inventory item"""
-    item_type: Optional[InventoryType] = None
-    location: Optional[str] = None
-    batch_number: Optional[str] = None
-    serial_number: Optional[str] = None
-    quantity_on_hand: Optional[float] = Field(None, ge=0)
-    quantity_reserved: Optional[float] = Field(None, ge=0)
-    unit_cost: Optional[float] = None
-    total_cost: Optional[float] = None
-    is_active: Optional[bool] = None
+InventoryItemUpdate = as_update(
+    InventoryItemBase,
+    "Schema for updating an inventory item",
+    exclude=("quantity_available",),
+    is_active=(Optional[bool], None),
+)
 
 
 class InventoryItemResponse(InventoryItemBase):
@@ -364,15 +424,14 @@ class InventoryItemResponse(InventoryItemBase):
     updated_at: Optional[datetime]
     last_counted: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = _RESPONSE_CONFIG
 
 
 class QualityCheckBase(BaseModel):
     """Base quality check schema"""
     check_type: CheckType
-    quantity_checked: int = Field(..., ge=1)
-    specifications: Optional[Dict[str, Any]] = None
+    quantity_checked: PosInt
+    specifications: JsonField[Specifications] = Field(default_factory=Specifications)
     notes: Optional[str] = None
 
 
@@ -385,9 +444,9 @@ class QualityCheckCreate(QualityCheckBase):
 class QualityCheckUpdate(BaseModel):
     """Schema for updating a quality check"""
     status: Optional[QualityStatus] = None
-    quantity_passed: Optional[int] = Field(None, ge=0)
-    quantity_failed: Optional[int] = Field(None, ge=0)
-    test_results: Optional[Dict[str, Any]] = None
+    quantity_passed: Optional[NonNegInt] = None
+    quantity_failed: Optional[NonNegInt] = None
+    test_results: Optional[JsonField[TestResults]] = None
     notes: Optional[str] = None
     corrective_actions: Optional[str] = None
     completed_at: Optional[datetime] = None
@@ -403,20 +462,20 @@ class QualityCheckResponse(QualityCheckBase):
     status: str
     quantity_passed: int
     quantity_failed: int
-    test_results: Optional[Dict[str, Any]]
+    specifications: StoredJsonField[Optional[Specifications]] = None
+    test_results: StoredJsonField[Optional[TestResults]] = None
     corrective_actions: Optional[str]
     created_at: datetime
     updated_at: Optional[datetime]
     completed_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = _RESPONSE_CONFIG
 
 
 class MaterialRequirementBase(BaseModel):
     """Base material requirement schema"""
-    required_quantity: float = Field(..., ge=0)
-    unit_of_measure: str = Field(default="pcs", max_length=20)
+    required_quantity: NonNegFloat
+    unit_of_measure: ShortStr = "pcs"
     required_date: Optional[datetime] = None
 
 
@@ -439,8 +498,7 @@ class MaterialRequirementResponse(MaterialRequirementBase):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = _RESPONSE_CONFIG
 
 
 # Search and filter schemas
@@ -455,8 +513,8 @@ class ProductionOrderSearch(BaseModel):
     created_before: Optional[datetime] = None
     planned_start_after: Optional[datetime] = None
     planned_start_before: Optional[datetime] = None
-    limit: int = Field(default=50, ge=1, le=100)
-    offset: int = Field(default=0, ge=0)
+    limit: PageLimit = 50
+    offset: NonNegInt = 0
 
 
 class ProductionOrderSearchResponse(BaseModel):
@@ -476,8 +534,8 @@ class ProductSearch(BaseModel):
     is_active: Optional[bool] = None
     is_make_to_order: Optional[bool] = None
     is_make_to_stock: Optional[bool] = None
-    limit: int = Field(default=50, ge=1, le=100)
-    offset: int = Field(default=0, ge=0)
+    limit: PageLimit = 50
+    offset: NonNegInt = 0
 
 
 # Statistics and analytics schemas
@@ -502,7 +560,7 @@ class QualityStatistics(BaseModel):
     failed_checks: int
     pass_rate: float
     checks_by_type: Dict[str, int]
-    quality_trends: List[Dict[str, Any]]
+    quality_trends: List[TrendPoint]
 
 
 class InventoryStatistics(BaseModel):
@@ -523,63 +581,18 @@ class ManufacturingDashboardMetrics(BaseModel):
     recent_orders: List[ProductionOrderResponse]
     top_products: List[Dict[str, Any]]
     production_efficiency: Dict[str, Any]
-    quality_trends: List[Dict[str, Any]]
+    quality_trends: List[TrendPoint]
 
 
 class ManufacturingAnalytics(BaseModel):
     """Schema for manufacturing analytics"""
     period_days: int
-    production_volume_trends: List[Dict[str, Any]]
-    efficiency_trends: List[Dict[str, Any]]
-    quality_trends: List[Dict[str, Any]]
-    cost_trends: List[Dict[str, Any]]
+    production_volume_trends: List[TrendPoint]
+    efficiency_trends: List[TrendPoint]
+    quality_trends: List[TrendPoint]
+    cost_trends: List[TrendPoint]
     order_status_distribution: Dict[str, int]
     priority_distribution: Dict[str, int]
     work_center_performance: List[Dict[str, Any]]
     product_performance: List[Dict[str, Any]]
 
-
-# Validation helpers
-@validator('dimensions', pre=True)
-def validate_dimensions(cls, v):
-    """Validate and clean dimensions"""
-    if v is None:
-        return None
-    if isinstance(v, str):
-        try:
-            import json
-            return json.loads(v)
-        except json.JSONDecodeError:
-            return None
-    return v
-
-
-@validator('specifications', pre=True)
-def validate_specifications(cls, v):
-    """Validate and clean specifications"""
-    if v is None:
-        return None
-    if isinstance(v, str):
-        try:
-            import json
-            return json.loads(v)
-        except json.JSONDecodeError:
-            return None
-    return v
-
-
-@validator('quality_standards', pre=True)
-def validate_quality_standards(cls, v):
-    """Validate and clean quality standards"""
-    if v is None:
-        return None
-    if isinstance(v, str):
-        try:
-            import json
-            return json.loads(v)
-        except json.JSONDecodeError:
-            return None
-    return v
-
-
-
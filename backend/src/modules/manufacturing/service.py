@@ -3,12 +3,14 @@ Manufacturing Module Service
 Business logic for production management, quality control, and inventory operations
 """
 
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, desc, or_
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
-import uuid
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import select, insert, update, delete, func, and_, case, desc, or_, lambda_stmt
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+import asyncio
+import logging
 
+from ...core.redis import CacheManager
 from .models import (
     ProductionOrder, Product, WorkCenter, Routing, RoutingOperation,
     ProductionOperation, BillOfMaterial, BOMItem, InventoryItem,
@@ -24,121 +26,144 @@ from .schemas import (
 )
 
 
+DASHBOARD_CACHE_KEY = "manufacturing:dashboard:v1"
+ANALYTICS_CACHE_KEY = "manufacturing:analytics:{generation}:{period_days}"
+# Embedded in every analytics key and bumped on writes, so one INCR retires the
+# cached payloads of every period without scanning the keyspace
+ANALYTICS_GENERATION_KEY = "manufacturing:analytics:generation"
+CACHE_TTL_SECONDS = 60
+# Cached payloads closer than this to expiry are rebuilt in the background
+CACHE_EARLY_REFRESH_SECONDS = 10
+
+# In-flight recomputes keyed by cache key, shared by every service instance so
+# concurrent requests that miss the cache wait on one rebuild (single-flight)
+_inflight: Dict[str, "asyncio.Task[Dict]"] = {}
+
+logger = logging.getLogger(__name__)
+
+# Columns projected by the list queries (and serialized, in this order). Selecting
+# them directly skips ORM instance hydration on the hot list paths.
+PRODUCTION_ORDER_COLUMNS = (
+    ProductionOrder.id, ProductionOrder.order_number, ProductionOrder.product_id,
+    ProductionOrder.product_name, ProductionOrder.quantity, ProductionOrder.priority,
+    ProductionOrder.status, ProductionOrder.planned_start_date, ProductionOrder.planned_end_date,
+    ProductionOrder.actual_start_date, ProductionOrder.actual_end_date,
+    ProductionOrder.work_center_id, ProductionOrder.routing_id,
+    ProductionOrder.completion_percentage, ProductionOrder.units_completed,
+    ProductionOrder.units_scrapped, ProductionOrder.estimated_cost, ProductionOrder.actual_cost,
+    ProductionOrder.material_cost, ProductionOrder.labor_cost, ProductionOrder.overhead_cost,
+    ProductionOrder.quality_standards, ProductionOrder.notes, ProductionOrder.specifications,
+    ProductionOrder.customer_order_id, ProductionOrder.created_at, ProductionOrder.updated_at,
+)
+PRODUCT_COLUMNS = (
+    Product.id, Product.product_code, Product.name, Product.description, Product.product_type,
+    Product.category, Product.unit_of_measure, Product.dimensions, Product.weight,
+    Product.specifications, Product.standard_cycle_time, Product.is_make_to_order,
+    Product.is_make_to_stock, Product.minimum_stock_level, Product.maximum_stock_level,
+    Product.reorder_point, Product.standard_cost, Product.material_cost, Product.labor_cost,
+    Product.overhead_cost, Product.is_active, Product.created_at, Product.updated_at,
+)
+QUALITY_CHECK_COLUMNS = (
+    QualityCheck.id, QualityCheck.check_number, QualityCheck.production_order_id,
+    QualityCheck.operation_id, QualityCheck.check_type, QualityCheck.inspector_id,
+    QualityCheck.status, QualityCheck.quantity_checked, QualityCheck.quantity_passed,
+    QualityCheck.quantity_failed, QualityCheck.specifications, QualityCheck.test_results,
+    QualityCheck.notes, QualityCheck.corrective_actions, QualityCheck.created_at,
+    QualityCheck.updated_at, QualityCheck.completed_at,
+)
+
+# Numeric/Float columns serialized as floats (None and 0 become None). Datetimes are
+# left as-is: ORJSONResponse encodes them to ISO 8601 natively.
+_PRODUCTION_ORDER_DECIMAL_FIELDS = (
+    "estimated_cost", "actual_cost", "material_cost", "labor_cost", "overhead_cost",
+)
+_PRODUCT_DECIMAL_FIELDS = (
+    "weight", "standard_cycle_time", "standard_cost", "material_cost", "labor_cost", "overhead_cost",
+)
+
+# Enum values in declaration order, resolved once for the distribution dicts
+_STATUS_VALUES = tuple(status.value for status in ProductionStatus)
+_PRIORITY_VALUES = tuple(priority.value for priority in OrderPriority)
+
+# Total rows matching the list filters, computed alongside the page in one query
+TOTAL_COUNT = func.count().over().label("total_count")
+
+
 class ManufacturingService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, cache: Optional[CacheManager] = None):
         self.db = db
+        self.cache = cache
 
     async def get_dashboard_metrics(self) -> Dict:
         """Get manufacturing dashboard metrics"""
+        return await self._get_or_compute(DASHBOARD_CACHE_KEY, self._compute_dashboard_metrics)
+
+    async def _compute_dashboard_metrics(self) -> Dict:
+        timestamp = datetime.utcnow().isoformat()
         try:
-            # Get basic production order counts
-            total_orders_result = await self.db.execute(select(func.count(ProductionOrder.id)))
-            total_orders = total_orders_result.scalar() or 0
-            
-            active_orders_result = await self.db.execute(
-                select(func.count(ProductionOrder.id))
-                .where(ProductionOrder.status == ProductionStatus.IN_PROGRESS.value)
+            # The aggregates are independent, so run them concurrently
+            (
+                order_status_rows,
+                order_priority_rows,
+                order_totals_rows,
+                check_status_rows,
+                inventory_rows,
+                recent_orders_rows,
+            ) = await self._execute_concurrently(
+                # Production order counts by status and priority (one GROUP BY each)
+                self._count_by_query(ProductionOrder.status),
+                self._count_by_query(ProductionOrder.priority),
+                # Average completion time and total production value in one scan;
+                # AVG/SUM already skip orders without both dates / a cost
+                select(
+                    func.avg(
+                        func.extract('epoch', ProductionOrder.actual_end_date - ProductionOrder.actual_start_date) / 3600
+                    ),
+                    func.sum(ProductionOrder.actual_cost)
+                ),
+                # Quality check counts by status
+                self._count_by_query(QualityCheck.status),
+                # Inventory item count and value
+                select(func.count(InventoryItem.id), func.sum(InventoryItem.total_cost)),
+                # Recent orders
+                select(*PRODUCTION_ORDER_COLUMNS)
+                .order_by(desc(ProductionOrder.created_at))
+                .limit(5),
             )
-            active_orders = active_orders_result.scalar() or 0
             
-            completed_orders_result = await self.db.execute(
-                select(func.count(ProductionOrder.id))
-                .where(ProductionOrder.status == ProductionStatus.COMPLETED.value)
-            )
-            completed_orders = completed_orders_result.scalar() or 0
+            order_status_counts = dict(order_status_rows)
+            order_priority_counts = dict(order_priority_rows)
             
-            on_hold_orders_result = await self.db.execute(
-                select(func.count(ProductionOrder.id))
-                .where(ProductionOrder.status == ProductionStatus.ON_HOLD.value)
-            )
-            on_hold_orders = on_hold_orders_result.scalar() or 0
-            
-            cancelled_orders_result = await self.db.execute(
-                select(func.count(ProductionOrder.id))
-                .where(ProductionOrder.status == ProductionStatus.CANCELLED.value)
-            )
-            cancelled_orders = cancelled_orders_result.scalar() or 0
-            
-            # Calculate average completion time
-            avg_completion_result = await self.db.execute(
-                select(func.avg(
-                    func.extract('epoch', ProductionOrder.actual_end_date - ProductionOrder.actual_start_date) / 3600
-                ))
-                .where(
-                    and_(
-                        ProductionOrder.actual_end_date.isnot(None),
-                        ProductionOrder.actual_start_date.isnot(None)
-                    )
-                )
-            )
-            avg_completion_time = avg_completion_result.scalar() or 0.0
+            total_orders = sum(order_status_counts.values())
+            active_orders = order_status_counts.get(ProductionStatus.IN_PROGRESS.value, 0)
+            completed_orders = order_status_counts.get(ProductionStatus.COMPLETED.value, 0)
+            on_hold_orders = order_status_counts.get(ProductionStatus.ON_HOLD.value, 0)
+            cancelled_orders = order_status_counts.get(ProductionStatus.CANCELLED.value, 0)
             
-            # Calculate total production value
-            total_value_result = await self.db.execute(
-                select(func.sum(ProductionOrder.actual_cost))
-                .where(ProductionOrder.actual_cost.isnot(None))
-            )
-            total_production_value = total_value_result.scalar() or 0.0
+            avg_completion_time, total_production_value = order_totals_rows[0]
+            avg_completion_time = avg_completion_time or 0.0
+            total_production_value = total_production_value or 0.0
             
             # Get orders by status
-            status_counts = {}
-            for status in ProductionStatus:
-                count_result = await self.db.execute(
-                    select(func.count(ProductionOrder.id))
-                    .where(ProductionOrder.status == status.value)
-                )
-                count = count_result.scalar() or 0
-                if count > 0:
-                    status_counts[status.value] = count
+            status_counts = self._nonzero_counts(order_status_counts, _STATUS_VALUES)
             
             # Get orders by priority
-            priority_counts = {}
-            for priority in OrderPriority:
-                count_result = await self.db.execute(
-                    select(func.count(ProductionOrder.id))
-                    .where(ProductionOrder.priority == priority.value)
-                )
-                count = count_result.scalar() or 0
-                if count > 0:
-                    priority_counts[priority.value] = count
+            priority_counts = self._nonzero_counts(order_priority_counts, _PRIORITY_VALUES)
             
             # Get quality statistics
-            total_checks_result = await self.db.execute(select(func.count(QualityCheck.id)))
-            total_checks = total_checks_result.scalar() or 0
-            
-            passed_checks_result = await self.db.execute(
-                select(func.count(QualityCheck.id))
-                .where(QualityCheck.status == QualityStatus.PASSED.value)
-            )
-            passed_checks = passed_checks_result.scalar() or 0
-            
-            failed_checks_result = await self.db.execute(
-                select(func.count(QualityCheck.id))
-                .where(QualityCheck.status == QualityStatus.FAILED.value)
-            )
-            failed_checks = failed_checks_result.scalar() or 0
+            check_status_counts = dict(check_status_rows)
+            total_checks = sum(check_status_counts.values())
+            passed_checks = check_status_counts.get(QualityStatus.PASSED.value, 0)
+            failed_checks = check_status_counts.get(QualityStatus.FAILED.value, 0)
             
             pass_rate = (passed_checks / total_checks * 100) if total_checks > 0 else 0.0
             
             # Get inventory statistics
-            total_items_result = await self.db.execute(select(func.count(InventoryItem.id)))
-            total_items = total_items_result.scalar() or 0
-            
-            total_inventory_value_result = await self.db.execute(
-                select(func.sum(InventoryItem.total_cost))
-                .where(InventoryItem.total_cost.isnot(None))
-            )
-            total_inventory_value = total_inventory_value_result.scalar() or 0.0
-            
-            # Recent orders
-            recent_orders_result = await self.db.execute(
-                select(ProductionOrder)
-                .order_by(desc(ProductionOrder.created_at))
-                .limit(5)
-            )
-            recent_orders = recent_orders_result.scalars().all()
+            total_items, total_inventory_value = inventory_rows[0]
+            total_items = total_items or 0
+            total_inventory_value = total_inventory_value or 0.0
             
-            return {
+            metrics = {
                 "status": "success",
                 "data": {
                     "production_statistics": {
@@ -147,7 +172,7 @@ class ManufacturingService:
                         "completed_orders": completed_orders,
                         "on_hold_orders": on_hold_orders,
                         "cancelled_orders": cancelled_orders,
-                        "average_completion_time": round(avg_completion_time, 2),
+                        "average_completion_time": round(float(avg_completion_time), 2),
                         "total_production_value": float(total_production_value)
                     },
                     "quality_statistics": {
@@ -162,12 +187,17 @@ class ManufacturingService:
                     },
                     "orders_by_status": status_counts,
                     "orders_by_priority": priority_counts,
-                    "recent_orders": [self._serialize_production_order(order) for order in recent_orders],
-                    "timestamp": datetime.utcnow().isoformat()
+                    "recent_orders": [
+                        self._json_ready(self._serialize_production_order(row._mapping))
+                        for row in recent_orders_rows
+                    ],
+                    "timestamp": timestamp
                 }
             }
+            await self._set_cached(DASHBOARD_CACHE_KEY, metrics)
+            return metrics
         except Exception as e:
-            print(f"Error getting manufacturing dashboard metrics: {e}")
+            logger.exception("Error getting manufacturing dashboard metrics")
             return {
                 "status": "error",
                 "message": str(e),
@@ -194,135 +224,108 @@ class ManufacturingService:
                     "orders_by_status": {},
                     "orders_by_priority": {},
                     "recent_orders": [],
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": timestamp
                 }
             }
 
     async def get_manufacturing_analytics(self, period_days: int = 30) -> Dict:
         """Get manufacturing analytics for the specified period"""
+        cache_key = ANALYTICS_CACHE_KEY.format(
+            generation=await self._analytics_generation(), period_days=period_days
+        )
+        return await self._get_or_compute(
+            cache_key, lambda: self._compute_manufacturing_analytics(period_days, cache_key)
+        )
+
+    async def _compute_manufacturing_analytics(self, period_days: int, cache_key: str) -> Dict:
+        now = datetime.utcnow()
+        timestamp = now.isoformat()
         try:
-            start_date = datetime.utcnow() - timedelta(days=period_days)
-            
-            # Production volume trends
-            volume_trends = []
-            for i in range(period_days):
-                day_start = start_date + timedelta(days=i)
-                day_end = day_start + timedelta(days=1)
-                
-                day_orders_result = await self.db.execute(
-                    select(func.count(ProductionOrder.id))
-                    .where(
-                        and_(
-                            ProductionOrder.created_at >= day_start,
-                            ProductionOrder.created_at < day_end
-                        )
-                    )
+            start_date = now - timedelta(days=period_days)
+            
+            # Bucket rows into day/week windows in SQL instead of one query per window
+            day_bucket = self._window_index(ProductionOrder.created_at, start_date, 1)
+            order_week_bucket = self._window_index(ProductionOrder.created_at, start_date, 7)
+            check_week_bucket = self._window_index(QualityCheck.created_at, start_date, 7)
+            
+            (
+                volume_rows,
+                efficiency_rows,
+                quality_rows,
+                status_rows,
+                priority_rows,
+            ) = await self._execute_concurrently(
+                select(day_bucket, func.count(ProductionOrder.id))
+                .where(ProductionOrder.created_at >= start_date)
+                .group_by(day_bucket),
+                select(order_week_bucket, func.avg(ProductionOrder.completion_percentage))
+                .where(ProductionOrder.created_at >= start_date)
+                .group_by(order_week_bucket),
+                select(
+                    check_week_bucket,
+                    func.count(QualityCheck.id),
+                    func.sum(case((QualityCheck.status == QualityStatus.PASSED.value, 1), else_=0))
                 )
-                day_orders = day_orders_result.scalar() or 0
-                
-                volume_trends.append({
-                    "date": day_start.date().isoformat(),
-                    "orders": day_orders
-                })
+                .where(QualityCheck.created_at >= start_date)
+                .group_by(check_week_bucket),
+                self._count_by_query(ProductionOrder.status, ProductionOrder.created_at >= start_date),
+                self._count_by_query(ProductionOrder.priority, ProductionOrder.created_at >= start_date),
+            )
             
-            # Efficiency trends
-            efficiency_trends = []
-            for i in range(0, period_days, 7):  # Weekly intervals
-                week_start = start_date + timedelta(days=i)
-                week_end = week_start + timedelta(days=7)
-                
-                week_efficiency_result = await self.db.execute(
-                    select(func.avg(ProductionOrder.completion_percentage))
-                    .where(
-                        and_(
-                            ProductionOrder.created_at >= week_start,
-                            ProductionOrder.created_at < week_end
-                        )
-                    )
-                )
-                week_efficiency = week_efficiency_result.scalar() or 0.0
-                
-                efficiency_trends.append({
-                    "date": week_start.date().isoformat(),
-                    "efficiency_percentage": round(week_efficiency, 2)
-                })
+            # Window start dates, formatted once and shared by the trend series
+            start_day = start_date.date()
+            window_dates = [(start_day + timedelta(days=i)).isoformat() for i in range(period_days)]
+            
+            # Production volume trends
+            day_orders = {int(bucket): count for bucket, count in volume_rows}
+            volume_trends = [
+                {
+                    "date": window_dates[i],
+                    "orders": day_orders.get(i, 0)
+                }
+                for i in range(period_days)
+            ]
+            
+            # Efficiency trends (weekly intervals)
+            week_efficiency = {int(bucket): avg for bucket, avg in efficiency_rows}
+            efficiency_trends = [
+                {
+                    "date": window_dates[i],
+                    "efficiency_percentage": round(float(week_efficiency.get(i // 7) or 0.0), 2)
+                }
+                for i in range(0, period_days, 7)
+            ]
             
-            # Quality trends
+            # Quality trends (weekly intervals)
+            week_quality = {int(bucket): (total, passed) for bucket, total, passed in quality_rows}
             quality_trends = []
-            for i in range(0, period_days, 7):  # Weekly intervals
-                week_start = start_date + timedelta(days=i)
-                week_end = week_start + timedelta(days=7)
-                
-                week_quality_result = await self.db.execute(
-                    select(
-                        func.count(QualityCheck.id).label('total'),
-                        func.sum(
-                            func.case(
-                                (QualityCheck.status == QualityStatus.PASSED.value, 1),
-                                else_=0
-                            )
-                        ).label('passed')
-                    )
-                    .where(
-                        and_(
-                            QualityCheck.created_at >= week_start,
-                            QualityCheck.created_at < week_end
-                        )
-                    )
-                )
-                week_quality = week_quality_result.first()
-                total_checks = week_quality.total or 0
-                passed_checks = week_quality.passed or 0
-                pass_rate = (passed_checks / total_checks * 100) if total_checks > 0 else 0.0
-                
+            for i in range(0, period_days, 7):
+                total_checks, passed_checks = week_quality.get(i // 7, (0, 0))
+                pass_rate = (passed_checks / total_checks * 100) if total_checks else 0.0
                 quality_trends.append({
-                    "date": week_start.date().isoformat(),
+                    "date": window_dates[i],
                     "pass_rate": round(pass_rate, 2)
                 })
             
             # Order status distribution
-            status_distribution = {}
-            for status in ProductionStatus:
-                count_result = await self.db.execute(
-                    select(func.count(ProductionOrder.id))
-                    .where(
-                        and_(
-                            ProductionOrder.status == status.value,
-                            ProductionOrder.created_at >= start_date
-                        )
-                    )
-                )
-                count = count_result.scalar() or 0
-                if count > 0:
-                    status_distribution[status.value] = count
+            status_distribution = self._nonzero_counts(dict(status_rows), _STATUS_VALUES)
             
             # Priority distribution
-            priority_distribution = {}
-            for priority in OrderPriority:
-                count_result = await self.db.execute(
-                    select(func.count(ProductionOrder.id))
-                    .where(
-                        and_(
-                            ProductionOrder.priority == priority.value,
-                            ProductionOrder.created_at >= start_date
-                        )
-                    )
-                )
-                count = count_result.scalar() or 0
-                if count > 0:
-                    priority_distribution[priority.value] = count
+            priority_distribution = self._nonzero_counts(dict(priority_rows), _PRIORITY_VALUES)
             
-            return {
+            analytics = {
                 "period_days": period_days,
                 "production_volume_trends": volume_trends,
                 "efficiency_trends": efficiency_trends,
                 "quality_trends": quality_trends,
                 "order_status_distribution": status_distribution,
                 "priority_distribution": priority_distribution,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": timestamp
             }
-        except Exception as e:
-            print(f"Error getting manufacturing analytics: {e}")
+            await self._set_cached(cache_key, analytics)
+            return analytics
+        except Exception:
+            logger.exception("Error getting manufacturing analytics")
             return {
                 "period_days": period_days,
                 "production_volume_trends": [],
@@ -330,7 +333,7 @@ class ManufacturingService:
                 "quality_trends": [],
                 "order_status_distribution": {},
                 "priority_distribution": {},
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": timestamp
             }
 
     # Production Order Management
@@ -343,141 +346,146 @@ class ManufacturingService:
         product_id: Optional[int] = None,
         work_center_id: Optional[int] = None,
         search: Optional[str] = None
-    ) -> List[Dict]:
-        """Get paginated production orders with filters"""
+    ) -> Tuple[List[Dict], int]:
+        """Get a page of production orders with filters, plus the total number of matches"""
         try:
             offset = (page - 1) * limit
             
-            query = select(ProductionOrder)
+            # lambda_stmt caches each statement shape (which filters are present);
+            # closure values are sent as bound parameters
+            query = lambda_stmt(lambda: select(*PRODUCTION_ORDER_COLUMNS, TOTAL_COUNT))
             
             # Apply filters
-            filters = []
             if status:
-                filters.append(ProductionOrder.status == status)
+                query += lambda q: q.where(ProductionOrder.status == status)
             if priority:
-                filters.append(ProductionOrder.priority == priority)
+                query += lambda q: q.where(ProductionOrder.priority == priority)
             if product_id:
-                filters.append(ProductionOrder.product_id == product_id)
+                query += lambda q: q.where(ProductionOrder.product_id == product_id)
             if work_center_id:
-                filters.append(ProductionOrder.work_center_id == work_center_id)
+                query += lambda q: q.where(ProductionOrder.work_center_id == work_center_id)
             if search:
-                filters.append(
+                pattern = f"%{search}%"
+                query += lambda q: q.where(
                     or_(
-                        ProductionOrder.order_number.ilike(f"%{search}%"),
-                        ProductionOrder.product_name.ilike(f"%{search}%")
+                        ProductionOrder.order_number.ilike(pattern),
+                        ProductionOrder.product_name.ilike(pattern)
                     )
                 )
             
-            if filters:
-                query = query.where(and_(*filters))
-            
-            query = query.order_by(desc(ProductionOrder.created_at)).offset(offset).limit(limit)
+            query += lambda q: q.order_by(desc(ProductionOrder.created_at)).offset(offset).limit(limit)
             
             result = await self.db.execute(query)
-            orders = result.scalars().all()
             
-            return [self._serialize_production_order(order) for order in orders]
-        except Exception as e:
-            print(f"Error getting production orders: {e}")
-            return []
+            return self._page_of(result, self._serialize_production_order)
+        except Exception:
+            logger.exception("Error getting production orders")
+            return [], 0
 
     async def create_production_order(self, order_data: ProductionOrderCreate, user_id: int) -> Dict:
         """Create a new production order"""
         try:
-            # Generate order number
-            order_number = f"PO-{datetime.utcnow().strftime('%Y%m%d')}-{uuid.uuid4().hex[:8].upper()}"
-            
-            order = ProductionOrder(
-                order_number=order_number,
-                product_id=order_data.product_id,
-                product_name=order_data.product_name,
-                quantity=order_data.quantity,
-                priority=order_data.priority.value,
-                planned_start_date=order_data.planned_start_date,
-                planned_end_date=order_data.planned_end_date,
-                work_center_id=order_data.work_center_id,
-                routing_id=order_data.routing_id,
-                quality_standards=order_data.quality_standards,
-                notes=order_data.notes,
-                specifications=order_data.specifications,
-                customer_order_id=order_data.customer_order_id,
-                created_by=user_id
+            # RETURNING hands back generated columns, so no refresh SELECT is needed
+            result = await self.db.execute(
+                insert(ProductionOrder)
+                .values(**self._production_order_values(order_data, user_id))
+                .returning(*PRODUCTION_ORDER_COLUMNS)
             )
-            
-            self.db.add(order)
+            order = result.mappings().one()
             await self.db.commit()
-            await self.db.refresh(order)
+            await self._invalidate_cached_metrics()
             
             return self._serialize_production_order(order)
-        except Exception as e:
+        except Exception:
             await self.db.rollback()
-            print(f"Error creating production order: {e}")
+            logger.exception("Error creating production order")
             raise
 
+    @staticmethod
+    def _production_order_values(order_data: ProductionOrderCreate, user_id: int) -> Dict:
+        """Column values for inserting a production order (order_number is assigned by the DB)"""
+        return {
+            "product_id": order_data.product_id,
+            "product_name": order_data.product_name,
+            "quantity": order_data.quantity,
+            "priority": order_data.priority,
+            "planned_start_date": order_data.planned_start_date,
+            "planned_end_date": order_data.planned_end_date,
+            "work_center_id": order_data.work_center_id,
+            "routing_id": order_data.routing_id,
+            "notes": order_data.notes,
+            "customer_order_id": order_data.customer_order_id,
+            "created_by": user_id,
+            **order_data.model_dump(include={"quality_standards", "specifications"})
+        }
+
     async def get_production_order_by_id(self, order_id: int) -> Optional[Dict]:
         """Get production order by ID"""
         try:
             result = await self.db.execute(
-                select(ProductionOrder)
+                select(*PRODUCTION_ORDER_COLUMNS)
                 .where(ProductionOrder.id == order_id)
             )
-            order = result.scalar_one_or_none()
+            order = result.mappings().one_or_none()
             
             if order:
                 return self._serialize_production_order(order)
             return None
-        except Exception as e:
-            print(f"Error getting production order: {e}")
+        except Exception:
+            logger.exception("Error getting production order")
             return None
 
     async def update_production_order(self, order_id: int, order_data: ProductionOrderUpdate, user_id: int) -> Optional[Dict]:
         """Update production order"""
         try:
+            # Update fields
+            update_data = {
+                field: value
+                for field, value in order_data.model_dump(exclude_unset=True).items()
+                if field in ProductionOrder.__table__.c
+            }
+            
+            # One UPDATE ... RETURNING instead of SELECT, setattr, commit and refresh
             result = await self.db.execute(
-                select(ProductionOrder)
+                update(ProductionOrder)
                 .where(ProductionOrder.id == order_id)
+                .values(**update_data, updated_at=datetime.utcnow())
+                .returning(*PRODUCTION_ORDER_COLUMNS)
             )
-            order = result.scalar_one_or_none()
+            order = result.mappings().one_or_none()
             
             if not order:
                 return None
             
-            # Update fields
-            update_data = order_data.dict(exclude_unset=True)
-            for field, value in update_data.items():
-                if hasattr(order, field):
-                    setattr(order, field, value.value if hasattr(value, 'value') else value)
-            
-            order.updated_at = datetime.utcnow()
-            
             await self.db.commit()
-            await self.db.refresh(order)
+            await self._invalidate_cached_metrics()
             
             return self._serialize_production_order(order)
-        except Exception as e:
+        except Exception:
             await self.db.rollback()
-            print(f"Error updating production order: {e}")
+            logger.exception("Error updating production order")
             raise
 
     async def delete_production_order(self, order_id: int) -> bool:
         """Delete production order"""
         try:
+            # Child operations/checks/requirements go via ON DELETE CASCADE
             result = await self.db.execute(
-                select(ProductionOrder)
+                delete(ProductionOrder)
                 .where(ProductionOrder.id == order_id)
+                .returning(ProductionOrder.id)
             )
-            order = result.scalar_one_or_none()
             
-            if not order:
+            if result.scalar_one_or_none() is None:
                 return False
             
-            await self.db.delete(order)
             await self.db.commit()
+            await self._invalidate_cached_metrics()
             
             return True
-        except Exception as e:
+        except Exception:
             await self.db.rollback()
-            print(f"Error deleting production order: {e}")
+            logger.exception("Error deleting production order")
             raise
 
     # Product Management
@@ -489,42 +497,38 @@ class ManufacturingService:
         category: Optional[str] = None,
         is_active: Optional[bool] = None,
         search: Optional[str] = None
-    ) -> List[Dict]:
-        """Get paginated products with filters"""
+    ) -> Tuple[List[Dict], int]:
+        """Get a page of products with filters, plus the total number of matches"""
         try:
             offset = (page - 1) * limit
             
-            query = select(Product)
+            query = lambda_stmt(lambda: select(*PRODUCT_COLUMNS, TOTAL_COUNT))
             
             # Apply filters
-            filters = []
             if product_type:
-                filters.append(Product.product_type == product_type)
+                query += lambda q: q.where(Product.product_type == product_type)
             if category:
-                filters.append(Product.category == category)
+                query += lambda q: q.where(Product.category == category)
             if is_active is not None:
-                filters.append(Product.is_active == is_active)
+                query += lambda q: q.where(Product.is_active == is_active)
             if search:
-                filters.append(
+                pattern = f"%{search}%"
+                query += lambda q: q.where(
                     or_(
-                        Product.product_code.ilike(f"%{search}%"),
-                        Product.name.ilike(f"%{search}%"),
-                        Product.description.ilike(f"%{search}%")
+                        Product.product_code.ilike(pattern),
+                        Product.name.ilike(pattern),
+                        Product.description.ilike(pattern)
                     )
                 )
             
-            if filters:
-                query = query.where(and_(*filters))
-            
-            query = query.order_by(desc(Product.created_at)).offset(offset).limit(limit)
+            query += lambda q: q.order_by(desc(Product.created_at)).offset(offset).limit(limit)
             
             result = await self.db.execute(query)
-            products = result.scalars().all()
             
-            return [self._serialize_product(product) for product in products]
-        except Exception as e:
-            print(f"Error getting products: {e}")
-            return []
+            return self._page_of(result, self._serialize_product)
+        except Exception:
+            logger.exception("Error getting products")
+            return [], 0
 
     async def create_product(self, product_data: ProductCreate, user_id: int) -> Dict:
         """Create a new product"""
@@ -536,25 +540,24 @@ class ManufacturingService:
                 product_type=product_data.product_type,
                 category=product_data.category,
                 unit_of_measure=product_data.unit_of_measure,
-                dimensions=product_data.dimensions,
                 weight=product_data.weight,
-                specifications=product_data.specifications,
                 standard_cycle_time=product_data.standard_cycle_time,
                 is_make_to_order=product_data.is_make_to_order,
                 is_make_to_stock=product_data.is_make_to_stock,
                 minimum_stock_level=product_data.minimum_stock_level,
                 maximum_stock_level=product_data.maximum_stock_level,
-                reorder_point=product_data.reorder_point
+                reorder_point=product_data.reorder_point,
+                **product_data.model_dump(include={"dimensions", "specifications"})
             )
             
             self.db.add(product)
             await self.db.commit()
             await self.db.refresh(product)
             
-            return self._serialize_product(product)
-        except Exception as e:
+            return self._serialize_product(self._row_of(product, PRODUCT_COLUMNS))
+        except Exception:
             await self.db.rollback()
-            print(f"Error creating product: {e}")
+            logger.exception("Error creating product")
             raise
 
     # Quality Check Management
@@ -565,141 +568,185 @@ class ManufacturingService:
         status: Optional[str] = None,
         check_type: Optional[str] = None,
         production_order_id: Optional[int] = None
-    ) -> List[Dict]:
-        """Get paginated quality checks with filters"""
+    ) -> Tuple[List[Dict], int]:
+        """Get a page of quality checks with filters, plus the total number of matches"""
         try:
             offset = (page - 1) * limit
             
-            query = select(QualityCheck)
+            query = lambda_stmt(lambda: select(*QUALITY_CHECK_COLUMNS, TOTAL_COUNT))
             
             # Apply filters
-            filters = []
             if status:
-                filters.append(QualityCheck.status == status)
+                query += lambda q: q.where(QualityCheck.status == status)
             if check_type:
-                filters.append(QualityCheck.check_type == check_type)
+                query += lambda q: q.where(QualityCheck.check_type == check_type)
             if production_order_id:
-                filters.append(QualityCheck.production_order_id == production_order_id)
-            
-            if filters:
-                query = query.where(and_(*filters))
+                query += lambda q: q.where(QualityCheck.production_order_id == production_order_id)
             
-            query = query.order_by(desc(QualityCheck.created_at)).offset(offset).limit(limit)
+            query += lambda q: q.order_by(desc(QualityCheck.created_at)).offset(offset).limit(limit)
             
             result = await self.db.execute(query)
-            checks = result.scalars().all()
             
-            return [self._serialize_quality_check(check) for check in checks]
-        except Exception as e:
-            print(f"Error getting quality checks: {e}")
-            return []
+            return self._page_of(result, self._serialize_quality_check)
+        except Exception:
+            logger.exception("Error getting quality checks")
+            return [], 0
 
     async def create_quality_check(self, check_data: QualityCheckCreate, user_id: int) -> Dict:
         """Create a new quality check"""
         try:
-            # Generate check number
-            check_number = f"QC-{datetime.utcnow().strftime('%Y%m%d')}-{uuid.uuid4().hex[:8].upper()}"
-            
-            check = QualityCheck(
-                check_number=check_number,
-                production_order_id=check_data.production_order_id,
-                operation_id=check_data.operation_id,
-                check_type=check_data.check_type.value,
-                inspector_id=user_id,
-                quantity_checked=check_data.quantity_checked,
-                specifications=check_data.specifications,
-                notes=check_data.notes
+            result = await self.db.execute(
+                insert(QualityCheck)
+                .values(**self._quality_check_values(check_data, user_id))
+                .returning(*QUALITY_CHECK_COLUMNS)
             )
-            
-            self.db.add(check)
+            check = result.mappings().one()
             await self.db.commit()
-            await self.db.refresh(check)
+            await self._invalidate_cached_metrics()
             
             return self._serialize_quality_check(check)
-        except Exception as e:
+        except Exception:
             await self.db.rollback()
-            print(f"Error creating quality check: {e}")
+            logger.exception("Error creating quality check")
             raise
 
-    # Serialization methods
-    def _serialize_production_order(self, order: ProductionOrder) -> Dict:
-        """Serialize production order to dict"""
+    @staticmethod
+    def _quality_check_values(check_data: QualityCheckCreate, user_id: int) -> Dict:
+        """Column values for inserting a quality check (check_number is assigned by the DB)"""
         return {
-            "id": order.id,
-            "order_number": order.order_number,
-            "product_id": order.product_id,
-            "product_name": order.product_name,
-            "quantity": order.quantity,
-            "priority": order.priority,
-            "status": order.status,
-            "planned_start_date": order.planned_start_date.isoformat() if order.planned_start_date else None,
-            "planned_end_date": order.planned_end_date.isoformat() if order.planned_end_date else None,
-            "actual_start_date": order.actual_start_date.isoformat() if order.actual_start_date else None,
-            "actual_end_date": order.actual_end_date.isoformat() if order.actual_end_date else None,
-            "work_center_id": order.work_center_id,
-            "routing_id": order.routing_id,
-            "completion_percentage": float(order.completion_percentage) if order.completion_percentage else 0.0,
-            "units_completed": order.units_completed,
-            "units_scrapped": order.units_scrapped,
-            "estimated_cost": float(order.estimated_cost) if order.estimated_cost else None,
-            "actual_cost": float(order.actual_cost) if order.actual_cost else None,
-            "material_cost": float(order.material_cost) if order.material_cost else None,
-            "labor_cost": float(order.labor_cost) if order.labor_cost else None,
-            "overhead_cost": float(order.overhead_cost) if order.overhead_cost else None,
-            "quality_standards": order.quality_standards,
-            "notes": order.notes,
-            "specifications": order.specifications,
-            "customer_order_id": order.customer_order_id,
-            "created_at": order.created_at.isoformat() if order.created_at else None,
-            "updated_at": order.updated_at.isoformat() if order.updated_at else None
+            "production_order_id": check_data.production_order_id,
+            "operation_id": check_data.operation_id,
+            "check_type": check_data.check_type,
+            "inspector_id": user_id,
+            "quantity_checked": check_data.quantity_checked,
+            "notes": check_data.notes,
+            **check_data.model_dump(include={"specifications"})
         }
 
-    def _serialize_product(self, product: Product) -> Dict:
-        """Serialize product to dict"""
-        return {
-            "id": product.id,
-            "product_code": product.product_code,
-            "name": product.name,
-            "description": product.description,
-            "product_type": product.product_type,
-            "category": product.category,
-            "unit_of_measure": product.unit_of_measure,
-            "dimensions": product.dimensions,
-            "weight": float(product.weight) if product.weight else None,
-            "specifications": product.specifications,
-            "standard_cycle_time": float(product.standard_cycle_time) if product.standard_cycle_time else None,
-            "is_make_to_order": product.is_make_to_order,
-            "is_make_to_stock": product.is_make_to_stock,
-            "minimum_stock_level": product.minimum_stock_level,
-            "maximum_stock_level": product.maximum_stock_level,
-            "reorder_point": product.reorder_point,
-            "standard_cost": float(product.standard_cost) if product.standard_cost else None,
-            "material_cost": float(product.material_cost) if product.material_cost else None,
-            "labor_cost": float(product.labor_cost) if product.labor_cost else None,
-            "overhead_cost": float(product.overhead_cost) if product.overhead_cost else None,
-            "is_active": product.is_active,
-            "created_at": product.created_at.isoformat() if product.created_at else None,
-            "updated_at": product.updated_at.isoformat() if product.updated_at else None
-        }
+    # Cache helpers
+    async def _get_or_compute(self, key: str, compute: Callable[[], Awaitable[Dict]]) -> Dict:
+        """Serve from cache, otherwise join (or start) the single in-flight recompute"""
+        cached = await self._get_cached(key)
+        if cached is not None:
+            if await self._expires_soon(key):
+                self._start_recompute(key, compute)
+            return cached
+        # shield: a cancelled request must not cancel the rebuild other requests await
+        return await asyncio.shield(self._start_recompute(key, compute))
 
-    def _serialize_quality_check(self, check: QualityCheck) -> Dict:
-        """Serialize quality check to dict"""
-        return {
-            "id": check.id,
-            "check_number": check.check_number,
-            "production_order_id": check.production_order_id,
-            "operation_id": check.operation_id,
-            "check_type": check.check_type,
-            "inspector_id": check.inspector_id,
-            "status": check.status,
-            "quantity_checked": check.quantity_checked,
-            "quantity_passed": check.quantity_passed,
-            "quantity_failed": check.quantity_failed,
-            "specifications": check.specifications,
-            "test_results": check.test_results,
-            "notes": check.notes,
-            "corrective_actions": check.corrective_actions,
-            "created_at": check.created_at.isoformat() if check.created_at else None,
-            "updated_at": check.updated_at.isoformat() if check.updated_at else None,
-            "completed_at": check.completed_at.isoformat() if check.completed_at else None
-        }
+    @staticmethod
+    def _start_recompute(key: str, compute: Callable[[], Awaitable[Dict]]) -> "asyncio.Task[Dict]":
+        task = _inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(compute())
+            _inflight[key] = task
+            task.add_done_callback(lambda _: _inflight.pop(key, None))
+        return task
+
+    async def _expires_soon(self, key: str) -> bool:
+        return 0 <= await self.cache.get_ttl(key) < CACHE_EARLY_REFRESH_SECONDS
+
+    async def _get_cached(self, key: str) -> Optional[Dict]:
+        """Read a cached payload; misses and Redis errors both return None"""
+        if self.cache is None:
+            return None
+        return await self.cache.get(key)
+
+    async def _set_cached(self, key: str, value: Dict) -> None:
+        """Cache a JSON-ready payload (see _json_ready), so it reads back unchanged"""
+        if self.cache is not None:
+            await self.cache.set(key, value, ttl=CACHE_TTL_SECONDS)
+
+    async def _analytics_generation(self) -> int:
+        if self.cache is None:
+            return 0
+        return await self.cache.get(ANALYTICS_GENERATION_KEY) or 0
+
+    async def _invalidate_cached_metrics(self) -> None:
+        """Drop cached dashboard/analytics payloads after a write"""
+        if self.cache is None:
+            return
+        await self.cache.delete(DASHBOARD_CACHE_KEY)
+        # Superseded analytics keys are never read again and expire on their TTL
+        await self.cache.increment(ANALYTICS_GENERATION_KEY)
+
+    # Query helpers
+    @staticmethod
+    def _count_by_query(column, *filters):
+        """Build a query counting rows grouped by a single column"""
+        query = select(column, func.count()).group_by(column)
+        if filters:
+            query = query.where(and_(*filters))
+        return query
+
+    @staticmethod
+    def _nonzero_counts(counts: Dict[str, int], values: Tuple[str, ...]) -> Dict[str, int]:
+        """Known values with a non-zero count, in enum order"""
+        return {value: counts[value] for value in values if counts.get(value)}
+
+    @staticmethod
+    def _window_index(column, start_date: datetime, days: int):
+        """Index of the `days`-long window after start_date that a timestamp falls in"""
+        start_epoch = start_date.replace(tzinfo=timezone.utc).timestamp()
+        return func.floor(
+            (func.extract('epoch', column) - start_epoch) / (days * 86400)
+        ).label('bucket')
+
+    async def _execute_concurrently(self, *queries) -> List[list]:
+        """Run independent read-only queries concurrently and return their rows.
+
+        An AsyncSession cannot run statements concurrently, so each query gets
+        its own short-lived session bound to the same engine.
+        """
+        session_factory = async_sessionmaker(bind=self.db.bind, expire_on_commit=False)
+
+        async def fetch(query):
+            async with session_factory() as session:
+                return (await session.execute(query)).all()
+
+        return await asyncio.gather(*(fetch(query) for query in queries))
+
+    @staticmethod
+    def _page_of(result, serialize: Callable[[Mapping[str, Any]], Dict]) -> Tuple[List[Dict], int]:
+        """Split a paged result selected with TOTAL_COUNT into (items, total)"""
+        rows = result.mappings().all()
+        items = []
+        for row in rows:
+            item = serialize(row)
+            del item["total_count"]
+            items.append(item)
+        return items, rows[0]["total_count"] if rows else 0
+
+    # Serialization methods
+    @staticmethod
+    def _row_of(instance: Any, columns: Tuple) -> Dict[str, Any]:
+        """Project an ORM instance onto the same columns the list queries select"""
+        return {column.key: getattr(instance, column.key) for column in columns}
+
+    @staticmethod
+    def _serialize_row(row: Mapping[str, Any], decimal_fields: Tuple[str, ...] = ()) -> Dict:
+        data = dict(row)
+        for field in decimal_fields:
+            value = data[field]
+            data[field] = float(value) if value else None
+        return data
+
+    @staticmethod
+    def _json_ready(data: Dict) -> Dict:
+        """Render datetimes as ISO strings, as ORJSONResponse would, so a cached
+        payload reads back identical to a freshly computed one"""
+        return {key: value.isoformat() if isinstance(value, datetime) else value for key, value in data.items()}
+
+    def _serialize_production_order(self, order: Mapping[str, Any]) -> Dict:
+        """Serialize a production order row (see PRODUCTION_ORDER_COLUMNS) to dict"""
+        data = self._serialize_row(order, _PRODUCTION_ORDER_DECIMAL_FIELDS)
+        data["completion_percentage"] = float(data["completion_percentage"] or 0.0)
+        return data
+
+    def _serialize_product(self, product: Mapping[str, Any]) -> Dict:
+        """Serialize a product row (see PRODUCT_COLUMNS) to dict"""
+        return self._serialize_row(product, _PRODUCT_DECIMAL_FIELDS)
+
+    def _serialize_quality_check(self, check: Mapping[str, Any]) -> Dict:
+        """Serialize a quality check row (see QUALITY_CHECK_COLUMNS) to dict"""
+        return self._serialize_row(check)
@@ -1,6 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Optional, Type
+import msgspec
 from .service import POSService
 from .schemas import (
     Terminal, TerminalCreate, TerminalUpdate,
@@ -9,208 +13,353 @@ from .schemas import (
     Payment, PaymentCreate, PaymentUpdate,
     TaxRate, TaxRateCreate, TaxRateUpdate,
     Discount, DiscountCreate, DiscountUpdate,
-    POSDashboardStats, POSAnalytics
+    POSDashboardStats, POSAnalytics,
+    TerminalOut, CashDrawerOut, SaleOut, PaymentOut
 )
 
+# Every route returns a Response with a msgspec-encoded body (JSON, or
+# MessagePack where negotiated), so one encoder formats every payload.
 router = APIRouter(prefix="/pos")
 
+# Pagination params shared by every list route
+Skip = Annotated[int, Query(ge=0)]
+Limit = Annotated[int, Query(ge=1, le=1000)]
+
+_HEALTH_JSON = msgspec.json.encode({
+    "status": "healthy",
+    "module": "pos",
+    "message": "Point of Sale module is running"
+})
+
 @router.get("/health")
 async def health_check():
     """POS module health check"""
-    return {
-        "status": "healthy",
-        "module": "pos",
-        "message": "Point of Sale module is running"
-    }
-
-@router.get("/dashboard", response_model=POSDashboardStats)
-async def get_dashboard():
+    return _json_response(_HEALTH_JSON)
+
+# Content negotiation: clients on constrained links (e.g. mobile registers)
+# can ask for MessagePack with "Accept: application/x-msgpack". JSON stays the
+# default.
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+_BODY_ENCODERS = {
+    "json": (msgspec.json.encode, "application/json"),
+    "msgpack": (msgspec.msgpack.encode, MSGPACK_MEDIA_TYPE),
+}
+_NEGOTIATED = {"content": {MSGPACK_MEDIA_TYPE: {}}}
+
+async def response_encoding(request: Request) -> str:
+    """Pick the body encoding from the Accept header."""
+    return "msgpack" if MSGPACK_MEDIA_TYPE in request.headers.get("accept", "") else "json"
+
+def _encode_bodies(payload) -> Dict[str, bytes]:
+    """Encode a payload once per supported encoding."""
+    return {name: encode(payload) for name, (encode, _) in _BODY_ENCODERS.items()}
+
+def _negotiated_response(bodies: Dict[str, bytes], encoding: str) -> Response:
+    return Response(
+        content=bodies[encoding],
+        media_type=_BODY_ENCODERS[encoding][1],
+        headers={"Vary": "Accept"},
+    )
+
+# Partial-update bodies are msgspec structs (see schemas.py), decoded straight
+# from the raw request body instead of through a Pydantic body model.
+def msgspec_body(struct_type: Type[msgspec.Struct]):
+    async def decode(request: Request):
+        try:
+            return msgspec.json.decode(await request.body(), type=struct_type)
+        except msgspec.DecodeError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+    return decode
+
+def _request_body_docs(struct_type: Type[msgspec.Struct]) -> Dict[str, Any]:
+    """openapi_extra documenting a msgspec request body"""
+    _, components = msgspec.json.schema_components([struct_type])
+    schema = components[struct_type.__name__]
+    return {"requestBody": {"required": True, "content": {"application/json": {"schema": schema}}}}
+
+def _mock_time(hour: int = 0, minute: int = 0) -> datetime:
+    return datetime(2024, 1, 1, hour, minute, tzinfo=timezone.utc)
+
+# Mock payloads for the read endpoints. They never change, so they are
+# validated and encoded once at import and every request just sends the
+# cached bytes.
+_DASHBOARD_STATS_BODIES = _encode_bodies(POSDashboardStats(
+    total_sales_today=2500.0,
+    total_transactions_today=45,
+    average_transaction_value=55.56,
+    top_selling_products=[
+        {"product_name": "Product A", "quantity_sold": 25, "revenue": 1250.0},
+        {"product_name": "Product B", "quantity_sold": 18, "revenue": 900.0},
+        {"product_name": "Product C", "quantity_sold": 12, "revenue": 600.0}
+    ],
+    payment_methods_breakdown=[
+        {"method": "Cash", "count": 20, "amount": 1000.0},
+        {"method": "Credit Card", "count": 15, "amount": 750.0},
+        {"method": "Debit Card", "count": 10, "amount": 500.0}
+    ],
+    terminal_performance=[
+        {"terminal_id": "T001", "sales_count": 25, "revenue": 1250.0},
+        {"terminal_id": "T002", "sales_count": 15, "revenue": 750.0},
+        {"terminal_id": "T003", "sales_count": 5, "revenue": 250.0}
+    ]
+).model_dump(mode="json"))
+
+_SALES_BY_HOUR = tuple(
+    {"hour": f"{i:02d}:00", "sales": 50 + i * 5} for i in range(24)
+)
+
+# Everything except "period", which depends on the request.
+_ANALYTICS = POSAnalytics(
+    period="",
+    total_revenue=75000.0,
+    total_transactions=1350,
+    average_transaction_value=55.56,
+    sales_by_hour=_SALES_BY_HOUR,
+    sales_by_day=[
+        {"day": "Monday", "revenue": 10000.0},
+        {"day": "Tuesday", "revenue": 12000.0},
+        {"day": "Wednesday", "revenue": 11000.0},
+        {"day": "Thursday", "revenue": 13000.0},
+        {"day": "Friday", "revenue": 15000.0},
+        {"day": "Saturday", "revenue": 8000.0},
+        {"day": "Sunday", "revenue": 6000.0}
+    ],
+    top_products=[
+        {"product_name": "Product A", "quantity": 450, "revenue": 22500.0},
+        {"product_name": "Product B", "quantity": 320, "revenue": 16000.0},
+        {"product_name": "Product C", "quantity": 280, "revenue": 14000.0}
+    ],
+    payment_methods=[
+        {"method": "Cash", "percentage": 45, "amount": 33750.0},
+        {"method": "Credit Card", "percentage": 35, "amount": 26250.0},
+        {"method": "Debit Card", "percentage": 20, "amount": 15000.0}
+    ]
+).model_dump(mode="json", exclude={"period"})
+
+_TERMINALS_JSON = msgspec.json.encode([
+    TerminalOut(
+        id=1,
+        terminal_id="T001",
+        name="Main Register",
+        location="Front Store",
+        is_active=True,
+        created_at=_mock_time(),
+        updated_at=None
+    ),
+    TerminalOut(
+        id=2,
+        terminal_id="T002",
+        name="Secondary Register",
+        location="Back Store",
+        is_active=True,
+        created_at=_mock_time(),
+        updated_at=None
+    ),
+    TerminalOut(
+        id=3,
+        terminal_id="T003",
+        name="Mobile POS",
+        location="Warehouse",
+        is_active=False,
+        created_at=_mock_time(),
+        updated_at=None
+    )
+])
+
+_CASH_DRAWERS_JSON = msgspec.json.encode([
+    CashDrawerOut(
+        id=1,
+        terminal_id=1,
+        opened_at=_mock_time(8),
+        closed_at=None,
+        opened_by="Cashier 1",
+        closed_by=None,
+        opening_amount=100.0,
+        closing_amount=None,
+        expected_amount=None,
+        difference=None,
+        is_open=True
+    ),
+    CashDrawerOut(
+        id=2,
+        terminal_id=2,
+        opened_at=_mock_time(8, 30),
+        closed_at=_mock_time(17),
+        opened_by="Cashier 2",
+        closed_by="Cashier 2",
+        opening_amount=100.0,
+        closing_amount=850.0,
+        expected_amount=850.0,
+        difference=0.0,
+        is_open=False
+    )
+])
+
+_SALES_BODIES = _encode_bodies([
+    SaleOut(
+        id=1,
+        sale_number="POS20240101120001",
+        terminal_id=1,
+        cashier_id="cashier_1",
+        customer_id="customer_1",
+        subtotal=50.0,
+        tax_amount=5.0,
+        discount_amount=0.0,
+        total_amount=55.0,
+        status="completed",
+        sale_date=_mock_time(12),
+        notes="Regular sale",
+        items=[]
+    ),
+    SaleOut(
+        id=2,
+        sale_number="POS20240101120002",
+        terminal_id=1,
+        cashier_id="cashier_1",
+        customer_id=None,
+        subtotal=25.0,
+        tax_amount=2.5,
+        discount_amount=2.5,
+        total_amount=25.0,
+        status="completed",
+        sale_date=_mock_time(12, 15),
+        notes="Sale with discount",
+        items=[]
+    )
+])
+
+_PAYMENTS_JSON = msgspec.json.encode([
+    PaymentOut(
+        id=1,
+        sale_id=1,
+        payment_method="credit_card",
+        amount=55.0,
+        status="completed",
+        transaction_id="TXN001",
+        reference_number="REF001",
+        payment_date=_mock_time(12),
+        notes="Credit card payment"
+    ),
+    PaymentOut(
+        id=2,
+        sale_id=2,
+        payment_method="cash",
+        amount=25.0,
+        status="completed",
+        transaction_id=None,
+        reference_number="CASH001",
+        payment_date=_mock_time(12, 15),
+        notes="Cash payment"
+    )
+])
+
+def _json_response(content: bytes) -> Response:
+    return Response(content=content, media_type="application/json")
+
+def _struct_response(payload) -> Response:
+    return _json_response(msgspec.json.encode(payload))
+
+@lru_cache(maxsize=365)
+def _analytics_bodies(period_days: int) -> Dict[str, bytes]:
+    return _encode_bodies({"period": f"{period_days} days", **_ANALYTICS})
+
+@router.get("/dashboard", responses={200: {"model": POSDashboardStats, **_NEGOTIATED}})
+async def get_dashboard(encoding: str = Depends(response_encoding)):
     """Get POS dashboard statistics"""
     # Mock data for now - in real implementation, this would use the service
-    return POSDashboardStats(
-        total_sales_today=2500.0,
-        total_transactions_today=45,
-        average_transaction_value=55.56,
-        top_selling_products=[
-            {"product_name": "Product A", "quantity_sold": 25, "revenue": 1250.0},
-            {"product_name": "Product B", "quantity_sold": 18, "revenue": 900.0},
-            {"product_name": "Product C", "quantity_sold": 12, "revenue": 600.0}
-        ],
-        payment_methods_breakdown=[
-            {"method": "Cash", "count": 20, "amount": 1000.0},
-            {"method": "Credit Card", "count": 15, "amount": 750.0},
-            {"method": "Debit Card", "count": 10, "amount": 500.0}
-        ],
-        terminal_performance=[
-            {"terminal_id": "T001", "sales_count": 25, "revenue": 1250.0},
-            {"terminal_id": "T002", "sales_count": 15, "revenue": 750.0},
-            {"terminal_id": "T003", "sales_count": 5, "revenue": 250.0}
-        ]
-    )
+    return _negotiated_response(_DASHBOARD_STATS_BODIES, encoding)
 
-@router.get("/analytics", response_model=POSAnalytics)
-async def get_analytics(period_days: int = Query(30, ge=1, le=365)):
+@router.get("/analytics", responses={200: {"model": POSAnalytics, **_NEGOTIATED}})
+async def get_analytics(
+    period_days: int = Query(30, ge=1, le=365),
+    encoding: str = Depends(response_encoding)
+):
     """Get POS analytics for specified period"""
     # Mock data for now
-    return POSAnalytics(
-        period=f"{period_days} days",
-        total_revenue=75000.0,
-        total_transactions=1350,
-        average_transaction_value=55.56,
-        sales_by_hour=[
-            {"hour": f"{i:02d}:00", "sales": 50 + i * 5} for i in range(24)
-        ],
-        sales_by_day=[
-            {"day": "Monday", "revenue": 10000.0},
-            {"day": "Tuesday", "revenue": 12000.0},
-            {"day": "Wednesday", "revenue": 11000.0},
-            {"day": "Thursday", "revenue": 13000.0},
-            {"day": "Friday", "revenue": 15000.0},
-            {"day": "Saturday", "revenue": 8000.0},
-            {"day": "Sunday", "revenue": 6000.0}
-        ],
-        top_products=[
-            {"product_name": "Product A", "quantity": 450, "revenue": 22500.0},
-            {"product_name": "Product B", "quantity": 320, "revenue": 16000.0},
-            {"product_name": "Product C", "quantity": 280, "revenue": 14000.0}
-        ],
-        payment_methods=[
-            {"method": "Cash", "percentage": 45, "amount": 33750.0},
-            {"method": "Credit Card", "percentage": 35, "amount": 26250.0},
-            {"method": "Debit Card", "percentage": 20, "amount": 15000.0}
-        ]
-    )
+    return _negotiated_response(_analytics_bodies(period_days), encoding)
 
 # Terminal Management
-@router.get("/terminals", response_model=List[Terminal])
+@router.get("/terminals", responses={200: {"model": List[Terminal]}})
 async def get_terminals(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000)
+    skip: Skip = 0,
+    limit: Limit = 100
 ):
     """Get list of POS terminals"""
     # Mock data for now
-    return [
-        Terminal(
-            id=1,
-            terminal_id="T001",
-            name="Main Register",
-            location="Front Store",
-            is_active=True,
-            created_at="2024-01-01T00:00:00Z",
-            updated_at=None
-        ),
-        Terminal(
-            id=2,
-            terminal_id="T002",
-            name="Secondary Register",
-            location="Back Store",
-            is_active=True,
-            created_at="2024-01-01T00:00:00Z",
-            updated_at=None
-        ),
-        Terminal(
-            id=3,
-            terminal_id="T003",
-            name="Mobile POS",
-            location="Warehouse",
-            is_active=False,
-            created_at="2024-01-01T00:00:00Z",
-            updated_at=None
-        )
-    ]
+    return _json_response(_TERMINALS_JSON)
 
-@router.post("/terminals", response_model=Terminal)
+@router.post("/terminals", responses={200: {"model": Terminal}})
 async def create_terminal(terminal_data: TerminalCreate):
     """Create a new POS terminal"""
     # Mock implementation
-    return Terminal(
+    return _struct_response(TerminalOut(
         id=4,
         terminal_id=terminal_data.terminal_id,
         name=terminal_data.name,
         location=terminal_data.location,
         is_active=terminal_data.is_active,
-        created_at="2024-01-01T00:00:00Z",
+        created_at=_mock_time(),
         updated_at=None
-    )
+    ))
 
-@router.get("/terminals/{terminal_id}", response_model=Terminal)
+@router.get("/terminals/{terminal_id}", responses={200: {"model": Terminal}})
 async def get_terminal(terminal_id: int):
     """Get terminal by ID"""
     # Mock implementation
-    return Terminal(
+    return _struct_response(TerminalOut(
         id=terminal_id,
         terminal_id=f"T{terminal_id:03d}",
         name=f"Terminal {terminal_id}",
         location="Store Location",
         is_active=True,
-        created_at="2024-01-01T00:00:00Z",
+        created_at=_mock_time(),
         updated_at=None
-    )
+    ))
 
-@router.put("/terminals/{terminal_id}", response_model=Terminal)
-async def update_terminal(terminal_id: int, terminal_data: TerminalUpdate):
+@router.put(
+    "/terminals/{terminal_id}",
+    responses={200: {"model": Terminal}},
+    openapi_extra=_request_body_docs(TerminalUpdate)
+)
+async def update_terminal(
+    terminal_id: int,
+    terminal_data: TerminalUpdate = Depends(msgspec_body(TerminalUpdate))
+):
     """Update terminal"""
     # Mock implementation
-    return Terminal(
+    return _struct_response(TerminalOut(
         id=terminal_id,
         terminal_id=f"T{terminal_id:03d}",
         name=terminal_data.name or f"Terminal {terminal_id}",
         location=terminal_data.location or "Store Location",
-        is_active=terminal_data.is_active if terminal_data.is_active is not None else True,
-        created_at="2024-01-01T00:00:00Z",
-        updated_at="2024-01-01T00:00:00Z"
-    )
+        is_active=terminal_data.is_active if isinstance(terminal_data.is_active, bool) else True,
+        created_at=_mock_time(),
+        updated_at=_mock_time()
+    ))
 
 @router.delete("/terminals/{terminal_id}")
 async def delete_terminal(terminal_id: int):
     """Delete terminal"""
-    return {"message": f"Terminal {terminal_id} deleted successfully"}
+    return _struct_response({"message": f"Terminal {terminal_id} deleted successfully"})
 
 # Cash Drawer Management
-@router.get("/cash-drawers", response_model=List[CashDrawer])
+@router.get("/cash-drawers", responses={200: {"model": List[CashDrawer]}})
 async def get_cash_drawers(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000)
+    skip: Skip = 0,
+    limit: Limit = 100
 ):
     """Get list of cash drawers"""
     # Mock data for now
-    return [
-        CashDrawer(
-            id=1,
-            terminal_id=1,
-            opened_at="2024-01-01T08:00:00Z",
-            closed_at=None,
-            opened_by="Cashier 1",
-            closed_by=None,
-            opening_amount=100.0,
-            closing_amount=None,
-            expected_amount=None,
-            difference=None,
-            is_open=True
-        ),
-        CashDrawer(
-            id=2,
-            terminal_id=2,
-            opened_at="2024-01-01T08:30:00Z",
-            closed_at="2024-01-01T17:00:00Z",
-            opened_by="Cashier 2",
-            closed_by="Cashier 2",
-            opening_amount=100.0,
-            closing_amount=850.0,
-            expected_amount=850.0,
-            difference=0.0,
-            is_open=False
-        )
-    ]
+    return _json_response(_CASH_DRAWERS_JSON)
 
-@router.post("/cash-drawers", response_model=CashDrawer)
+@router.post("/cash-drawers", responses={200: {"model": CashDrawer}})
 async def open_cash_drawer(drawer_data: CashDrawerCreate):
     """Open cash drawer"""
     # Mock implementation
-    return CashDrawer(
+    return _struct_response(CashDrawerOut(
         id=3,
         terminal_id=drawer_data.terminal_id,
-        opened_at="2024-01-01T00:00:00Z",
+        opened_at=_mock_time(),
         closed_at=None,
         opened_by=drawer_data.opened_by,
         closed_by=None,
@@ -219,17 +368,24 @@ async def open_cash_drawer(drawer_data: CashDrawerCreate):
         expected_amount=None,
         difference=None,
         is_open=True
-    )
+    ))
 
-@router.put("/cash-drawers/{drawer_id}", response_model=CashDrawer)
-async def close_cash_drawer(drawer_id: int, drawer_data: CashDrawerUpdate):
+@router.put(
+    "/cash-drawers/{drawer_id}",
+    responses={200: {"model": CashDrawer}},
+    openapi_extra=_request_body_docs(CashDrawerUpdate)
+)
+async def close_cash_drawer(
+    drawer_id: int,
+    drawer_data: CashDrawerUpdate = Depends(msgspec_body(CashDrawerUpdate))
+):
     """Close cash drawer"""
     # Mock implementation
-    return CashDrawer(
+    return _struct_response(CashDrawerOut(
         id=drawer_id,
         terminal_id=1,
-        opened_at="2024-01-01T08:00:00Z",
-        closed_at="2024-01-01T17:00:00Z",
+        opened_at=_mock_time(8),
+        closed_at=_mock_time(17),
         opened_by="Cashier 1",
         closed_by=drawer_data.closed_by or "Cashier 1",
         opening_amount=100.0,
@@ -237,54 +393,24 @@ async def close_cash_drawer(drawer_id: int, drawer_data: CashDrawerUpdate):
         expected_amount=drawer_data.expected_amount or 750.0,
         difference=0.0,
         is_open=False
-    )
+    ))
 
 # Sale Management
-@router.get("/sales", response_model=List[Sale])
+@router.get("/sales", responses={200: {"model": List[Sale], **_NEGOTIATED}})
 async def get_sales(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000)
+    skip: Skip = 0,
+    limit: Limit = 100,
+    encoding: str = Depends(response_encoding)
 ):
     """Get list of sales"""
     # Mock data for now
-    return [
-        Sale(
-            id=1,
-            sale_number="POS20240101120001",
-            terminal_id=1,
-            cashier_id="cashier_1",
-            customer_id="customer_1",
-            subtotal=50.0,
-            tax_amount=5.0,
-            discount_amount=0.0,
-            total_amount=55.0,
-            status="completed",
-            sale_date="2024-01-01T12:00:00Z",
-            notes="Regular sale",
-            items=[]
-        ),
-        Sale(
-            id=2,
-            sale_number="POS20240101120002",
-            terminal_id=1,
-            cashier_id="cashier_1",
-            customer_id=None,
-            subtotal=25.0,
-            tax_amount=2.5,
-            discount_amount=2.5,
-            total_amount=25.0,
-            status="completed",
-            sale_date="2024-01-01T12:15:00Z",
-            notes="Sale with discount",
-            items=[]
-        )
-    ]
+    return _negotiated_response(_SALES_BODIES, encoding)
 
-@router.post("/sales", response_model=Sale)
+@router.post("/sales", responses={200: {"model": Sale}})
 async def create_sale(sale_data: SaleCreate):
     """Create a new sale"""
     # Mock implementation
-    return Sale(
+    return _struct_response(SaleOut(
         id=3,
         sale_number="POS20240101120003",
         terminal_id=sale_data.terminal_id,
@@ -295,16 +421,16 @@ async def create_sale(sale_data: SaleCreate):
         discount_amount=0.0,
         total_amount=110.0,
         status="pending",
-        sale_date="2024-01-01T12:30:00Z",
+        sale_date=_mock_time(12, 30),
         notes=sale_data.notes,
         items=[]
-    )
+    ))
 
-@router.get("/sales/{sale_id}", response_model=Sale)
+@router.get("/sales/{sale_id}", responses={200: {"model": Sale}})
 async def get_sale(sale_id: int):
     """Get sale by ID"""
     # Mock implementation
-    return Sale(
+    return _struct_response(SaleOut(
         id=sale_id,
         sale_number=f"POS2024010112000{sale_id}",
         terminal_id=1,
@@ -315,16 +441,23 @@ async def get_sale(sale_id: int):
         discount_amount=0.0,
         total_amount=82.5,
         status="completed",
-        sale_date="2024-01-01T12:45:00Z",
+        sale_date=_mock_time(12, 45),
         notes="Sample sale",
         items=[]
-    )
+    ))
 
-@router.put("/sales/{sale_id}", response_model=Sale)
-async def update_sale(sale_id: int, sale_data: SaleUpdate):
+@router.put(
+    "/sales/{sale_id}",
+    responses={200: {"model": Sale}},
+    openapi_extra=_request_body_docs(SaleUpdate)
+)
+async def update_sale(
+    sale_id: int,
+    sale_data: SaleUpdate = Depends(msgspec_body(SaleUpdate))
+):
     """Update sale"""
     # Mock implementation
-    return Sale(
+    return _struct_response(SaleOut(
         id=sale_id,
         sale_number=f"POS2024010112000{sale_id}",
         terminal_id=1,
@@ -335,49 +468,26 @@ async def update_sale(sale_id: int, sale_data: SaleUpdate):
         discount_amount=0.0,
         total_amount=82.5,
         status=sale_data.status or "completed",
-        sale_date="2024-01-01T12:45:00Z",
+        sale_date=_mock_time(12, 45),
         notes=sale_data.notes or "Updated sale",
         items=[]
-    )
+    ))
 
 # Payment Management
-@router.get("/payments", response_model=List[Payment])
+@router.get("/payments", responses={200: {"model": List[Payment]}})
 async def get_payments(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000)
+    skip: Skip = 0,
+    limit: Limit = 100
 ):
     """Get list of payments"""
     # Mock data for now
-    return [
-        Payment(
-            id=1,
-            sale_id=1,
-            payment_method="credit_card",
-            amount=55.0,
-            status="completed",
-            transaction_id="TXN001",
-            reference_number="REF001",
-            payment_date="2024-01-01T12:00:00Z",
-            notes="Credit card payment"
-        ),
-        Payment(
-            id=2,
-            sale_id=2,
-            payment_method="cash",
-            amount=25.0,
-            status="completed",
-            transaction_id=None,
-            reference_number="CASH001",
-            payment_date="2024-01-01T12:15:00Z",
-            notes="Cash payment"
-        )
-    ]
+    return _json_response(_PAYMENTS_JSON)
 
-@router.post("/payments", response_model=Payment)
+@router.post("/payments", responses={200: {"model": Payment}})
 async def create_payment(payment_data: PaymentCreate):
     """Create a new payment"""
     # Mock implementation
-    return Payment(
+    return _struct_response(PaymentOut(
         id=3,
         sale_id=payment_data.sale_id,
         payment_method=payment_data.payment_method,
@@ -385,9 +495,9 @@ async def create_payment(payment_data: PaymentCreate):
         status="pending",
         transaction_id=payment_data.transaction_id,
         reference_number=payment_data.reference_number,
-        payment_date="2024-01-01T00:00:00Z",
+        payment_date=_mock_time(),
         notes=payment_data.notes
-    )
+    ))
 
 
 
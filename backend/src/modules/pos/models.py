@@ -1,15 +1,17 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Float, Numeric, DateTime, Boolean, Text, ForeignKey, Index, Sequence, Computed, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from pydantic import BaseModel, Field
-from typing import Optional, List
-from datetime import datetime
 import enum
 
 Base = declarative_base()
 
-# Enums
+# Sale numbers (POSYYYYMMDD000042) are assigned by the database: one nextval per
+# insert, unique by construction. Bound to the metadata so create_all creates it first.
+sale_number_seq = Sequence("pos_sale_number_seq", metadata=Base.metadata)
+
+# Enums (value sets for the plain String status/method columns below; rows
+# carry the raw strings, no per-row Enum hydration)
 class PaymentStatus(str, enum.Enum):
     PENDING = "pending"
     COMPLETED = "completed"
@@ -55,15 +57,16 @@ class CashDrawer(Base):
     __tablename__ = "pos_cash_drawers"
     
     id = Column(Integer, primary_key=True, index=True)
-    terminal_id = Column(Integer, ForeignKey("pos_terminals.id"), nullable=False)
+    terminal_id = Column(Integer, ForeignKey("pos_terminals.id"), nullable=False, index=True)
     opened_at = Column(DateTime(timezone=True), server_default=func.now())
     closed_at = Column(DateTime(timezone=True))
     opened_by = Column(String(100))
     closed_by = Column(String(100))
-    opening_amount = Column(Float, default=0.0)
-    closing_amount = Column(Float)
-    expected_amount = Column(Float)
-    difference = Column(Float)
+    opening_amount = Column(Numeric(15, 2), default=0)
+    closing_amount = Column(Numeric(15, 2))
+    expected_amount = Column(Numeric(15, 2))
+    # Maintained by the database; NULL until both amounts are recorded
+    difference = Column(Numeric(15, 2), Computed("closing_amount - expected_amount", persisted=True))
     is_open = Column(Boolean, default=True)
     
     # Relationships
@@ -71,17 +74,41 @@ class CashDrawer(Base):
 
 class Sale(Base):
     __tablename__ = "pos_sales"
+    __table_args__ = (
+        # Per-terminal reporting over a sale_date range
+        Index("ix_pos_sales_terminal_date", "terminal_id", "sale_date"),
+        # Unfiltered keyset listing, newest first via a backward scan
+        Index("ix_pos_sales_date_id", "sale_date", "id"),
+        # Dashboard/analytics totals and status-filtered listings: completed
+        # sales by date, newest first via a backward scan. id keeps keyset
+        # pages in index order; total_amount lets the totals be index-only.
+        Index(
+            "ix_pos_sales_status_date", "status", "sale_date", "id",
+            postgresql_include=["total_amount"]
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    sale_number = Column(String(50), unique=True, index=True, nullable=False)
+    sale_number = Column(
+        String(50), unique=True, index=True, nullable=False,
+        server_default=text(
+            "'POS' || to_char(now(), 'YYYYMMDD') || "
+            f"lpad(nextval('{sale_number_seq.name}')::text, 6, '0')"
+        )
+    )
     terminal_id = Column(Integer, ForeignKey("pos_terminals.id"), nullable=False)
     cashier_id = Column(String(100))
     customer_id = Column(String(100))
-    subtotal = Column(Float, nullable=False)
-    tax_amount = Column(Float, default=0.0)
-    discount_amount = Column(Float, default=0.0)
-    total_amount = Column(Float, nullable=False)
-    status = Column(SQLEnum(SaleStatus), default=SaleStatus.PENDING)
+    subtotal = Column(Numeric(15, 2), nullable=False)
+    tax_amount = Column(Numeric(15, 2), nullable=False, default=0)
+    discount_amount = Column(Numeric(15, 2), nullable=False, default=0)
+    # Maintained by the database on every insert/update
+    total_amount = Column(
+        Numeric(15, 2),
+        Computed("subtotal + tax_amount - discount_amount", persisted=True),
+        nullable=False
+    )
+    status = Column(String(20), default=SaleStatus.PENDING.value)
     sale_date = Column(DateTime(timezone=True), server_default=func.now())
     notes = Column(Text)
     
@@ -94,16 +121,16 @@ class SaleItem(Base):
     __tablename__ = "pos_sale_items"
     
     id = Column(Integer, primary_key=True, index=True)
-    sale_id = Column(Integer, ForeignKey("pos_sales.id"), nullable=False)
+    sale_id = Column(Integer, ForeignKey("pos_sales.id"), nullable=False, index=True)
     product_id = Column(String(100), nullable=False)
     product_name = Column(String(200), nullable=False)
     quantity = Column(Float, nullable=False)
-    unit_price = Column(Float, nullable=False)
-    total_price = Column(Float, nullable=False)
+    unit_price = Column(Numeric(15, 2), nullable=False)
+    total_price = Column(Numeric(15, 2), nullable=False)
     tax_rate = Column(Float, default=0.0)
-    tax_amount = Column(Float, default=0.0)
+    tax_amount = Column(Numeric(15, 2), default=0)
     discount_rate = Column(Float, default=0.0)
-    discount_amount = Column(Float, default=0.0)
+    discount_amount = Column(Numeric(15, 2), default=0)
     
     # Relationships
     sale = relationship("Sale", back_populates="items")
@@ -112,10 +139,10 @@ class Payment(Base):
     __tablename__ = "pos_payments"
     
     id = Column(Integer, primary_key=True, index=True)
-    sale_id = Column(Integer, ForeignKey("pos_sales.id"), nullable=False)
-    payment_method = Column(SQLEnum(PaymentMethod), nullable=False)
-    amount = Column(Float, nullable=False)
-    status = Column(SQLEnum(PaymentStatus), default=PaymentStatus.PENDING)
+    sale_id = Column(Integer, ForeignKey("pos_sales.id"), nullable=False, index=True)
+    payment_method = Column(String(20), nullable=False)
+    amount = Column(Numeric(15, 2), nullable=False)
+    status = Column(String(20), default=PaymentStatus.PENDING.value)
     transaction_id = Column(String(200))
     reference_number = Column(String(100))
     payment_date = Column(DateTime(timezone=True), server_default=func.now())
@@ -130,7 +157,7 @@ class TaxRate(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
     rate = Column(Float, nullable=False)
-    tax_type = Column(SQLEnum(TaxType), nullable=False)
+    tax_type = Column(String(20), nullable=False)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
@@ -141,190 +168,10 @@ class Discount(Base):
     name = Column(String(100), nullable=False)
     code = Column(String(50), unique=True, index=True)
     discount_type = Column(String(20), nullable=False)  # percentage, fixed
-    discount_value = Column(Float, nullable=False)
-    minimum_amount = Column(Float)
-    maximum_discount = Column(Float)
+    discount_value = Column(Numeric(15, 2), nullable=False)
+    minimum_amount = Column(Numeric(15, 2))
+    maximum_discount = Column(Numeric(15, 2))
     is_active = Column(Boolean, default=True)
     valid_from = Column(DateTime(timezone=True))
     valid_to = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-
-# Pydantic Models
-class TerminalBase(BaseModel):
-    terminal_id: str
-    name: str
-    location: Optional[str] = None
-    is_active: bool = True
-
-class TerminalCreate(TerminalBase):
-    pass
-
-class TerminalUpdate(BaseModel):
-    name: Optional[str] = None
-    location: Optional[str] = None
-    is_active: Optional[bool] = None
-
-class Terminal(TerminalBase):
-    id: int
-    created_at: datetime
-    updated_at: Optional[datetime] = None
-    
-    class Config:
-        from_attributes = True
-
-class CashDrawerBase(BaseModel):
-    terminal_id: int
-    opened_by: Optional[str] = None
-    opening_amount: float = 0.0
-
-class CashDrawerCreate(CashDrawerBase):
-    pass
-
-class CashDrawerUpdate(BaseModel):
-    closed_by: Optional[str] = None
-    closing_amount: Optional[float] = None
-    expected_amount: Optional[float] = None
-    is_open: Optional[bool] = None
-
-class CashDrawer(CashDrawerBase):
-    id: int
-    opened_at: datetime
-    closed_at: Optional[datetime] = None
-    closed_by: Optional[str] = None
-    closing_amount: Optional[float] = None
-    expected_amount: Optional[float] = None
-    difference: Optional[float] = None
-    is_open: bool = True
-    
-    class Config:
-        from_attributes = True
-
-class SaleItemBase(BaseModel):
-    product_id: str
-    product_name: str
-    quantity: float
-    unit_price: float
-    tax_rate: float = 0.0
-    discount_rate: float = 0.0
-
-class SaleItemCreate(SaleItemBase):
-    pass
-
-class SaleItem(SaleItemBase):
-    id: int
-    sale_id: int
-    total_price: float
-    tax_amount: float
-    discount_amount: float
-    
-    class Config:
-        from_attributes = True
-
-class SaleBase(BaseModel):
-    terminal_id: int
-    cashier_id: Optional[str] = None
-    customer_id: Optional[str] = None
-    notes: Optional[str] = None
-
-class SaleCreate(SaleBase):
-    items: List[SaleItemCreate]
-
-class SaleUpdate(BaseModel):
-    status: Optional[SaleStatus] = None
-    notes: Optional[str] = None
-
-class Sale(SaleBase):
-    id: int
-    sale_number: str
-    subtotal: float
-    tax_amount: float
-    discount_amount: float
-    total_amount: float
-    status: SaleStatus
-    sale_date: datetime
-    items: List[SaleItem] = []
-    
-    class Config:
-        from_attributes = True
-
-class PaymentBase(BaseModel):
-    payment_method: PaymentMethod
-    amount: float
-    transaction_id: Optional[str] = None
-    reference_number: Optional[str] = None
-    notes: Optional[str] = None
-
-class PaymentCreate(PaymentBase):
-    sale_id: int
-
-class PaymentUpdate(BaseModel):
-    status: Optional[PaymentStatus] = None
-    transaction_id: Optional[str] = None
-    reference_number: Optional[str] = None
-    notes: Optional[str] = None
-
-class Payment(PaymentBase):
-    id: int
-    sale_id: int
-    status: PaymentStatus
-    payment_date: datetime
-    
-    class Config:
-        from_attributes = True
-
-class TaxRateBase(BaseModel):
-    name: str
-    rate: float
-    tax_type: TaxType
-    is_active: bool = True
-
-class TaxRateCreate(TaxRateBase):
-    pass
-
-class TaxRateUpdate(BaseModel):
-    name: Optional[str] = None
-    rate: Optional[float] = None
-    tax_type: Optional[TaxType] = None
-    is_active: Optional[bool] = None
-
-class TaxRate(TaxRateBase):
-    id: int
-    created_at: datetime
-    
-    class Config:
-        from_attributes = True
-
-class DiscountBase(BaseModel):
-    name: str
-    code: Optional[str] = None
-    discount_type: str
-    discount_value: float
-    minimum_amount: Optional[float] = None
-    maximum_discount: Optional[float] = None
-    is_active: bool = True
-    valid_from: Optional[datetime] = None
-    valid_to: Optional[datetime] = None
-
-class DiscountCreate(DiscountBase):
-    pass
-
-class DiscountUpdate(BaseModel):
-    name: Optional[str] = None
-    code: Optional[str] = None
-    discount_type: Optional[str] = None
-    discount_value: Optional[float] = None
-    minimum_amount: Optional[float] = None
-    maximum_discount: Optional[float] = None
-    is_active: Optional[bool] = None
-    valid_from: Optional[datetime] = None
-    valid_to: Optional[datetime] = None
-
-class Discount(DiscountBase):
-    id: int
-    created_at: datetime
-    
-    class Config:
-        from_attributes = True
-
-
-
@@ -1,15 +1,225 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Dict, Optional, List, Literal, Union
 from datetime import datetime
-from .models import (
-    PaymentStatus, PaymentMethod, SaleStatus, TaxType,
-    Terminal, TerminalCreate, TerminalUpdate,
-    CashDrawer, CashDrawerCreate, CashDrawerUpdate,
-    Sale, SaleCreate, SaleUpdate, SaleItem,
-    Payment, PaymentCreate, PaymentUpdate,
-    TaxRate, TaxRateCreate, TaxRateUpdate,
-    Discount, DiscountCreate, DiscountUpdate
-)
+import msgspec
+from msgspec import UNSET, UnsetType
+
+# Status/method values are plain strings end to end (String columns), validated
+# as literal value sets. Keep in sync with the enums in models.py.
+SaleStatus = Literal["pending", "completed", "cancelled", "refunded"]
+PaymentStatus = Literal["pending", "completed", "failed", "refunded"]
+PaymentMethod = Literal["cash", "credit_card", "debit_card", "mobile_payment", "check"]
+TaxType = Literal["sales_tax", "vat", "gst", "exempt"]
+
+# Partial updates are msgspec structs: fields the client did not send stay
+# UNSET (an explicit null is kept as None), so no per-field validation model
+# is built for the usual handful of changed fields.
+def set_fields(patch: msgspec.Struct) -> Dict[str, Any]:
+    """Fields present in a partial update, like model_dump(exclude_unset=True)"""
+    return {
+        name: value
+        for name, value in msgspec.structs.asdict(patch).items()
+        if value is not UNSET
+    }
+
+# Shared by the response models. They are built once per returned row and
+# only serialized afterwards, so they are frozen.
+_RESPONSE_CONFIG = ConfigDict(from_attributes=True, frozen=True)
+
+# Pydantic Models
+class TerminalBase(BaseModel):
+    terminal_id: str
+    name: str
+    location: Optional[str] = None
+    is_active: bool = True
+
+class TerminalCreate(TerminalBase):
+    pass
+
+class TerminalUpdate(msgspec.Struct, kw_only=True):
+    name: Union[Optional[str], UnsetType] = UNSET
+    location: Union[Optional[str], UnsetType] = UNSET
+    is_active: Union[Optional[bool], UnsetType] = UNSET
+
+class Terminal(TerminalBase):
+    id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    model_config = _RESPONSE_CONFIG
+
+class CashDrawerBase(BaseModel):
+    terminal_id: int
+    opened_by: Optional[str] = None
+    opening_amount: float = 0.0
+
+class CashDrawerCreate(CashDrawerBase):
+    pass
+
+class CashDrawerUpdate(msgspec.Struct, kw_only=True):
+    closed_by: Union[Optional[str], UnsetType] = UNSET
+    closing_amount: Union[Optional[float], UnsetType] = UNSET
+    expected_amount: Union[Optional[float], UnsetType] = UNSET
+    is_open: Union[Optional[bool], UnsetType] = UNSET
+
+class CashDrawer(CashDrawerBase):
+    id: int
+    opened_at: datetime
+    closed_at: Optional[datetime] = None
+    closed_by: Optional[str] = None
+    closing_amount: Optional[float] = None
+    expected_amount: Optional[float] = None
+    difference: Optional[float] = None
+    is_open: bool = True
+
+    model_config = _RESPONSE_CONFIG
+
+class SaleItemBase(BaseModel):
+    product_id: str
+    product_name: str
+    quantity: float
+    unit_price: float
+    tax_rate: float = 0.0
+    discount_rate: float = 0.0
+
+class SaleItemCreate(SaleItemBase):
+    pass
+
+class SaleItem(SaleItemBase):
+    id: int
+    sale_id: int
+    total_price: float
+    tax_amount: float
+    discount_amount: float
+
+    model_config = _RESPONSE_CONFIG
+
+class SaleBase(BaseModel):
+    terminal_id: int
+    cashier_id: Optional[str] = None
+    customer_id: Optional[str] = None
+    notes: Optional[str] = None
+
+class SaleCreate(SaleBase):
+    items: List[SaleItemCreate]
+
+class SaleUpdate(msgspec.Struct, kw_only=True):
+    status: Union[Optional[SaleStatus], UnsetType] = UNSET
+    notes: Union[Optional[str], UnsetType] = UNSET
+
+class Sale(SaleBase):
+    id: int
+    sale_number: str
+    subtotal: float
+    tax_amount: float
+    discount_amount: float
+    total_amount: float
+    status: SaleStatus
+    sale_date: datetime
+    items: List[SaleItem] = []
+
+    model_config = _RESPONSE_CONFIG
+
+class PaymentBase(BaseModel):
+    payment_method: PaymentMethod
+    amount: float
+    transaction_id: Optional[str] = None
+    reference_number: Optional[str] = None
+    notes: Optional[str] = None
+
+class PaymentCreate(PaymentBase):
+    sale_id: int
+
+class PaymentUpdate(msgspec.Struct, kw_only=True):
+    status: Union[Optional[PaymentStatus], UnsetType] = UNSET
+    transaction_id: Union[Optional[str], UnsetType] = UNSET
+    reference_number: Union[Optional[str], UnsetType] = UNSET
+    notes: Union[Optional[str], UnsetType] = UNSET
+
+class Payment(PaymentBase):
+    id: int
+    sale_id: int
+    status: PaymentStatus
+    payment_date: datetime
+
+    model_config = _RESPONSE_CONFIG
+
+class TaxRateBase(BaseModel):
+    name: str
+    rate: float
+    tax_type: TaxType
+    is_active: bool = True
+
+class TaxRateCreate(TaxRateBase):
+    pass
+
+class TaxRateUpdate(msgspec.Struct, kw_only=True):
+    name: Union[Optional[str], UnsetType] = UNSET
+    rate: Union[Optional[float], UnsetType] = UNSET
+    tax_type: Union[Optional[TaxType], UnsetType] = UNSET
+    is_active: Union[Optional[bool], UnsetType] = UNSET
+
+class TaxRate(TaxRateBase):
+    id: int
+    created_at: datetime
+
+    model_config = _RESPONSE_CONFIG
+
+class DiscountBase(BaseModel):
+    name: str
+    code: Optional[str] = None
+    discount_type: str
+    discount_value: float
+    minimum_amount: Optional[float] = None
+    maximum_discount: Optional[float] = None
+    is_active: bool = True
+    valid_from: Optional[datetime] = None
+    valid_to: Optional[datetime] = None
+
+class DiscountCreate(DiscountBase):
+    pass
+
+class DiscountUpdate(msgspec.Struct, kw_only=True):
+    name: Union[Optional[str], UnsetType] = UNSET
+    code: Union[Optional[str], UnsetType] = UNSET
+    discount_type: Union[Optional[str], UnsetType] = UNSET
+    discount_value: Union[Optional[float], UnsetType] = UNSET
+    minimum_amount: Union[Optional[float], UnsetType] = UNSET
+    maximum_discount: Union[Optional[float], UnsetType] = UNSET
+    is_active: Union[Optional[bool], UnsetType] = UNSET
+    valid_from: Union[Optional[datetime], UnsetType] = UNSET
+    valid_to: Union[Optional[datetime], UnsetType] = UNSET
+
+class Discount(DiscountBase):
+    id: int
+    created_at: datetime
+
+    model_config = _RESPONSE_CONFIG
+
+# Read-side DTOs
+# Pydantic models above parse and validate request bodies and define the
+# response shape. Responses built from trusted data (DB rows, mocks) are
+# encoded through msgspec structs generated from those models, which write
+# JSON/MessagePack without a validation pass.
+def _out_struct(model: type[BaseModel], **annotations: Any) -> type[msgspec.Struct]:
+    """msgspec struct with a response model's fields (names, order, types, defaults).
+
+    ``annotations`` replaces field types, e.g. to nest another generated struct.
+    """
+    fields = []
+    for name, field in model.model_fields.items():
+        annotation = annotations.get(name, field.annotation)
+        if field.is_required():
+            fields.append((name, annotation))
+        else:
+            fields.append((name, annotation, field.default))
+    return msgspec.defstruct(f"{model.__name__}Out", fields, kw_only=True, module=__name__)
+
+TerminalOut = _out_struct(Terminal)
+CashDrawerOut = _out_struct(CashDrawer)
+SaleItemOut = _out_struct(SaleItem)
+SaleOut = _out_struct(Sale, items=List[SaleItemOut])
+PaymentOut = _out_struct(Payment)
 
 # Dashboard and Analytics Schemas
 class POSDashboardStats(BaseModel):
@@ -60,6 +270,8 @@ __all__ = [
     "CashDrawer", "CashDrawerCreate", "CashDrawerUpdate", 
     "Sale", "SaleCreate", "SaleUpdate", "SaleItem",
     "Payment", "PaymentCreate", "PaymentUpdate",
+    "set_fields",
+    "TerminalOut", "CashDrawerOut", "SaleOut", "SaleItemOut", "PaymentOut",
     "TaxRate", "TaxRateCreate", "TaxRateUpdate",
     "Discount", "DiscountCreate", "DiscountUpdate"
 ]
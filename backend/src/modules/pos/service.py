@@ -1,7 +1,11 @@
-from typing import List, Optional, Dict, Any
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
-from datetime import datetime, timedelta
+import asyncio
+import base64
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import selectinload
+from sqlalchemy import select, insert, update, bindparam, func, and_, or_, desc, tuple_
+from datetime import date, datetime, time, timedelta
+from ...core.redis import CacheManager
 from .models import (
     Terminal, CashDrawer, Sale, SaleItem, Payment, TaxRate, Discount,
     SaleStatus, PaymentStatus, PaymentMethod, TaxType
@@ -10,35 +14,156 @@ from .schemas import (
     TerminalCreate, TerminalUpdate, CashDrawerCreate, CashDrawerUpdate,
     SaleCreate, SaleUpdate, PaymentCreate, PaymentUpdate,
     TaxRateCreate, TaxRateUpdate, DiscountCreate, DiscountUpdate,
-    POSDashboardStats, POSAnalytics, TerminalStatus, SaleSummary
+    POSDashboardStats, POSAnalytics, TerminalStatus, SaleSummary, set_fields
 )
 
+ANALYTICS_CACHE_KEY = "pos:analytics:{period_days}"
+CACHE_TTL_SECONDS = 60
+# Dashboards are polled every few seconds; keep today's stats fresher
+DASHBOARD_CACHE_KEY = "pos:dashboard:{day}"
+DASHBOARD_CACHE_TTL_SECONDS = 15
+TOP_PRODUCTS_LIMIT = 5
+
+# Columns served by the sale list view. Rows are turned straight into dicts
+# rather than loaded as ORM entities and validated through Pydantic.
+SALE_COLUMNS = (
+    Sale.id, Sale.sale_number, Sale.terminal_id, Sale.cashier_id, Sale.customer_id,
+    Sale.subtotal, Sale.tax_amount, Sale.discount_amount, Sale.total_amount,
+    Sale.status, Sale.sale_date, Sale.notes,
+)
+_SALE_MONEY_FIELDS = ("subtotal", "tax_amount", "discount_amount", "total_amount")
+# Same treatment for the payment list view
+PAYMENT_COLUMNS = (
+    Payment.id, Payment.sale_id, Payment.payment_method, Payment.amount, Payment.status,
+    Payment.transaction_id, Payment.reference_number, Payment.payment_date, Payment.notes,
+)
+_PAYMENT_MONEY_FIELDS = ("amount",)
+
+
+def _sale_cursor(sale: Dict[str, Any]) -> str:
+    """Opaque, URL-safe keyset cursor for the (sale_date, id) of a listed sale"""
+    position = f"{sale['sale_date'].isoformat()}_{sale['id']}"
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+
+def _parse_sale_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor from _sale_cursor; anything malformed raises ValueError"""
+    try:
+        sale_date, _, sale_id = base64.urlsafe_b64decode(cursor.encode()).decode().rpartition("_")
+        return datetime.fromisoformat(sale_date), int(sale_id)
+    except ValueError:  # also covers binascii.Error and UnicodeDecodeError
+        raise ValueError("Invalid sale cursor") from None
+
+
+def _row_to_dict(row, money_fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """Plain dict for a list-view row; Numeric money comes back as float."""
+    data = dict(row._mapping)
+    for field in money_fields:
+        if data[field] is not None:
+            data[field] = float(data[field])
+    return data
+
+def _method_label(method: str) -> str:
+    """Display name for a payment_method value, e.g. 'credit_card' -> 'Credit Card'"""
+    return method.replace("_", " ").title()
+
+
+# Dashboard and analytics statements are built once at import and bound per
+# call with :start/:end, so polling doesn't rebuild the same expression trees.
+# Completed sales in the half-open [start, end) range.
+_COMPLETED_IN_PERIOD = (
+    Sale.sale_date >= bindparam("start"),
+    Sale.sale_date < bindparam("end"),
+    Sale.status == SaleStatus.COMPLETED,
+)
+
+
+def _hourly_revenue_statement():
+    """Completed-sale revenue per hour bucket, from one GROUP BY"""
+    bucket = func.date_trunc("hour", Sale.sale_date, type_=Sale.sale_date.type).label("bucket")
+    return select(bucket, func.sum(Sale.total_amount)).where(*_COMPLETED_IN_PERIOD).group_by(bucket)
+
+
+def _top_products_statement():
+    """Best-selling products by revenue over completed sales in the period"""
+    revenue = func.sum(SaleItem.total_price).label("revenue")
+    return (
+        select(SaleItem.product_name, func.sum(SaleItem.quantity).label("quantity"), revenue)
+        .join(Sale, SaleItem.sale_id == Sale.id)
+        .where(*_COMPLETED_IN_PERIOD)
+        .group_by(SaleItem.product_name)
+        .order_by(desc(revenue))
+        .limit(TOP_PRODUCTS_LIMIT)
+    )
+
+
+def _payment_methods_statement():
+    """Completed payments on completed sales in the period, grouped by method"""
+    amount = func.sum(Payment.amount).label("amount")
+    return (
+        select(Payment.payment_method, func.count(Payment.id).label("count"), amount)
+        .join(Sale, Payment.sale_id == Sale.id)
+        .where(*_COMPLETED_IN_PERIOD, Payment.status == PaymentStatus.COMPLETED)
+        .group_by(Payment.payment_method)
+        .order_by(desc(amount))
+    )
+
+
+def _terminal_performance_statement():
+    """Completed sales per terminal, aggregated on the integer FK before
+    joining Terminal for its display code"""
+    per_terminal = (
+        select(
+            Sale.terminal_id,
+            func.count(Sale.id).label("sales_count"),
+            func.sum(Sale.total_amount).label("revenue"),
+        )
+        .where(*_COMPLETED_IN_PERIOD)
+        .group_by(Sale.terminal_id)
+        .subquery()
+    )
+    return (
+        select(Terminal.terminal_id, per_terminal.c.sales_count, per_terminal.c.revenue)
+        .join(per_terminal, Terminal.id == per_terminal.c.terminal_id)
+        .order_by(desc(per_terminal.c.revenue))
+    )
+
+
+# Total revenue and transactions, in one pass
+_PERIOD_TOTALS = select(
+    func.coalesce(func.sum(Sale.total_amount), 0), func.count(Sale.id)
+).where(*_COMPLETED_IN_PERIOD)
+_HOURLY_REVENUE = _hourly_revenue_statement()
+_TOP_PRODUCTS = _top_products_statement()
+_PAYMENT_METHODS = _payment_methods_statement()
+_TERMINAL_PERFORMANCE = _terminal_performance_statement()
+
 class POSService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, cache: Optional[CacheManager] = None):
         self.db = db
+        self.cache = cache
 
     # Dashboard and Analytics
     async def get_dashboard_stats(self) -> POSDashboardStats:
-        """Get POS dashboard statistics"""
+        """Get POS dashboard statistics (cached briefly per day)"""
         today = datetime.now().date()
+        cache_key = DASHBOARD_CACHE_KEY.format(day=today.isoformat())
+        if self.cache is not None:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return POSDashboardStats.model_validate(cached)
+
+        # Half-open range so the planner can use the sale_date index
+        today_start = datetime.combine(today, time.min)
+        tomorrow_start = today_start + timedelta(days=1)
         
-        # Total sales today
-        sales_today_result = await self.db.execute(
-            select(func.sum(Sale.total_amount)).where(
-                func.date(Sale.sale_date) == today,
-                Sale.status == SaleStatus.COMPLETED
-            )
-        )
-        total_sales_today = sales_today_result.scalar() or 0.0
-        
-        # Total transactions today
-        transactions_today_result = await self.db.execute(
-            select(func.count(Sale.id)).where(
-                func.date(Sale.sale_date) == today,
-                Sale.status == SaleStatus.COMPLETED
-            )
+        # The aggregates are independent, so run them concurrently
+        totals, product_rows, method_rows, terminal_rows = await self._execute_concurrently(
+            _PERIOD_TOTALS, _TOP_PRODUCTS, _PAYMENT_METHODS, _TERMINAL_PERFORMANCE,
+            params={"start": today_start, "end": tomorrow_start},
         )
-        total_transactions_today = transactions_today_result.scalar() or 0
+        sales_today, total_transactions_today = totals[0]
+        total_sales_today = float(sales_today)
         
         # Average transaction value
         average_transaction_value = (
@@ -46,28 +171,21 @@ class POSService:
             if total_transactions_today > 0 else 0.0
         )
         
-        # Top selling products (mock data for now)
         top_selling_products = [
-            {"product_name": "Product A", "quantity_sold": 45, "revenue": 2250.0},
-            {"product_name": "Product B", "quantity_sold": 32, "revenue": 1600.0},
-            {"product_name": "Product C", "quantity_sold": 28, "revenue": 1400.0}
+            {"product_name": name, "quantity_sold": float(quantity), "revenue": float(revenue)}
+            for name, quantity, revenue in product_rows
         ]
-        
-        # Payment methods breakdown (mock data for now)
+        # Display names are only built for the few grouped rows
         payment_methods_breakdown = [
-            {"method": "Cash", "count": 25, "amount": 1250.0},
-            {"method": "Credit Card", "count": 18, "amount": 900.0},
-            {"method": "Debit Card", "count": 12, "amount": 600.0}
+            {"method": _method_label(method), "count": count, "amount": float(amount)}
+            for method, count, amount in method_rows
         ]
-        
-        # Terminal performance (mock data for now)
         terminal_performance = [
-            {"terminal_id": "T001", "sales_count": 35, "revenue": 1750.0},
-            {"terminal_id": "T002", "sales_count": 28, "revenue": 1400.0},
-            {"terminal_id": "T003", "sales_count": 22, "revenue": 1100.0}
+            {"terminal_id": terminal_id, "sales_count": sales_count, "revenue": float(revenue)}
+            for terminal_id, sales_count, revenue in terminal_rows
         ]
         
-        return POSDashboardStats(
+        stats = POSDashboardStats(
             total_sales_today=total_sales_today,
             total_transactions_today=total_transactions_today,
             average_transaction_value=average_transaction_value,
@@ -75,31 +193,33 @@ class POSService:
             payment_methods_breakdown=payment_methods_breakdown,
             terminal_performance=terminal_performance
         )
+        if self.cache is not None:
+            await self.cache.set(cache_key, stats.model_dump(mode="json"), ttl=DASHBOARD_CACHE_TTL_SECONDS)
+        return stats
+
+    async def _invalidate_dashboard(self) -> None:
+        """Drop today's cached dashboard stats after a sale changes"""
+        if self.cache is not None:
+            await self.cache.delete(DASHBOARD_CACHE_KEY.format(day=datetime.now().date().isoformat()))
 
     async def get_analytics(self, period_days: int = 30) -> POSAnalytics:
-        """Get POS analytics for specified period"""
+        """Get POS analytics for specified period (cached briefly per period)"""
+        cache_key = ANALYTICS_CACHE_KEY.format(period_days=period_days)
+        if self.cache is not None:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return POSAnalytics.model_validate(cached)
+
         end_date = datetime.now()
         start_date = end_date - timedelta(days=period_days)
         
-        # Total revenue for period
-        revenue_result = await self.db.execute(
-            select(func.sum(Sale.total_amount)).where(
-                Sale.sale_date >= start_date,
-                Sale.sale_date <= end_date,
-                Sale.status == SaleStatus.COMPLETED
-            )
-        )
-        total_revenue = revenue_result.scalar() or 0.0
-        
-        # Total transactions for period
-        transactions_result = await self.db.execute(
-            select(func.count(Sale.id)).where(
-                Sale.sale_date >= start_date,
-                Sale.sale_date <= end_date,
-                Sale.status == SaleStatus.COMPLETED
-            )
+        # The aggregates are independent, so run them concurrently
+        totals, hourly_rows, product_rows, method_rows = await self._execute_concurrently(
+            _PERIOD_TOTALS, _HOURLY_REVENUE, _TOP_PRODUCTS, _PAYMENT_METHODS,
+            params={"start": start_date, "end": end_date},
         )
-        total_transactions = transactions_result.scalar() or 0
+        revenue, total_transactions = totals[0]
+        total_revenue = float(revenue)
         
         # Average transaction value
         average_transaction_value = (
@@ -107,37 +227,94 @@ class POSService:
             if total_transactions > 0 else 0.0
         )
         
-        # Mock analytics data
-        sales_by_hour = [
-            {"hour": f"{i:02d}:00", "sales": 100 + i * 10} for i in range(24)
-        ]
-        
-        sales_by_day = [
-            {"day": f"Day {i+1}", "revenue": 500 + i * 100} for i in range(7)
-        ]
-        
-        top_products = [
-            {"product_name": "Product A", "quantity": 150, "revenue": 7500.0},
-            {"product_name": "Product B", "quantity": 120, "revenue": 6000.0},
-            {"product_name": "Product C", "quantity": 95, "revenue": 4750.0}
-        ]
-        
-        payment_methods = [
-            {"method": "Cash", "percentage": 45, "amount": total_revenue * 0.45},
-            {"method": "Credit Card", "percentage": 35, "amount": total_revenue * 0.35},
-            {"method": "Debit Card", "percentage": 20, "amount": total_revenue * 0.20}
-        ]
+        sales_by_hour, sales_by_day = self._sales_by_hour_and_day(hourly_rows)
         
-        return POSAnalytics(
+        analytics = POSAnalytics(
             period=f"{period_days} days",
             total_revenue=total_revenue,
             total_transactions=total_transactions,
             average_transaction_value=average_transaction_value,
             sales_by_hour=sales_by_hour,
             sales_by_day=sales_by_day,
-            top_products=top_products,
-            payment_methods=payment_methods
+            top_products=self._top_products(product_rows),
+            payment_methods=self._payment_methods(method_rows)
+        )
+        if self.cache is not None:
+            await self.cache.set(cache_key, analytics.model_dump(mode="json"), ttl=CACHE_TTL_SECONDS)
+        return analytics
+
+    async def _execute_concurrently(self, *queries, params: Optional[Dict[str, Any]] = None) -> List[list]:
+        """Run independent read-only queries concurrently and return their rows.
+
+        An AsyncSession cannot run statements concurrently, so each query gets
+        its own short-lived session bound to the same engine.
+        """
+        session_factory = async_sessionmaker(bind=self.db.bind, expire_on_commit=False)
+
+        async def fetch(query):
+            async with session_factory() as session:
+                return (await session.execute(query, params)).all()
+
+        return await asyncio.gather(*(fetch(query) for query in queries))
+
+    @staticmethod
+    def _sales_by_hour_and_day(rows) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Fold hourly revenue buckets into per-hour-of-day and per-day series"""
+        by_hour = [0.0] * 24
+        by_day: Dict[date, float] = {}
+        for hour_start, revenue in rows:
+            revenue = float(revenue)
+            by_hour[hour_start.hour] += revenue
+            by_day[hour_start.date()] = by_day.get(hour_start.date(), 0.0) + revenue
+
+        sales_by_hour = [
+            {"hour": f"{hour:02d}:00", "sales": round(revenue, 2)}
+            for hour, revenue in enumerate(by_hour)
+        ]
+        sales_by_day = [
+            {"day": day, "revenue": round(revenue, 2)}
+            for day, revenue in sorted(by_day.items())
+        ]
+        return sales_by_hour, sales_by_day
+
+    @staticmethod
+    def _top_products(rows) -> List[Dict[str, Any]]:
+        return [
+            {"product_name": name, "quantity": float(quantity), "revenue": float(total)}
+            for name, quantity, total in rows
+        ]
+
+    @staticmethod
+    def _payment_methods(rows) -> List[Dict[str, Any]]:
+        totals = [(method, float(total)) for method, _, total in rows]
+        paid = sum(total for _, total in totals)
+        return [
+            {
+                "method": _method_label(method),
+                "percentage": round(total / paid * 100, 1) if paid else 0.0,
+                "amount": round(total, 2),
+            }
+            for method, total in totals
+        ]
+
+    async def _update_returning(self, model, row_id: int, values: Dict[str, Any], *options):
+        """Apply ``values`` to one row and return it, or None if it doesn't exist.
+
+        A single UPDATE ... RETURNING replaces SELECT, setattr, commit and refresh.
+        ``options`` are loader options (e.g. selectinload) applied to the
+        returned row, so it comes back in the same shape as the matching get_*.
+        """
+        result = await self.db.execute(
+            update(model).where(model.id == row_id).values(**values)
+            .returning(model).options(*options)
+            .execution_options(populate_existing=True)
         )
+        row = result.scalar_one_or_none()
+        if row is None:
+            return None
+        
+        await self.db.commit()
+        return row
 
     # Terminal Management
     async def create_terminal(self, terminal_data: TerminalCreate) -> Terminal:
@@ -164,17 +341,11 @@ class POSService:
 
     async def update_terminal(self, terminal_id: int, terminal_data: TerminalUpdate) -> Optional[Terminal]:
         """Update terminal"""
-        terminal = await self.get_terminal(terminal_id)
-        if not terminal:
-            return None
+        update_data = set_fields(terminal_data)
+        if not update_data:
+            return await self.get_terminal(terminal_id)
         
-        update_data = terminal_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(terminal, field, value)
-        
-        await self.db.commit()
-        await self.db.refresh(terminal)
-        return terminal
+        return await self._update_returning(Terminal, terminal_id, update_data)
 
     async def delete_terminal(self, terminal_id: int) -> bool:
         """Delete terminal"""
@@ -197,23 +368,12 @@ class POSService:
 
     async def close_cash_drawer(self, drawer_id: int, drawer_data: CashDrawerUpdate) -> Optional[CashDrawer]:
         """Close cash drawer"""
-        drawer = await self.db.get(CashDrawer, drawer_id)
-        if not drawer:
-            return None
-        
-        update_data = drawer_data.model_dump(exclude_unset=True)
-        update_data['closed_at'] = datetime.now()
+        update_data = set_fields(drawer_data)
+        update_data['closed_at'] = func.now()  # same clock as opened_at's server default
         update_data['is_open'] = False
         
-        if update_data.get('closing_amount') and update_data.get('expected_amount'):
-            update_data['difference'] = update_data['closing_amount'] - update_data['expected_amount']
-        
-        for field, value in update_data.items():
-            setattr(drawer, field, value)
-        
-        await self.db.commit()
-        await self.db.refresh(drawer)
-        return drawer
+        # difference is a generated column and comes back via RETURNING
+        return await self._update_returning(CashDrawer, drawer_id, update_data)
 
     async def get_cash_drawers(self, skip: int = 0, limit: int = 100) -> List[CashDrawer]:
         """Get list of cash drawers"""
@@ -224,78 +384,95 @@ class POSService:
 
     # Sale Management
     async def create_sale(self, sale_data: SaleCreate) -> Sale:
-        """Create a new sale"""
-        # Generate sale number
-        sale_number = f"POS{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        
-        # Calculate totals
-        subtotal = sum(item.quantity * item.unit_price for item in sale_data.items)
-        tax_amount = sum(item.quantity * item.unit_price * item.tax_rate for item in sale_data.items)
-        discount_amount = sum(item.quantity * item.unit_price * item.discount_rate for item in sale_data.items)
-        total_amount = subtotal + tax_amount - discount_amount
+        """Create a new sale (sale_number is assigned by the DB)"""
+        # Price each line once: (item, line total, tax, discount)
+        lines = []
+        for item in sale_data.items:
+            line_total = item.quantity * item.unit_price
+            lines.append((item, line_total, line_total * item.tax_rate, line_total * item.discount_rate))
         
-        # Create sale
+        # Create sale (total_amount is a generated column)
         sale = Sale(
-            sale_number=sale_number,
             terminal_id=sale_data.terminal_id,
             cashier_id=sale_data.cashier_id,
             customer_id=sale_data.customer_id,
-            subtotal=subtotal,
-            tax_amount=tax_amount,
-            discount_amount=discount_amount,
-            total_amount=total_amount,
+            subtotal=sum(line[1] for line in lines),
+            tax_amount=sum(line[2] for line in lines),
+            discount_amount=sum(line[3] for line in lines),
             notes=sale_data.notes
         )
         
         self.db.add(sale)
         await self.db.flush()  # Get the sale ID
         
-        # Create sale items
-        for item_data in sale_data.items:
-            item = SaleItem(
-                sale_id=sale.id,
-                product_id=item_data.product_id,
-                product_name=item_data.product_name,
-                quantity=item_data.quantity,
-                unit_price=item_data.unit_price,
-                total_price=item_data.quantity * item_data.unit_price,
-                tax_rate=item_data.tax_rate,
-                tax_amount=item_data.quantity * item_data.unit_price * item_data.tax_rate,
-                discount_rate=item_data.discount_rate,
-                discount_amount=item_data.quantity * item_data.unit_price * item_data.discount_rate
+        # Create sale items in one multi-row INSERT
+        if lines:
+            await self.db.execute(
+                insert(SaleItem),
+                [
+                    {
+                        "sale_id": sale.id,
+                        "product_id": item_data.product_id,
+                        "product_name": item_data.product_name,
+                        "quantity": item_data.quantity,
+                        "unit_price": item_data.unit_price,
+                        "total_price": line_total,
+                        "tax_rate": item_data.tax_rate,
+                        "tax_amount": line_tax,
+                        "discount_rate": item_data.discount_rate,
+                        "discount_amount": line_discount,
+                    }
+                    for item_data, line_total, line_tax, line_discount in lines
+                ],
             )
-            self.db.add(item)
         
         await self.db.commit()
+        await self._invalidate_dashboard()
         await self.db.refresh(sale)
         return sale
 
-    async def get_sales(self, skip: int = 0, limit: int = 100) -> List[Sale]:
-        """Get list of sales"""
-        result = await self.db.execute(
-            select(Sale).offset(skip).limit(limit).order_by(Sale.sale_date.desc())
-        )
-        return result.scalars().all()
+    async def get_sales(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Get a page of sales (newest first) as plain dicts, ready to encode.
+
+        Pass the returned cursor back to fetch the next page; it seeks past the
+        last row via (sale_date, id) instead of scanning skipped rows with
+        OFFSET. ``skip`` is only applied when no cursor is given. The cursor is
+        None on the last page. The listing walks the (sale_date, id) index, or
+        (status, sale_date, id) when filtering by ``status``, in order with no
+        sort step. A malformed cursor raises ValueError.
+        """
+        query = select(*SALE_COLUMNS).order_by(Sale.sale_date.desc(), Sale.id.desc()).limit(limit)
+        if status:
+            query = query.where(Sale.status == status)
+        if cursor:
+            query = query.where(tuple_(Sale.sale_date, Sale.id) < _parse_sale_cursor(cursor))
+        elif skip:
+            query = query.offset(skip)
+
+        result = await self.db.execute(query)
+        sales = [_row_to_dict(row, _SALE_MONEY_FIELDS) for row in result]
+        next_cursor = _sale_cursor(sales[-1]) if len(sales) == limit else None
+        return sales, next_cursor
 
     async def get_sale(self, sale_id: int) -> Optional[Sale]:
-        """Get sale by ID"""
+        """Get sale by ID, with its line items loaded for serialization"""
         result = await self.db.execute(
-            select(Sale).where(Sale.id == sale_id)
+            select(Sale).options(selectinload(Sale.items)).where(Sale.id == sale_id)
         )
         return result.scalar_one_or_none()
 
     async def update_sale(self, sale_id: int, sale_data: SaleUpdate) -> Optional[Sale]:
         """Update sale"""
-        sale = await self.get_sale(sale_id)
-        if not sale:
-            return None
+        update_data = set_fields(sale_data)
+        if not update_data:
+            return await self.get_sale(sale_id)
         
-        update_data = sale_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(sale, field, value)
-        
-        await self.db.commit()
-        await self.db.refresh(sale)
+        sale = await self._update_returning(Sale, sale_id, update_data, selectinload(Sale.items))
+        if sale is not None:
+            await self._invalidate_dashboard()
         return sale
 
     # Payment Management
@@ -307,12 +484,12 @@ class POSService:
         await self.db.refresh(payment)
         return payment
 
-    async def get_payments(self, skip: int = 0, limit: int = 100) -> List[Payment]:
-        """Get list of payments"""
+    async def get_payments(self, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get list of payments (newest first) as plain dicts, ready to encode"""
         result = await self.db.execute(
-            select(Payment).offset(skip).limit(limit).order_by(Payment.payment_date.desc())
+            select(*PAYMENT_COLUMNS).offset(skip).limit(limit).order_by(Payment.payment_date.desc())
         )
-        return result.scalars().all()
+        return [_row_to_dict(row, _PAYMENT_MONEY_FIELDS) for row in result]
 
     async def get_payment(self, payment_id: int) -> Optional[Payment]:
         """Get payment by ID"""
@@ -323,17 +500,11 @@ class POSService:
 
     async def update_payment(self, payment_id: int, payment_data: PaymentUpdate) -> Optional[Payment]:
         """Update payment"""
-        payment = await self.get_payment(payment_id)
-        if not payment:
-            return None
-        
-        update_data = payment_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(payment, field, value)
+        update_data = set_fields(payment_data)
+        if not update_data:
+            return await self.get_payment(payment_id)
         
-        await self.db.commit()
-        await self.db.refresh(payment)
-        return payment
+        return await self._update_returning(Payment, payment_id, update_data)
 
 
 
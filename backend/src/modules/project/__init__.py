@@ -15,7 +15,7 @@ from .schemas import (
 )
 from .service import ProjectService
 from .api import router
-from .agents import ProjectAgent
+from .agents import ProjectAgent, get_project_agent
 
 __all__ = [
     # Models
@@ -37,7 +37,7 @@ __all__ = [
     "ProjectService", "router",
     
     # AI Agent
-    "ProjectAgent"
+    "ProjectAgent", "get_project_agent"
 ]
 
 
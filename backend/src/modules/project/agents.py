@@ -1,79 +1,421 @@
 from langchain_openai import ChatOpenAI
-from langchain.memory import ConversationBufferMemory
-from langchain.schema import HumanMessage, AIMessage
-from typing import Dict, List, Optional, Any
-import json
+from langchain.schema import HumanMessage, AIMessage, SystemMessage
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
+import asyncio
+import csv
+import hashlib
+import io
+import orjson
 from datetime import datetime, timedelta
+from functools import lru_cache
+
+from ...core.redis import CacheManager, get_redis
+
+# Parsed LLM answers keyed by a hash of the system prompt and project data, so
+# any data change produces a new key.
+LLM_CACHE_KEY = "project:agent:llm:{digest}"
+LLM_CACHE_TTL_SECONDS = 3600
+
+# Only the fields the analyses use are sent to the model; descriptions, notes,
+# metadata and audit columns cost tokens without informing the answer
+PROJECT_SUMMARY_FIELDS = (
+    "project_code", "name", "project_type", "status", "start_date", "end_date",
+    "actual_start_date", "actual_end_date", "budget", "actual_cost", "currency",
+    "progress_percentage",
+)
+TASK_COLUMNS = (
+    "id", "title", "status", "priority", "assigned_to_id", "due_date",
+    "estimated_hours", "actual_hours", "depends_on_task_id",
+)
+
+def _to_json(value: Any) -> str:
+    """Indented JSON for embedding project records in a prompt"""
+    return orjson.dumps(value, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+def _project_summary(project_data: Dict) -> Dict:
+    return {field: project_data[field] for field in PROJECT_SUMMARY_FIELDS if field in project_data}
+
+def _compact_tasks(tasks: List[Dict]) -> str:
+    """Tasks as CSV rows of TASK_COLUMNS, far fewer tokens than indented JSON"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(TASK_COLUMNS)
+    for task in tasks:
+        writer.writerow(["" if task.get(column) is None else task[column] for column in TASK_COLUMNS])
+    return buffer.getvalue()
+
+def _time_summary(time_entries: List[Dict]) -> Dict:
+    """Totals over all time entries instead of a sample of raw rows"""
+    total_hours = 0.0
+    billable_hours = 0.0
+    by_employee: Dict[Any, float] = {}
+    for entry in time_entries:
+        hours = float(entry.get("duration_hours") or 0)
+        total_hours += hours
+        if entry.get("billable", True):
+            billable_hours += hours
+        employee = entry.get("employee_id")
+        by_employee[employee] = by_employee.get(employee, 0.0) + hours
+    return {
+        "entries": len(time_entries),
+        "total_hours": round(total_hours, 2),
+        "billable_hours": round(billable_hours, 2),
+        "hours_by_employee": {employee: round(hours, 2) for employee, hours in by_employee.items()},
+    }
+
+# Static instructions and response shapes go in the system message, ahead of
+# the per-project data, so every call with the same method shares one prefix.
+PERFORMANCE_SYSTEM_PROMPT = """\
+Analyze the project data in the user message and provide performance insights.
+
+Please provide:
+1. Budget variance analysis
+2. Timeline analysis
+3. Risk assessment
+4. Recommendations for improvement
+5. Success factors
+
+Format your response as a JSON object with the following structure:
+{
+    "budget_analysis": {
+        "variance_percentage": number,
+        "status": "over_budget" | "under_budget" | "on_budget",
+        "recommendation": "string"
+    },
+    "timeline_analysis": {
+        "status": "on_track" | "behind_schedule" | "ahead_of_schedule",
+        "days_behind": number,
+        "recommendation": "string"
+    },
+    "risk_assessment": {
+        "risk_level": "low" | "medium" | "high",
+        "risks": ["risk1", "risk2", "risk3"],
+        "mitigation_strategies": ["strategy1", "strategy2", "strategy3"]
+    },
+    "recommendations": ["rec1", "rec2", "rec3"],
+    "success_factors": ["factor1", "factor2", "factor3"]
+}
+"""
+
+TIMELINE_SYSTEM_PROMPT = """\
+Predict the project timeline based on the project data in the user message.
+
+Please provide:
+1. Predicted completion date
+2. Confidence level
+3. Factors affecting timeline
+4. Recommendations to stay on track
+
+Format your response as a JSON object:
+{
+    "predicted_completion_date": "YYYY-MM-DD",
+    "confidence_level": "high" | "medium" | "low",
+    "days_variance": number,
+    "timeline_factors": ["factor1", "factor2", "factor3"],
+    "recommendations": ["rec1", "rec2", "rec3"],
+    "critical_path_items": ["item1", "item2", "item3"]
+}
+"""
+
+RESOURCE_SYSTEM_PROMPT = """\
+Optimize resource allocation for the project in the user message.
+
+Please provide:
+1. Resource utilization analysis
+2. Optimization recommendations
+3. Cost-saving opportunities
+4. Resource reallocation suggestions
+
+Format your response as a JSON object:
+{
+    "utilization_analysis": {
+        "over_allocated": ["resource1", "resource2"],
+        "under_allocated": ["resource3", "resource4"],
+        "optimal_resources": ["resource5", "resource6"]
+    },
+    "optimization_recommendations": [
+        {
+            "resource": "string",
+            "action": "increase" | "decrease" | "reallocate",
+            "reason": "string",
+            "expected_impact": "string"
+        }
+    ],
+    "cost_savings": {
+        "potential_savings": number,
+        "strategies": ["strategy1", "strategy2", "strategy3"]
+    },
+    "resource_reallocation": [
+        {
+            "from_resource": "string",
+            "to_resource": "string",
+            "amount": number,
+            "reason": "string"
+        }
+    ]
+}
+"""
+
+REPORT_SYSTEM_PROMPT = """\
+Generate a comprehensive project report based on the project data in the user message.
+
+Please provide a comprehensive report including:
+1. Executive Summary
+2. Project Status Overview
+3. Budget Analysis
+4. Timeline Analysis
+5. Resource Utilization
+6. Risk Assessment
+7. Key Achievements
+8. Challenges and Issues
+9. Recommendations
+10. Next Steps
+
+Format your response as a JSON object:
+{
+    "executive_summary": "string",
+    "project_status": {
+        "overall_status": "string",
+        "progress_summary": "string",
+        "key_metrics": {
+            "budget_utilization": number,
+            "timeline_adherence": number,
+            "resource_efficiency": number
+        }
+    },
+    "budget_analysis": {
+        "summary": "string",
+        "variance": number,
+        "recommendations": ["rec1", "rec2"]
+    },
+    "timeline_analysis": {
+        "summary": "string",
+        "status": "string",
+        "recommendations": ["rec1", "rec2"]
+    },
+    "resource_utilization": {
+        "summary": "string",
+        "efficiency_score": number,
+        "recommendations": ["rec1", "rec2"]
+    },
+    "risk_assessment": {
+        "summary": "string",
+        "risk_level": "low" | "medium" | "high",
+        "key_risks": ["risk1", "risk2", "risk3"]
+    },
+    "key_achievements": ["achievement1", "achievement2", "achievement3"],
+    "challenges_issues": ["challenge1", "challenge2", "challenge3"],
+    "recommendations": ["rec1", "rec2", "rec3"],
+    "next_steps": ["step1", "step2", "step3"]
+}
+"""
+
+PRIORITIES_SYSTEM_PROMPT = """\
+Suggest task priorities for the project in the user message.
+
+Please analyze the tasks and suggest:
+1. Priority levels for each task
+2. Critical path identification
+3. Dependency optimization
+4. Resource allocation suggestions
+
+Format your response as a JSON object:
+{
+    "task_priorities": [
+        {
+            "task_id": number,
+            "task_title": "string",
+            "suggested_priority": "low" | "medium" | "high" | "urgent",
+            "reason": "string",
+            "impact_on_project": "string"
+        }
+    ],
+    "critical_path": ["task1", "task2", "task3"],
+    "dependency_optimization": [
+        {
+            "task": "string",
+            "optimization": "string",
+            "expected_benefit": "string"
+        }
+    ],
+    "resource_suggestions": [
+        {
+            "task": "string",
+            "resource_recommendation": "string",
+            "reason": "string"
+        }
+    ]
+}
+"""
+
+RISKS_SYSTEM_PROMPT = """\
+Predict potential risks for the project in the user message.
+
+Please identify:
+1. Potential risks
+2. Risk probability and impact
+3. Early warning signs
+4. Mitigation strategies
+
+Format your response as a JSON object:
+{
+    "identified_risks": [
+        {
+            "risk": "string",
+            "category": "budget" | "timeline" | "resource" | "technical" | "scope",
+            "probability": "low" | "medium" | "high",
+            "impact": "low" | "medium" | "high",
+            "risk_score": number,
+            "description": "string"
+        }
+    ],
+    "early_warning_signs": ["sign1", "sign2", "sign3"],
+    "mitigation_strategies": [
+        {
+            "risk": "string",
+            "strategy": "string",
+            "action_items": ["action1", "action2"],
+            "timeline": "string"
+        }
+    ],
+    "overall_risk_level": "low" | "medium" | "high",
+    "recommendations": ["rec1", "rec2", "rec3"]
+}
+"""
+
+class _JSONMemberStream:
+    """Incrementally split a streamed JSON object into its top-level members.
+
+    feed() takes the next text fragment and returns the (key, value) pairs
+    whose values finished in it. Only string/bracket state is tracked while
+    scanning; each complete member is then parsed on its own.
+    """
 
-class ProjectAgent:
     def __init__(self):
+        self._buffer = ""
+        self._position = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._member_start: Optional[int] = None
+        self.complete = False
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        self._buffer += text
+        members: List[Tuple[str, Any]] = []
+        buffer = self._buffer
+        for index in range(self._position, len(buffer)):
+            char = buffer[index]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                if self._depth == 1:
+                    self._member_start = index + 1
+            elif char in "}]":
+                if self._depth == 1:
+                    members.extend(self._parse_member(index))
+                    self.complete = True
+                self._depth -= 1
+            elif char == "," and self._depth == 1:
+                members.extend(self._parse_member(index))
+                self._member_start = index + 1
+        self._position = len(buffer)
+        return members
+
+    def _parse_member(self, end: int) -> List[Tuple[str, Any]]:
+        member = self._buffer[self._member_start:end].strip()
+        if not member:
+            return []
+        return list(orjson.loads("{" + member + "}").items())
+
+def _get_cache() -> Optional[CacheManager]:
+    """Cache for parsed LLM answers; None when Redis is not initialized"""
+    try:
+        return CacheManager(get_redis())
+    except RuntimeError:
+        return None
+
+class ProjectAgent:
+    def __init__(self, cache: Optional[CacheManager] = None):
+        # Explicit cache; when None, Redis is looked up on each call instead
+        self.cache = cache
+        # JSON mode: every prompt asks for a JSON object, so have the API
+        # guarantee one instead of hoping the free text parses
         self.llm = ChatOpenAI(
             model="gpt-4o-mini",
             temperature=0.1,
-            max_tokens=2000
-        )
-        self.memory = ConversationBufferMemory(
-            memory_key="chat_history",
-            return_messages=True
+            max_tokens=2000,
+            model_kwargs={"response_format": {"type": "json_object"}}
         )
 
-    async def analyze_project_performance(self, project_data: Dict) -> Dict:
-        """Analyze project performance and provide insights"""
-        try:
-            prompt = f"""
-            Analyze the following project data and provide performance insights:
-            
-            Project: {project_data.get('name', 'Unknown')}
-            Status: {project_data.get('status', 'Unknown')}
-            Budget: {project_data.get('budget', 0)}
-            Actual Cost: {project_data.get('actual_cost', 0)}
-            Progress: {project_data.get('progress_percentage', 0)}%
-            Start Date: {project_data.get('start_date', 'Unknown')}
-            End Date: {project_data.get('end_date', 'Unknown')}
-            
-            Please provide:
-            1. Budget variance analysis
-            2. Timeline analysis
-            3. Risk assessment
-            4. Recommendations for improvement
-            5. Success factors
-            
-            Format your response as a JSON object with the following structure:
-            {{
-                "budget_analysis": {{
-                    "variance_percentage": number,
-                    "status": "over_budget" | "under_budget" | "on_budget",
-                    "recommendation": "string"
-                }},
-                "timeline_analysis": {{
-                    "status": "on_track" | "behind_schedule" | "ahead_of_schedule",
-                    "days_behind": number,
-                    "recommendation": "string"
-                }},
-                "risk_assessment": {{
-                    "risk_level": "low" | "medium" | "high",
-                    "risks": ["risk1", "risk2", "risk3"],
-                    "mitigation_strategies": ["strategy1", "strategy2", "strategy3"]
-                }},
-                "recommendations": ["rec1", "rec2", "rec3"],
-                "success_factors": ["factor1", "factor2", "factor3"]
-            }}
-            """
-            
-            response = await self.llm.ainvoke([HumanMessage(content=prompt)])
-            
-            try:
-                analysis = json.loads(response.content)
+    def _current_cache(self) -> Optional[CacheManager]:
+        return self.cache if self.cache is not None else _get_cache()
+
+    @staticmethod
+    def _cache_key(system_prompt: str, user_content: str) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(system_prompt.encode())
+        digest.update(b"\0")
+        digest.update(user_content.encode())
+        return LLM_CACHE_KEY.format(digest=digest.hexdigest())
+
+    async def _complete_json(self, system_prompt: str, user_content: str) -> Dict:
+        """Run a prompt that asks for a JSON object; repeats are served from cache"""
+        cache = self._current_cache()
+        cache_key = self._cache_key(system_prompt, user_content)
+        if cache is not None:
+            cached = await cache.get(cache_key)
+            if cached is not None:
                 return {
                     "status": "success",
-                    "data": analysis
-                }
-            except json.JSONDecodeError:
-                return {
-                    "status": "error",
-                    "message": "Failed to parse AI response",
-                    "raw_response": response.content
+                    "data": cached
                 }
+        
+        response = await self.llm.ainvoke([
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=user_content)
+        ])
+        
+        try:
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # Still possible if the answer is cut off at max_tokens
+            return {
+                "status": "error",
+                "message": "Failed to parse AI response",
+                "raw_response": response.content
+            }
+        
+        # Only parsed answers are cached, so a bad response is retried next time
+        if cache is not None:
+            await cache.set(cache_key, data, ttl=LLM_CACHE_TTL_SECONDS)
+        return {
+            "status": "success",
+            "data": data
+        }
+
+    async def analyze_project_performance(self, project_data: Dict) -> Dict:
+        """Analyze project performance and provide insights"""
+        try:
+            user_content = f"""\
+Project: {project_data.get('name', 'Unknown')}
+Status: {project_data.get('status', 'Unknown')}
+Budget: {project_data.get('budget', 0)}
+Actual Cost: {project_data.get('actual_cost', 0)}
+Progress: {project_data.get('progress_percentage', 0)}%
+Start Date: {project_data.get('start_date', 'Unknown')}
+End Date: {project_data.get('end_date', 'Unknown')}
+"""
+            
+            return await self._complete_json(PERFORMANCE_SYSTEM_PROMPT, user_content)
                 
         except Exception as e:
             return {
@@ -84,48 +426,17 @@ class ProjectAgent:
     async def predict_project_timeline(self, project_data: Dict, task_data: List[Dict]) -> Dict:
         """Predict project timeline based on current progress and tasks"""
         try:
-            prompt = f"""
-            Predict the project timeline based on the following data:
-            
-            Project: {project_data.get('name', 'Unknown')}
-            Current Progress: {project_data.get('progress_percentage', 0)}%
-            Start Date: {project_data.get('start_date', 'Unknown')}
-            Planned End Date: {project_data.get('end_date', 'Unknown')}
-            
-            Tasks ({len(task_data)} total):
-            {json.dumps(task_data[:10], indent=2)}  # Show first 10 tasks
-            
-            Please provide:
-            1. Predicted completion date
-            2. Confidence level
-            3. Factors affecting timeline
-            4. Recommendations to stay on track
-            
-            Format your response as a JSON object:
-            {{
-                "predicted_completion_date": "YYYY-MM-DD",
-                "confidence_level": "high" | "medium" | "low",
-                "days_variance": number,
-                "timeline_factors": ["factor1", "factor2", "factor3"],
-                "recommendations": ["rec1", "rec2", "rec3"],
-                "critical_path_items": ["item1", "item2", "item3"]
-            }}
-            """
-            
-            response = await self.llm.ainvoke([HumanMessage(content=prompt)])
+            user_content = f"""\
+Project: {project_data.get('name', 'Unknown')}
+Current Progress: {project_data.get('progress_percentage', 0)}%
+Start Date: {project_data.get('start_date', 'Unknown')}
+Planned End Date: {project_data.get('end_date', 'Unknown')}
+
+Tasks ({len(task_data)} total):
+{_compact_tasks(task_data[:10])}
+"""
             
-            try:
-                prediction = json.loads(response.content)
-                return {
-                    "status": "success",
-                    "data": prediction
-                }
-            except json.JSONDecodeError:
-                return {
-                    "status": "error",
-                    "message": "Failed to parse AI response",
-                    "raw_response": response.content
-                }
+            return await self._complete_json(TIMELINE_SYSTEM_PROMPT, user_content)
                 
         except Exception as e:
             return {
@@ -136,67 +447,17 @@ class ProjectAgent:
     async def optimize_resource_allocation(self, project_data: Dict, resource_data: List[Dict]) -> Dict:
         """Optimize resource allocation for the project"""
         try:
-            prompt = f"""
-            Optimize resource allocation for the following project:
-            
-            Project: {project_data.get('name', 'Unknown')}
-            Budget: {project_data.get('budget', 0)}
-            Current Cost: {project_data.get('actual_cost', 0)}
-            Progress: {project_data.get('progress_percentage', 0)}%
-            
-            Resources:
-            {json.dumps(resource_data, indent=2)}
-            
-            Please provide:
-            1. Resource utilization analysis
-            2. Optimization recommendations
-            3. Cost-saving opportunities
-            4. Resource reallocation suggestions
-            
-            Format your response as a JSON object:
-            {{
-                "utilization_analysis": {{
-                    "over_allocated": ["resource1", "resource2"],
-                    "under_allocated": ["resource3", "resource4"],
-                    "optimal_resources": ["resource5", "resource6"]
-                }},
-                "optimization_recommendations": [
-                    {{
-                        "resource": "string",
-                        "action": "increase" | "decrease" | "reallocate",
-                        "reason": "string",
-                        "expected_impact": "string"
-                    }}
-                ],
-                "cost_savings": {{
-                    "potential_savings": number,
-                    "strategies": ["strategy1", "strategy2", "strategy3"]
-                }},
-                "resource_reallocation": [
-                    {{
-                        "from_resource": "string",
-                        "to_resource": "string",
-                        "amount": number,
-                        "reason": "string"
-                    }}
-                ]
-            }}
-            """
-            
-            response = await self.llm.ainvoke([HumanMessage(content=prompt)])
+            user_content = f"""\
+Project: {project_data.get('name', 'Unknown')}
+Budget: {project_data.get('budget', 0)}
+Current Cost: {project_data.get('actual_cost', 0)}
+Progress: {project_data.get('progress_percentage', 0)}%
+
+Resources:
+{_to_json(resource_data)}
+"""
             
-            try:
-                optimization = json.loads(response.content)
-                return {
-                    "status": "success",
-                    "data": optimization
-                }
-            except json.JSONDecodeError:
-                return {
-                    "status": "error",
-                    "message": "Failed to parse AI response",
-                    "raw_response": response.content
-                }
+            return await self._complete_json(RESOURCE_SYSTEM_PROMPT, user_content)
                 
         except Exception as e:
             return {
@@ -204,89 +465,74 @@ class ProjectAgent:
                 "message": f"Error optimizing resource allocation: {str(e)}"
             }
 
+    @staticmethod
+    def _report_content(project_data: Dict, task_data: List[Dict], time_data: List[Dict]) -> str:
+        return f"""\
+Project Information:
+{_to_json(_project_summary(project_data))}
+
+Tasks ({len(task_data)} total):
+{_compact_tasks(task_data[:20])}
+Time Entries:
+{_to_json(_time_summary(time_data))}
+"""
+
     async def generate_project_report(self, project_data: Dict, task_data: List[Dict], time_data: List[Dict]) -> Dict:
         """Generate comprehensive project report"""
         try:
-            prompt = f"""
-            Generate a comprehensive project report based on the following data:
+            user_content = self._report_content(project_data, task_data, time_data)
             
-            Project Information:
-            {json.dumps(project_data, indent=2)}
-            
-            Tasks ({len(task_data)} total):
-            {json.dumps(task_data[:20], indent=2)}  # Show first 20 tasks
-            
-            Time Entries ({len(time_data)} total):
-            {json.dumps(time_data[:10], indent=2)}  # Show first 10 time entries
-            
-            Please provide a comprehensive report including:
-            1. Executive Summary
-            2. Project Status Overview
-            3. Budget Analysis
-            4. Timeline Analysis
-            5. Resource Utilization
-            6. Risk Assessment
-            7. Key Achievements
-            8. Challenges and Issues
-            9. Recommendations
-            10. Next Steps
-            
-            Format your response as a JSON object:
-            {{
-                "executive_summary": "string",
-                "project_status": {{
-                    "overall_status": "string",
-                    "progress_summary": "string",
-                    "key_metrics": {{
-                        "budget_utilization": number,
-                        "timeline_adherence": number,
-                        "resource_efficiency": number
-                    }}
-                }},
-                "budget_analysis": {{
-                    "summary": "string",
-                    "variance": number,
-                    "recommendations": ["rec1", "rec2"]
-                }},
-                "timeline_analysis": {{
-                    "summary": "string",
-                    "status": "string",
-                    "recommendations": ["rec1", "rec2"]
-                }},
-                "resource_utilization": {{
-                    "summary": "string",
-                    "efficiency_score": number,
-                    "recommendations": ["rec1", "rec2"]
-                }},
-                "risk_assessment": {{
-                    "summary": "string",
-                    "risk_level": "low" | "medium" | "high",
-                    "key_risks": ["risk1", "risk2", "risk3"]
-                }},
-                "key_achievements": ["achievement1", "achievement2", "achievement3"],
-                "challenges_issues": ["challenge1", "challenge2", "challenge3"],
-                "recommendations": ["rec1", "rec2", "rec3"],
-                "next_steps": ["step1", "step2", "step3"]
-            }}
-            """
-            
-            response = await self.llm.ainvoke([HumanMessage(content=prompt)])
-            
-            try:
-                report = json.loads(response.content)
-                return {
-                    "status": "success",
-                    "data": report
-                }
-            except json.JSONDecodeError:
-                return {
+            return await self._complete_json(REPORT_SYSTEM_PROMPT, user_content)
+                
+        except Exception as e:
+            return {
+                "status": "error",
+                "message": f"Error generating project report: {str(e)}"
+            }
+
+    async def generate_project_report_stream(
+        self, project_data: Dict, task_data: List[Dict], time_data: List[Dict]
+    ) -> AsyncIterator[Dict]:
+        """Stream the project report one top-level section at a time.
+
+        Each chunk is a single-key dict such as {"executive_summary": "..."},
+        yielded as soon as that section is complete in the model output, so a
+        UI can render sections while the rest is still generating. On failure
+        the last chunk is a {"status": "error", "message": ...} dict.
+        """
+        try:
+            user_content = self._report_content(project_data, task_data, time_data)
+            cache = self._current_cache()
+            cache_key = self._cache_key(REPORT_SYSTEM_PROMPT, user_content)
+            if cache is not None:
+                cached = await cache.get(cache_key)
+                if cached is not None:
+                    for section, value in cached.items():
+                        yield {section: value}
+                    return
+            
+            report: Dict[str, Any] = {}
+            members = _JSONMemberStream()
+            async for chunk in self.llm.astream([
+                SystemMessage(content=REPORT_SYSTEM_PROMPT),
+                HumanMessage(content=user_content)
+            ]):
+                for section, value in members.feed(chunk.content):
+                    report[section] = value
+                    yield {section: value}
+            
+            if not members.complete:
+                yield {
                     "status": "error",
-                    "message": "Failed to parse AI response",
-                    "raw_response": response.content
+                    "message": "Failed to parse AI response"
                 }
+                return
+            
+            if cache is not None:
+                await cache.set(cache_key, report, ttl=LLM_CACHE_TTL_SECONDS)
                 
         except Exception as e:
-            return {
+            yield {
                 "status": "error",
                 "message": f"Error generating project report: {str(e)}"
             }
@@ -294,65 +540,15 @@ class ProjectAgent:
     async def suggest_task_priorities(self, project_data: Dict, task_data: List[Dict]) -> Dict:
         """Suggest task priorities based on project goals and dependencies"""
         try:
-            prompt = f"""
-            Suggest task priorities for the following project:
-            
-            Project: {project_data.get('name', 'Unknown')}
-            Status: {project_data.get('status', 'Unknown')}
-            End Date: {project_data.get('end_date', 'Unknown')}
-            
-            Tasks:
-            {json.dumps(task_data, indent=2)}
-            
-            Please analyze the tasks and suggest:
-            1. Priority levels for each task
-            2. Critical path identification
-            3. Dependency optimization
-            4. Resource allocation suggestions
-            
-            Format your response as a JSON object:
-            {{
-                "task_priorities": [
-                    {{
-                        "task_id": number,
-                        "task_title": "string",
-                        "suggested_priority": "low" | "medium" | "high" | "urgent",
-                        "reason": "string",
-                        "impact_on_project": "string"
-                    }}
-                ],
-                "critical_path": ["task1", "task2", "task3"],
-                "dependency_optimization": [
-                    {{
-                        "task": "string",
-                        "optimization": "string",
-                        "expected_benefit": "string"
-                    }}
-                ],
-                "resource_suggestions": [
-                    {{
-                        "task": "string",
-                        "resource_recommendation": "string",
-                        "reason": "string"
-                    }}
-                ]
-            }}
-            """
-            
-            response = await self.llm.ainvoke([HumanMessage(content=prompt)])
+            user_content = f"""\
+Project: {project_data.get('name', 'Unknown')}
+Status: {project_data.get('status', 'Unknown')}
+End Date: {project_data.get('end_date', 'Unknown')}
+
+Tasks ({len(task_data)} total):
+{_compact_tasks(task_data)}"""
             
-            try:
-                suggestions = json.loads(response.content)
-                return {
-                    "status": "success",
-                    "data": suggestions
-                }
-            except json.JSONDecodeError:
-                return {
-                    "status": "error",
-                    "message": "Failed to parse AI response",
-                    "raw_response": response.content
-                }
+            return await self._complete_json(PRIORITIES_SYSTEM_PROMPT, user_content)
                 
         except Exception as e:
             return {
@@ -363,64 +559,17 @@ class ProjectAgent:
     async def predict_project_risks(self, project_data: Dict, task_data: List[Dict]) -> Dict:
         """Predict potential project risks"""
         try:
-            prompt = f"""
-            Predict potential risks for the following project:
-            
-            Project: {project_data.get('name', 'Unknown')}
-            Status: {project_data.get('status', 'Unknown')}
-            Budget: {project_data.get('budget', 0)}
-            Progress: {project_data.get('progress_percentage', 0)}%
-            End Date: {project_data.get('end_date', 'Unknown')}
-            
-            Tasks:
-            {json.dumps(task_data[:15], indent=2)}  # Show first 15 tasks
-            
-            Please identify:
-            1. Potential risks
-            2. Risk probability and impact
-            3. Early warning signs
-            4. Mitigation strategies
-            
-            Format your response as a JSON object:
-            {{
-                "identified_risks": [
-                    {{
-                        "risk": "string",
-                        "category": "budget" | "timeline" | "resource" | "technical" | "scope",
-                        "probability": "low" | "medium" | "high",
-                        "impact": "low" | "medium" | "high",
-                        "risk_score": number,
-                        "description": "string"
-                    }}
-                ],
-                "early_warning_signs": ["sign1", "sign2", "sign3"],
-                "mitigation_strategies": [
-                    {{
-                        "risk": "string",
-                        "strategy": "string",
-                        "action_items": ["action1", "action2"],
-                        "timeline": "string"
-                    }}
-                ],
-                "overall_risk_level": "low" | "medium" | "high",
-                "recommendations": ["rec1", "rec2", "rec3"]
-            }}
-            """
-            
-            response = await self.llm.ainvoke([HumanMessage(content=prompt)])
+            user_content = f"""\
+Project: {project_data.get('name', 'Unknown')}
+Status: {project_data.get('status', 'Unknown')}
+Budget: {project_data.get('budget', 0)}
+Progress: {project_data.get('progress_percentage', 0)}%
+End Date: {project_data.get('end_date', 'Unknown')}
+
+Tasks ({len(task_data)} total):
+{_compact_tasks(task_data[:15])}"""
             
-            try:
-                risks = json.loads(response.content)
-                return {
-                    "status": "success",
-                    "data": risks
-                }
-            except json.JSONDecodeError:
-                return {
-                    "status": "error",
-                    "message": "Failed to parse AI response",
-                    "raw_response": response.content
-                }
+            return await self._complete_json(RISKS_SYSTEM_PROMPT, user_content)
                 
         except Exception as e:
             return {
@@ -428,5 +577,39 @@ class ProjectAgent:
                 "message": f"Error predicting project risks: {str(e)}"
             }
 
+    async def analyze_all(
+        self,
+        project_data: Dict,
+        task_data: List[Dict],
+        resource_data: List[Dict],
+        time_data: List[Dict]
+    ) -> Dict:
+        """Run every project analysis concurrently, keyed by analysis name.
+
+        The LLM calls are independent, so the whole set takes about as long as
+        the slowest one. Each entry has the same status/data shape as the
+        individual method.
+        """
+        names = (
+            "performance", "timeline", "resource_allocation",
+            "report", "task_priorities", "risks"
+        )
+        results = await asyncio.gather(
+            self.analyze_project_performance(project_data),
+            self.predict_project_timeline(project_data, task_data),
+            self.optimize_resource_allocation(project_data, resource_data),
+            self.generate_project_report(project_data, task_data, time_data),
+            self.suggest_task_priorities(project_data, task_data),
+            self.predict_project_risks(project_data, task_data)
+        )
+        return dict(zip(names, results))
 
 
+@lru_cache()
+def get_project_agent() -> ProjectAgent:
+    """Shared, stateless ProjectAgent so the ChatOpenAI client and its
+    connection pool are reused across requests. Built on first use, since the
+    client needs OPENAI_API_KEY. The Redis cache is looked up per call, so
+    building it before Redis is initialized doesn't leave caching off.
+    """
+    return ProjectAgent()
@@ -0,0 +1,326 @@
+"""
+Manufacturing Module Tests
+Tests for manufacturing schemas and service helpers
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from src.core.redis import CacheManager
+from src.modules.manufacturing import service as manufacturing_service
+from src.modules.manufacturing.service import DASHBOARD_CACHE_KEY, ManufacturingService
+from src.modules.manufacturing.schemas import (
+    ProductionOrderCreate, ProductionOrderUpdate, ProductionOrderResponse,
+    ProductCreate, ProductUpdate, QualityCheckCreate, WorkCenterCreate
+)
+
+
+class _FakeResult:
+    """Result stand-in returning canned RETURNING rows"""
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+    def one(self):
+        return self._rows[0]
+
+
+class _RecordingSession:
+    """AsyncSession stand-in that records executed statements and parameters"""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.executed = []
+        self.commits = 0
+
+    async def execute(self, statement, params=None):
+        self.executed.append((statement, params))
+        return _FakeResult(self.rows)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        pass
+
+
+def _order_row(**values):
+    """Production order row as read back from the database"""
+    row = {
+        "id": 1, "order_number": "PO-1", "product_id": 1, "product_name": "Widget",
+        "quantity": 5, "status": "planned", "actual_start_date": None, "actual_end_date": None,
+        "completion_percentage": 0.0, "units_completed": 0, "units_scrapped": 0,
+        "estimated_cost": None, "actual_cost": None, "material_cost": None,
+        "labor_cost": None, "overhead_cost": None,
+        "created_at": datetime(2024, 1, 1), "updated_at": None,
+    }
+    row.update(values)
+    return row
+
+
+class TestJsonFields:
+    """Test JSON-column fields on request and response schemas"""
+
+    def test_request_accepts_json_strings(self):
+        """Test a JSON-encoded string is decoded on input"""
+        order = ProductionOrderCreate(
+            product_id=1, product_name="Widget", quantity=5, specifications='{"finish": "matte"}'
+        )
+
+        assert order.model_dump(include={"specifications"}) == {"specifications": {"finish": "matte"}}
+
+    def test_request_rejects_malformed_json(self):
+        """Test malformed JSON in a request body is a validation error, not {}"""
+        with pytest.raises(ValidationError, match="invalid JSON"):
+            ProductionOrderCreate(product_id=1, product_name="Widget", quantity=5, specifications="{bad")
+        with pytest.raises(ValidationError, match="invalid JSON"):
+            ProductionOrderUpdate(quality_standards="not json")
+
+    def test_response_reads_malformed_stored_json_as_empty(self):
+        """Test an undecodable stored value does not fail the response"""
+        order = ProductionOrderResponse.model_validate(_order_row(specifications="{bad"))
+
+        assert order.model_dump(include={"specifications"}) == {"specifications": {}}
+
+    def test_null_column_stays_null(self):
+        """Test a NULL JSON column serializes as null, not an object of nulls"""
+        order = ProductionOrderResponse.model_validate(_order_row(quality_standards=None))
+
+        assert order.model_dump(include={"quality_standards", "specifications"}) == {
+            "quality_standards": None, "specifications": None
+        }
+
+    def test_stored_objects_round_trip_unchanged(self):
+        """Test only the keys present (including extra keys) are dumped back"""
+        order = ProductionOrderResponse.model_validate(_order_row(
+            quality_standards={"tolerance": 0.1, "customer_spec": "A-7"}, specifications={}
+        ))
+
+        assert order.model_dump(include={"quality_standards", "specifications"}) == {
+            "quality_standards": {"tolerance": 0.1, "customer_spec": "A-7"}, "specifications": {}
+        }
+
+
+    def test_request_objects_default_to_empty(self):
+        """Test omitted or null request JSON objects read as {}"""
+        order = ProductionOrderCreate(product_id=1, product_name="Widget", quantity=5, quality_standards=None)
+
+        assert order.model_dump(include={"quality_standards", "specifications"}) == {
+            "quality_standards": {}, "specifications": {}
+        }
+
+    def test_update_null_is_kept(self):
+        """Test an explicit null in an update still clears the column"""
+        assert ProductionOrderUpdate(specifications=None).model_dump(exclude_unset=True) == {"specifications": None}
+
+
+class TestCodeFields:
+    """Test document/master-data code validation"""
+
+    def test_codes_are_kept_as_sent(self):
+        """Test codes are not trimmed or upper-cased, and dots/spaces are allowed"""
+        product = ProductCreate(name="Widget", product_code="wd-01.a b")
+
+        assert product.product_code == "wd-01.a b"
+
+    @pytest.mark.parametrize("code", ["", "x" * 51])
+    def test_code_length_is_bounded(self, code):
+        """Test codes must be 1-50 characters"""
+        with pytest.raises(ValidationError):
+            ProductCreate(name="Widget", product_code=code)
+
+    def test_work_center_code_keeps_its_limit(self):
+        """Test work center codes stay limited to 20 characters"""
+        with pytest.raises(ValidationError):
+            WorkCenterCreate(name="Press", code="x" * 21)
+
+
+class TestUpdateSchemas:
+    """Test the *Update schemas generated by as_update"""
+
+    def test_fields_are_optional_and_unset_by_default(self):
+        """Test an empty update validates and dumps nothing"""
+        update = ProductionOrderUpdate()
+
+        assert update.model_dump(exclude_unset=True) == {}
+        assert ProductionOrderUpdate.__name__ == "ProductionOrderUpdate"
+
+    def test_constraints_are_kept(self):
+        """Test base-schema constraints still apply to the optional fields"""
+        with pytest.raises(ValidationError):
+            ProductionOrderUpdate(quantity=0)
+        with pytest.raises(ValidationError):
+            ProductUpdate(unit_of_measure="x" * 21)
+
+    def test_excluded_and_extra_fields(self):
+        """Test excluded fields are dropped and update-only fields are added"""
+        fields = ProductionOrderUpdate.model_fields
+
+        assert "product_name" not in fields
+        assert "customer_order_id" not in fields
+        assert ProductionOrderUpdate(status="completed").status == "completed"
+        assert ProductUpdate(is_active=False).model_dump(exclude_unset=True) == {"is_active": False}
+
+
+class TestManufacturingCreates:
+    """Test single-row INSERT ... RETURNING creates"""
+
+    @pytest.mark.asyncio
+    async def test_production_order_insert_returns_row(self):
+        """Test one INSERT carries the JSON fields and the created row is serialized"""
+        order = ProductionOrderCreate(
+            product_id=2, product_name="Gadget", quantity=3, specifications={"finish": "matte"}
+        )
+        session = _RecordingSession(rows=[_order_row(order_number="PO-2")])
+
+        created = await ManufacturingService(session).create_production_order(order, user_id=7)
+
+        statement, _ = session.executed[0]
+        params = statement.compile().params
+        assert len(session.executed) == 1
+        assert session.commits == 1
+        assert params["created_by"] == 7
+        assert params["specifications"] == {"finish": "matte"}
+        assert params["quality_standards"] == {}
+        assert created["order_number"] == "PO-2"
+
+    @pytest.mark.asyncio
+    async def test_quality_check_insert_uses_inspector(self):
+        """Test the creating user is recorded as the inspector"""
+        check = QualityCheckCreate(production_order_id=1, check_type="final", quantity_checked=10)
+        session = _RecordingSession(rows=[{"id": 1, "check_number": "QC-1"}])
+
+        created = await ManufacturingService(session).create_quality_check(check, user_id=3)
+
+        params = session.executed[0][0].compile().params
+        assert params["inspector_id"] == 3
+        assert params["specifications"] == {}
+        assert created["check_number"] == "QC-1"
+
+
+class _FakeCache:
+    """CacheManager stand-in holding one payload with a fixed remaining TTL"""
+
+    def __init__(self, value=None, ttl=-2):
+        self.value = value
+        self.ttl = ttl
+
+    async def get(self, key):
+        return self.value
+
+    async def get_ttl(self, key):
+        return self.ttl
+
+    async def set(self, key, value, ttl=None):
+        self.value = value
+        return True
+
+
+class _FakeRedis:
+    """In-memory stand-in for the redis.asyncio client used by CacheManager"""
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.values[key] = value
+
+    async def ttl(self, key):
+        return 60 if key in self.values else -2
+
+    async def delete(self, key):
+        return int(self.values.pop(key, None) is not None)
+
+    async def incrby(self, key, amount):
+        self.values[key] = str(int(self.values.get(key, 0)) + amount)
+        return int(self.values[key])
+
+    async def keys(self, pattern):
+        raise AssertionError("KEYS must not be used on the write path")
+
+
+class TestDashboardCache:
+    """Test single-flight recomputes of cached dashboard metrics"""
+
+    @pytest.fixture
+    def counted_compute(self, monkeypatch):
+        """Replace the dashboard computation with a slow, counted stub"""
+        calls = []
+
+        async def compute(service):
+            calls.append(service)
+            await asyncio.sleep(0.01)
+            return {"computed": len(calls)}
+
+        monkeypatch.setattr(ManufacturingService, "_compute_dashboard_metrics", compute)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_recompute(self, counted_compute):
+        """Test concurrent cache misses wait on a single in-flight rebuild"""
+        services = [ManufacturingService(db=None) for _ in range(5)]
+
+        results = await asyncio.gather(*(service.get_dashboard_metrics() for service in services))
+
+        assert len(counted_compute) == 1
+        assert results == [{"computed": 1}] * 5
+        assert DASHBOARD_CACHE_KEY not in manufacturing_service._inflight
+
+    @pytest.mark.asyncio
+    async def test_fresh_cache_hit_skips_recompute(self, counted_compute):
+        """Test a cached payload well within its TTL is served as-is"""
+        service = ManufacturingService(db=None, cache=_FakeCache({"cached": True}, ttl=50))
+
+        assert await service.get_dashboard_metrics() == {"cached": True}
+        assert counted_compute == []
+
+    @pytest.mark.asyncio
+    async def test_expiring_cache_hit_refreshes_in_background(self, counted_compute):
+        """Test a payload close to expiry is served while a rebuild starts"""
+        service = ManufacturingService(db=None, cache=_FakeCache({"cached": True}, ttl=2))
+
+        assert await service.get_dashboard_metrics() == {"cached": True}
+        await asyncio.shield(manufacturing_service._inflight[DASHBOARD_CACHE_KEY])
+
+        assert len(counted_compute) == 1
+
+    @pytest.mark.asyncio
+    async def test_write_retires_cached_analytics_without_key_scan(self, monkeypatch):
+        """Test a write bumps the analytics generation instead of scanning keys"""
+        calls = []
+
+        async def compute(service, period_days, cache_key):
+            calls.append(period_days)
+            analytics = {"period_days": period_days}
+            await service._set_cached(cache_key, analytics)
+            return analytics
+
+        monkeypatch.setattr(ManufacturingService, "_compute_manufacturing_analytics", compute)
+        service = ManufacturingService(db=None, cache=CacheManager(_FakeRedis()))
+
+        await service.get_manufacturing_analytics(7)
+        await service.get_manufacturing_analytics(7)
+        await service._invalidate_cached_metrics()
+        await service.get_manufacturing_analytics(7)
+
+        assert calls == [7, 7]
+
+    def test_recent_orders_are_cached_json_ready(self):
+        """Test dashboard rows carry ISO datetimes, so the cache stores them as-is"""
+        row = ManufacturingService._json_ready(_order_row(actual_start_date=datetime(2024, 1, 2, 3, 4, 5)))
+
+        assert row["created_at"] == "2024-01-01T00:00:00"
+        assert row["actual_start_date"] == "2024-01-02T03:04:05"
+        assert row["actual_end_date"] is None
@@ -0,0 +1,179 @@
+"""
+POS Module Tests
+Tests for POS service helpers and partial-update schemas
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import msgspec
+import pytest
+import pytest_asyncio
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.schema import DefaultClause
+
+from src.modules.pos.models import Base, Sale, SaleItem, Terminal
+from src.modules.pos import schemas
+from src.modules.pos.schemas import DiscountUpdate, SaleUpdate, set_fields
+from src.modules.pos.service import POSService, _sale_cursor, _parse_sale_cursor
+
+
+@pytest_asyncio.fixture
+async def pos_session(monkeypatch):
+    """In-memory SQLite session holding one pending sale with one line item"""
+    # sale_number's default is PostgreSQL-only (sequence + to_char)
+    monkeypatch.setattr(
+        Sale.__table__.c.sale_number, "server_default",
+        DefaultClause(text("(hex(randomblob(8)))"))
+    )
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        session.add(Terminal(id=1, terminal_id="T001", name="Front"))
+        session.add(Sale(id=1, terminal_id=1, subtotal=10, tax_amount=1, discount_amount=0, status="pending"))
+        session.add(SaleItem(sale_id=1, product_id="P1", product_name="Coffee", quantity=1, unit_price=10, total_price=10))
+        await session.commit()
+    async with session_factory() as session:
+        yield session
+    await engine.dispose()
+
+
+class _RecordingSession:
+    """AsyncSession stand-in that records statements and returns canned rows"""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.executed = []
+
+    async def execute(self, statement, params=None):
+        self.executed.append(statement)
+        return iter(self.rows)
+
+
+def _sale_row(sale_id: int, sale_date: datetime):
+    return SimpleNamespace(_mapping={
+        "id": sale_id, "sale_number": f"POS{sale_id}", "terminal_id": 1,
+        "cashier_id": None, "customer_id": None, "subtotal": Decimal("10.00"),
+        "tax_amount": Decimal("1.00"), "discount_amount": Decimal("0.00"),
+        "total_amount": Decimal("11.00"), "status": "completed",
+        "sale_date": sale_date, "notes": None,
+    })
+
+
+class TestSaleCursor:
+    """Test keyset cursors for the sale listing"""
+
+    def test_cursor_round_trip(self):
+        """Test a cursor decodes back to the (sale_date, id) it was built from"""
+        sale_date = datetime(2024, 1, 15, 12, 30, 45, 123456, tzinfo=timezone.utc)
+
+        cursor = _sale_cursor({"sale_date": sale_date, "id": 42})
+
+        assert _parse_sale_cursor(cursor) == (sale_date, 42)
+
+    @pytest.mark.parametrize("cursor", ["not base64!", "bm9wZQ==", "//79", "MjAyNC0wMS0wMV94"])
+    def test_malformed_cursor_raises_value_error(self, cursor):
+        """Test tampered cursors fail with a clean ValueError"""
+        with pytest.raises(ValueError, match="Invalid sale cursor"):
+            _parse_sale_cursor(cursor)
+
+    @pytest.mark.asyncio
+    async def test_get_sales_returns_cursor_for_full_page(self):
+        """Test a full page hands back the cursor of its last row"""
+        last_date = datetime(2024, 1, 15, 9, 0, tzinfo=timezone.utc)
+        session = _RecordingSession(rows=[
+            _sale_row(2, datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc)),
+            _sale_row(1, last_date),
+        ])
+
+        sales, cursor = await POSService(session).get_sales(limit=2)
+
+        assert [sale["id"] for sale in sales] == [2, 1]
+        assert sales[0]["total_amount"] == 11.0
+        assert _parse_sale_cursor(cursor) == (last_date, 1)
+
+    @pytest.mark.asyncio
+    async def test_get_sales_last_page_has_no_cursor(self):
+        """Test a short page ends the listing"""
+        session = _RecordingSession(rows=[_sale_row(1, datetime(2024, 1, 15, tzinfo=timezone.utc))])
+
+        _, cursor = await POSService(session).get_sales(limit=2)
+
+        assert cursor is None
+
+
+class TestPartialUpdates:
+    """Test msgspec partial-update bodies"""
+
+    def test_unsent_fields_are_omitted(self):
+        """Test only the fields present in the body are returned"""
+        patch = msgspec.json.decode(b'{"status": "completed"}', type=SaleUpdate)
+
+        assert set_fields(patch) == {"status": "completed"}
+        assert set_fields(SaleUpdate()) == {}
+
+    def test_explicit_null_is_kept(self):
+        """Test a field sent as null clears the column rather than being dropped"""
+        patch = msgspec.json.decode(b'{"notes": null}', type=SaleUpdate)
+
+        assert set_fields(patch) == {"notes": None}
+
+    def test_body_is_validated(self):
+        """Test values outside the declared types are rejected on decode"""
+        with pytest.raises(msgspec.ValidationError):
+            msgspec.json.decode(b'{"status": "unknown"}', type=SaleUpdate)
+        with pytest.raises(msgspec.ValidationError):
+            msgspec.json.decode(b'{"discount_value": "ten"}', type=DiscountUpdate)
+
+
+class TestSaleUpdates:
+    """Test sale updates return the same shape as get_sale"""
+
+    @pytest.mark.asyncio
+    async def test_update_sale_loads_items(self, pos_session):
+        """Test the UPDATE ... RETURNING path comes back with items loaded"""
+        sale = await POSService(pos_session).update_sale(1, SaleUpdate(status="completed"))
+
+        assert "items" not in inspect(sale).unloaded
+        assert sale.status == "completed"
+        assert sale.total_amount == 11
+        assert [item.product_name for item in sale.items] == ["Coffee"]
+
+    @pytest.mark.asyncio
+    async def test_empty_update_returns_sale_with_items(self, pos_session):
+        """Test an empty patch falls back to get_sale with the same shape"""
+        sale = await POSService(pos_session).update_sale(1, SaleUpdate())
+
+        assert "items" not in inspect(sale).unloaded
+        assert sale.status == "pending"
+
+    @pytest.mark.asyncio
+    async def test_update_missing_sale_returns_none(self, pos_session):
+        """Test updating an unknown sale returns None"""
+        assert await POSService(pos_session).update_sale(99, SaleUpdate(status="completed")) is None
+
+
+class TestReadSideStructs:
+    """Test the msgspec read-side structs generated from the response models"""
+
+    def test_sale_struct_encodes_like_pydantic_model(self):
+        """Test SaleOut (with nested items) writes the same JSON as Sale"""
+        item = {
+            "product_id": "P1", "product_name": "Coffee", "quantity": 2.0, "unit_price": 3.5,
+            "id": 7, "sale_id": 1, "total_price": 7.0, "tax_amount": 0.7, "discount_amount": 0.0,
+        }
+        sale = {
+            "terminal_id": 1, "id": 1, "sale_number": "POS1", "subtotal": 7.0, "tax_amount": 0.7,
+            "discount_amount": 0.0, "total_amount": 7.7, "status": "completed",
+            "sale_date": datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc),
+        }
+
+        struct_json = msgspec.json.encode(schemas.SaleOut(**sale, items=[schemas.SaleItemOut(**item)]))
+        model_json = schemas.Sale(**sale, items=[item]).model_dump_json().encode()
+
+        assert msgspec.json.decode(struct_json) == msgspec.json.decode(model_json)
+        assert list(msgspec.json.decode(struct_json)) == list(schemas.Sale.model_fields)
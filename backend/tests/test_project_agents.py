@@ -0,0 +1,180 @@
+"""
+Project Agent Tests
+Tests for ProjectAgent response caching and report streaming
+"""
+
+import pytest
+
+from src.modules.project import agents
+from src.core.redis import CacheManager
+from src.modules.project.agents import ProjectAgent, _JSONMemberStream
+
+
+class _FakeRedis:
+    """In-memory stand-in for the redis.asyncio client used by CacheManager"""
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value):
+        self.values[key] = value
+
+    async def setex(self, key, ttl, value):
+        self.values[key] = value
+
+
+class _FakeMessage:
+    def __init__(self, content):
+        self.content = content
+
+
+class _FakeLLM:
+    """ChatOpenAI stand-in returning canned replies and counting calls"""
+
+    def __init__(self, reply='{"health": "good"}', chunks=()):
+        self.reply = reply
+        self.chunks = list(chunks)
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        return _FakeMessage(self.reply)
+
+    async def astream(self, messages):
+        self.calls += 1
+        for chunk in self.chunks:
+            yield _FakeMessage(chunk)
+
+
+def _redis_not_initialized():
+    raise RuntimeError("Redis client not initialized")
+
+
+@pytest.fixture
+def project_agent(monkeypatch):
+    """ProjectAgent with a fake LLM; Redis starts out uninitialized"""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(agents, "get_redis", _redis_not_initialized)
+    agent = ProjectAgent()
+    agent.llm = _FakeLLM()
+    return agent
+
+
+PROJECT = {"project_code": "P-1", "name": "Launch", "status": "active", "description": "dropped"}
+
+
+class TestProjectAgentCache:
+    """Test caching of parsed LLM answers"""
+
+    @pytest.mark.asyncio
+    async def test_cache_is_picked_up_once_redis_is_initialized(self, project_agent, monkeypatch):
+        """Test an agent built before Redis starts caching when Redis comes up"""
+        await project_agent.analyze_project_performance(PROJECT)
+        await project_agent.analyze_project_performance(PROJECT)
+        assert project_agent.llm.calls == 2
+
+        redis = _FakeRedis()
+        monkeypatch.setattr(agents, "get_redis", lambda: redis)
+        await project_agent.analyze_project_performance(PROJECT)
+        result = await project_agent.analyze_project_performance(PROJECT)
+
+        assert project_agent.llm.calls == 3
+        assert result == {"status": "success", "data": {"health": "good"}}
+        assert len(redis.values) == 1
+
+    @pytest.mark.asyncio
+    async def test_repeat_prompt_is_served_from_cache(self, project_agent):
+        """Test the same prompt is answered once and then read back from Redis"""
+        redis = _FakeRedis()
+        project_agent.cache = CacheManager(redis)
+
+        first = await project_agent.analyze_project_performance(PROJECT)
+        second = await project_agent.analyze_project_performance(dict(PROJECT, description="ignored"))
+        await project_agent.analyze_project_performance(dict(PROJECT, name="Relaunch"))
+
+        assert first == second == {"status": "success", "data": {"health": "good"}}
+        assert project_agent.llm.calls == 2
+        assert len(redis.values) == 2
+
+    @pytest.mark.asyncio
+    async def test_unparseable_reply_is_not_cached(self, project_agent):
+        """Test a reply that is not JSON is reported and retried next time"""
+        redis = _FakeRedis()
+        project_agent.cache = CacheManager(redis)
+        project_agent.llm.reply = '{"health": "go'
+
+        result = await project_agent.analyze_project_performance(PROJECT)
+        await project_agent.analyze_project_performance(PROJECT)
+
+        assert result["status"] == "error"
+        assert result["raw_response"] == '{"health": "go'
+        assert project_agent.llm.calls == 2
+        assert redis.values == {}
+
+
+REPORT_CHUNKS = [
+    '{"executive_summary": "On tr', 'ack, \\"mostly\\", {ok}", "key_achievements": ["a",',
+    ' "b"], "metri', 'cs": {"done": 3, "nested": [1, {"x": ","}]}', '}',
+]
+
+
+class TestJSONMemberStream:
+    """Test incremental splitting of a streamed JSON object"""
+
+    def test_members_are_returned_as_they_complete(self):
+        """Test each top-level member comes back from the fragment that ends it"""
+        stream = _JSONMemberStream()
+
+        fed = [stream.feed(chunk) for chunk in REPORT_CHUNKS]
+
+        assert fed == [
+            [],
+            [("executive_summary", 'On track, "mostly", {ok}')],
+            [("key_achievements", ["a", "b"])],
+            [],
+            [("metrics", {"done": 3, "nested": [1, {"x": ","}]})],
+        ]
+        assert stream.complete
+
+    def test_truncated_object_is_incomplete(self):
+        """Test a stream cut off mid-object is not marked complete"""
+        stream = _JSONMemberStream()
+
+        assert stream.feed('{"executive_summary": "ok", "risks": ["late"') == [("executive_summary", "ok")]
+        assert not stream.complete
+
+
+class TestProjectReportStream:
+    """Test streaming the project report section by section"""
+
+    @pytest.mark.asyncio
+    async def test_sections_are_yielded_and_cached(self, project_agent):
+        """Test each section is yielded once and a repeat is replayed from cache"""
+        redis = _FakeRedis()
+        project_agent.cache = CacheManager(redis)
+        project_agent.llm.chunks = REPORT_CHUNKS
+
+        streamed = [chunk async for chunk in project_agent.generate_project_report_stream(PROJECT, [], [])]
+        replayed = [chunk async for chunk in project_agent.generate_project_report_stream(PROJECT, [], [])]
+
+        assert [list(chunk) for chunk in streamed] == [["executive_summary"], ["key_achievements"], ["metrics"]]
+        assert replayed == streamed
+        assert project_agent.llm.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_incomplete_stream_ends_with_error(self, project_agent):
+        """Test a truncated answer yields its finished sections, then an error, and is not cached"""
+        redis = _FakeRedis()
+        project_agent.cache = CacheManager(redis)
+        project_agent.llm.chunks = ['{"executive_summary": "ok", ', '"risks": ["late"']
+
+        chunks = [chunk async for chunk in project_agent.generate_project_report_stream(PROJECT, [], [])]
+
+        assert chunks == [
+            {"executive_summary": "ok"},
+            {"status": "error", "message": "Failed to parse AI response"},
+        ]
+        assert redis.values == {}